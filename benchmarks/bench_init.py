@@ -0,0 +1,349 @@
+"""Benchmark project scaffolding and fail on regressions.
+
+Drives ProjectInitializer with the built-in structures and synthetic
+structures of thousands of files, entirely in memory and without running
+git or uv. Each timing is the best of several rounds and is compared with
+``baseline.json``; a result slower than the baseline by more than the
+tolerance fails the run. New cases add their own entries; existing
+numbers are only refreshed in a commit of their own that says why, so
+real slowdowns are not absorbed as noise.
+
+Usage:
+    uv run python benchmarks/bench_init.py
+    uv run python benchmarks/bench_init.py --update-baseline
+
+``uv run`` installs the project, so ``lazyapi`` is importable; without uv
+set ``PYTHONPATH=src``.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from fakes import RecordingCommandExecutor
+
+from lazyapi.add_feature import (
+    FeatureGenerator,
+    FeatureSpec,
+    get_feature_structure,
+)
+from lazyapi.cli import STARTUP_FORBIDDEN
+from lazyapi.init_repo_setup.init_config import (
+    CommandSpec,
+    DirectorySpec,
+    FileSpec,
+    ProjectStructure,
+)
+from lazyapi.init_repo_setup.init_initializer import ProjectInitializer
+from lazyapi.init_repo_setup.init_pack import get_pack_structure
+from lazyapi.init_repo_setup.init_scaled_structure import (
+    get_scaled_fastapi_structure,
+)
+from lazyapi.init_repo_setup.init_structure import get_fastapi_structure
+from lazyapi.services.memory_file_operations import (
+    InMemoryFileOperations,
+)
+from lazyapi.services.source_editor import ParseCache, SourceEditor
+from lazyapi.shared.content_generators import TemplateContentGenerator
+from lazyapi.shared.template_engine import compile_template
+from lazyapi.shared.template_pack import (
+    TemplatePack,
+    build_template_pack,
+)
+from lazyapi.sync_project import ProjectSynchronizer
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "baseline.json"
+PROJECT = Path("/bench") / "bench-project"
+
+# A result fails when it exceeds baseline * (1 + TOLERANCE) + SLACK_MS
+TOLERANCE = 0.5
+SLACK_MS = 2.0
+
+
+def synthetic_structure(count: int) -> ProjectStructure:
+    """Build a structure with ``count`` templated files across many packages."""
+    generator = TemplateContentGenerator(
+        '"""Module of {{ project_name }}."""\n\n\ndef handler():\n    return "ok"\n'
+    )
+    return ProjectStructure(
+        directories=[DirectorySpec(path=f"src/app/pkg{i}") for i in range(count // 50)],
+        files=[
+            FileSpec(path=f"src/app/pkg{i // 50}/module{i}.py", generator=generator)
+            for i in range(count)
+        ],
+        commands=[
+            CommandSpec(command=["git", "init"], name="git-init", depends_on=[]),
+            CommandSpec(command=["uv", "init"], name="uv-init", depends_on=[]),
+            *[
+                CommandSpec(
+                    command=["uv", "add"],
+                    name="uv-add",
+                    depends_on=["uv-init"],
+                    packages=[f"package{i}"],
+                )
+                for i in range(count // 100)
+            ],
+            CommandSpec(command=["uv", "sync"], depends_on=["uv-add"]),
+        ],
+    )
+
+
+STRUCTURES: Dict[str, Callable[[], ProjectStructure]] = {
+    "basic": get_fastapi_structure,
+    "scaled": get_scaled_fastapi_structure,
+    "synthetic-1000": lambda: synthetic_structure(1000),
+    "synthetic-5000": lambda: synthetic_structure(5000),
+}
+
+
+def best_of(rounds: int, func: Callable[[], object]) -> float:
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def bench_structure(factory: Callable[[], ProjectStructure], rounds: int) -> dict:
+    """Time render, write, command planning and a full initialize."""
+    structure = factory()
+    initializer = ProjectInitializer(
+        InMemoryFileOperations(), RecordingCommandExecutor(), structure
+    )
+    staged = initializer.render(PROJECT, "bench-project")
+
+    def full_initialize():
+        ProjectInitializer(
+            InMemoryFileOperations(), RecordingCommandExecutor(), structure
+        ).initialize(PROJECT, "bench-project")
+
+    return {
+        "render_ms": best_of(rounds, lambda: initializer.render(PROJECT, "bench")),
+        "write_ms": best_of(
+            rounds,
+            lambda: staged.flush(InMemoryFileOperations(), PROJECT, PROJECT),
+        ),
+        "plan_ms": best_of(rounds, initializer.plan),
+        "initialize_ms": best_of(rounds, full_initialize),
+    }
+
+
+RESOURCE_TEMPLATE = """from fastapi import APIRouter
+
+router = APIRouter(prefix="/{{ name | kebab }}", tags=["{{ name }}"])
+
+{% for operation in operations %}
+
+@router.{{ operation.method }}("{{ operation.path }}")
+async def {{ operation.method }}_{{ name | snake }}():
+    \"\"\"{{ operation.method | upper }} {{ name | pascal }}.\"\"\"
+{% if operation.method == "get" %}
+    return []
+{% else %}
+    return {"ok": True}
+{% endif %}
+{% endfor %}
+"""
+
+
+def bench_templates(rounds: int, count: int = 1000) -> dict:
+    """Time compiling a resource template and rendering it many times."""
+    operations = [
+        {"method": method, "path": path}
+        for method, path in [("get", "/"), ("post", "/"), ("delete", "/{id}")]
+    ]
+    contexts = [
+        {"name": f"resource_{i}", "operations": operations} for i in range(count)
+    ]
+
+    def compile_cold():
+        compile_template.cache_clear()
+        compile_template(RESOURCE_TEMPLATE)
+
+    return {
+        "compile_ms": best_of(rounds, compile_cold),
+        "render_many_ms": best_of(
+            rounds, lambda: compile_template(RESOURCE_TEMPLATE).render_many(contexts)
+        ),
+    }
+
+
+def bench_features(rounds: int, count: int = 50) -> dict:
+    """Time adding ``count`` features in one run and syncing the result."""
+    staged = ProjectInitializer(
+        InMemoryFileOperations(), RecordingCommandExecutor(), STRUCTURES["scaled"]()
+    ).render(PROJECT, "bench-project")
+    features = [
+        FeatureSpec(name=f"feature{i}", resources=["items", "reports"])
+        for i in range(count)
+    ]
+
+    def generator(project=None) -> FeatureGenerator:
+        if project is None:
+            project = InMemoryFileOperations()
+            staged.flush(project, PROJECT, PROJECT)
+        return FeatureGenerator(project, get_feature_structure(), PROJECT)
+
+    def plan_and_apply(project=None):
+        features_generator = generator(project)
+        features_generator.apply(features_generator.plan(features))
+
+    project = InMemoryFileOperations()
+    staged.flush(project, PROJECT, PROJECT)
+    plan_and_apply(project)
+    synchronizer = ProjectSynchronizer(project, RecordingCommandExecutor(), PROJECT)
+
+    return {
+        "plan_ms": best_of(rounds, lambda: generator().plan(features)),
+        "add_ms": best_of(rounds, plan_and_apply),
+        "sync_ms": best_of(rounds, synchronizer.plan),
+    }
+
+
+def bench_source_editor(rounds: int, count: int = 500) -> dict:
+    """Time queuing ``count`` router registrations into main.py at once."""
+    main = PROJECT / "src/app/main.py"
+    staged = ProjectInitializer(
+        InMemoryFileOperations(), RecordingCommandExecutor(), STRUCTURES["scaled"]()
+    ).render(PROJECT, "bench-project")
+
+    def register(cache: ParseCache):
+        editor = SourceEditor(staged, cache)
+        for i in range(count):
+            editor.add_import(main, f"src.app.services.f{i}.f{i}", "router", f"r{i}")
+            editor.add_call(main, "app", "include_router", f"r{i}")
+        editor.render()
+
+    warm = ParseCache()
+    register(warm)
+    return {
+        "cold_ms": best_of(rounds, lambda: register(ParseCache())),
+        "warm_ms": best_of(rounds, lambda: register(warm)),
+    }
+
+
+def bench_template_pack(rounds: int, count: int = 5000) -> dict:
+    """Time building a pack of ``count`` templates and rendering a layout of 3."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "pack"
+        (source / "templates").mkdir(parents=True)
+        for i in range(count):
+            (source / "templates" / f"module{i}.py").write_text(
+                f'"""Module {i} of {{{{ project_name }}}}."""\n', encoding="utf-8"
+            )
+        files = ", ".join(
+            f'{{ path = "src/app/m{i}.py", template = "templates/module{i}.py" }}'
+            for i in (0, count // 2, count - 1)
+        )
+        (source / "manifest.toml").write_text(
+            f"[layouts.service]\nfiles = [{files}]\n", encoding="utf-8"
+        )
+        output = Path(tmp) / "bench.lzpack"
+
+        def open_and_render():
+            with TemplatePack(output) as pack:
+                structure = get_pack_structure(pack)
+                ProjectInitializer(
+                    InMemoryFileOperations(), RecordingCommandExecutor(), structure
+                ).render(PROJECT, "bench-project")
+                # The manifest and the three templates, nothing else
+                assert pack.decoded == 4, pack.decoded
+
+        return {
+            "build_ms": best_of(rounds, lambda: build_template_pack(source, output)),
+            "open_render_ms": best_of(rounds, open_and_render),
+        }
+
+
+def bench_startup(rounds: int) -> dict:
+    """Time a cold import of the CLI entry point and check what it loads."""
+    src = str(ROOT.parent / "src")
+    code = "import sys, lazyapi.commands; print(' '.join(sys.modules))"
+    timings = []
+    for _ in range(rounds):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONPATH": src},
+        )
+        # Last importtime line is the top-level module: "self | cumulative | name"
+        lines = [line for line in result.stderr.splitlines() if "lazyapi" in line]
+        timings.append(int(lines[-1].split("|")[1]) / 1000)
+
+    loaded = [
+        name for name in result.stdout.split() if name.startswith(STARTUP_FORBIDDEN)
+    ]
+    if loaded:
+        raise SystemExit(f"CLI startup imports command modules: {', '.join(loaded)}")
+    return {"import_ms": min(timings)}
+
+
+def compare(results: dict, baseline: dict) -> list:
+    """Return descriptions of every metric that regressed."""
+    failures = []
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            expected = baseline.get(case, {}).get(metric)
+            if expected is None:
+                continue
+            limit = expected * (1 + TOLERANCE) + SLACK_MS
+            if value > limit:
+                failures.append(
+                    f"{case}.{metric}: {value:.2f} ms > {limit:.2f} ms "
+                    f"(baseline {expected:.2f} ms)"
+                )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {
+        name: bench_structure(factory, args.rounds)
+        for name, factory in STRUCTURES.items()
+    }
+    results["template-1000"] = bench_templates(args.rounds)
+    results["features-50"] = bench_features(args.rounds)
+    results["edit-500"] = bench_source_editor(args.rounds)
+    results["pack-5000"] = bench_template_pack(args.rounds)
+    results["startup"] = bench_startup(args.rounds)
+
+    print(f"{'case':<16} {'metric':<14} {'ms':>10}")
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            print(f"{case:<16} {metric:<14} {value:>10.2f}")
+
+    if args.update_baseline:
+        rounded = {
+            case: {metric: round(value, 3) for metric, value in metrics.items()}
+            for case, metrics in results.items()
+        }
+        BASELINE.write_text(json.dumps(rounded, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {BASELINE}")
+        return 0
+
+    if not BASELINE.exists():
+        print("\nNo baseline found; run with --update-baseline first")
+        return 0
+
+    failures = compare(results, json.loads(BASELINE.read_text(encoding="utf-8")))
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""Offline fakes used to benchmark LazyAPI without git or uv."""
+
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from lazyapi.shared.interfaces import ICommandExecutor
+
+
+class RecordingCommandExecutor(ICommandExecutor):
+    """Command executor that records commands instead of running them."""
+
+    def __init__(self):
+        """Initialize an empty command log."""
+        self._lock = threading.Lock()
+        self.commands: List[Tuple[List[str], Optional[Path]]] = []
+
+    def execute(self, command: List[str], cwd: Optional[Path] = None) -> None:
+        """Record the command and its working directory."""
+        with self._lock:
+            self.commands.append((list(command), cwd))
@@ -0,0 +1,18 @@
+"""Add-feature feature for LazyAPI."""
+
+from .feature_config import FeatureSpec, FeaturePlan
+from .feature_generator import FeatureGenerator
+from .feature_manifest import load_manifest, parse_manifest
+from .feature_structure import get_feature_structure
+from .feature_validators import ComponentNameValidator, FeatureProjectValidator
+
+__all__ = [
+    "FeatureSpec",
+    "FeaturePlan",
+    "FeatureGenerator",
+    "load_manifest",
+    "parse_manifest",
+    "get_feature_structure",
+    "ComponentNameValidator",
+    "FeatureProjectValidator",
+]
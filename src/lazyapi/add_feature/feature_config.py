@@ -0,0 +1,94 @@
+"""Configuration for feature and resource generation."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from ..shared.interfaces import IContentGenerator
+
+
+@dataclass
+class FeatureFileSpec:
+    """
+    Specification for a file generated per feature or per resource.
+
+    ``path`` is relative to the feature package and may use template slots,
+    e.g. ``routers/{{ resource.name }}.py``.
+    """
+
+    path: str
+    generator: IContentGenerator
+
+
+@dataclass
+class SettingSpec:
+    """A field added to the project's ``Settings`` class."""
+
+    name: str
+    annotation: str
+    default: str
+
+
+@dataclass
+class ShutdownSpec:
+    """An async function the application lifespan awaits on shutdown."""
+
+    module: str
+    function: str
+
+
+@dataclass
+class FeatureOption:
+    """
+    Optional capability of generated features, such as caching.
+
+    Templates see whether a feature uses the option as ``feature.<name>``.
+    ``files`` are shared by all features using the option; they are
+    rendered once, together with the ``settings`` fields, when the first
+    such feature is added. ``resource_files`` are rendered for every
+    resource of those features. Both paths are relative to the project root.
+    ``feature_files`` are rendered into the package of every such feature,
+    like the structure's own feature files. ``settings_comment`` heads the
+    block of ``settings`` fields. ``shutdown`` functions are awaited by the
+    lifespan in ``main.py`` after the application stops.
+    """
+
+    files: List[FeatureFileSpec] = field(default_factory=list)
+    feature_files: List[FeatureFileSpec] = field(default_factory=list)
+    resource_files: List[FeatureFileSpec] = field(default_factory=list)
+    settings: List[SettingSpec] = field(default_factory=list)
+    settings_comment: Optional[str] = None
+    shutdown: List[ShutdownSpec] = field(default_factory=list)
+
+
+@dataclass
+class FeatureStructure:
+    """Files making up a feature package, and the options features may use."""
+
+    feature_files: List[FeatureFileSpec]
+    resource_files: List[FeatureFileSpec]
+    options: Dict[str, FeatureOption] = field(default_factory=dict)
+
+
+@dataclass
+class FeatureSpec:
+    """
+    Request to generate a feature or extend an existing one.
+
+    With ``extend`` the feature must already exist and only its resources
+    are generated; otherwise the feature must be new. ``options`` name the
+    ``FeatureStructure.options`` the feature uses; extended features keep
+    the options they were created with.
+    """
+
+    name: str
+    resources: List[str] = field(default_factory=list)
+    extend: bool = False
+    options: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FeaturePlan:
+    """All changes of a feature generation run, computed in memory."""
+
+    files: Dict[Path, str] = field(default_factory=dict)
+    edits: Dict[Path, str] = field(default_factory=dict)
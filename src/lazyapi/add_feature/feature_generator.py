@@ -0,0 +1,366 @@
+"""Feature implementation: Add features and resources to a project."""
+
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from ..shared.interfaces import IFileOperations, WriteStats
+from ..shared.exceptions import LazyAPIError, ValidationError
+from ..shared.project_index import INDEX_PATH, ProjectIndex
+from ..shared.template_engine import render_template
+from ..services.source_editor import SourceEditor
+from .feature_config import FeatureFileSpec, FeaturePlan, FeatureSpec, FeatureStructure
+from .feature_validators import (
+    ComponentNameValidator,
+    CONFIG_MODULE,
+    MAIN_MODULE,
+    SERVICES_DIR,
+)
+
+
+class FeatureGenerator:
+    """
+    Add features and resources to an existing feature-based project.
+
+    Any number of features is planned and rendered in memory first; router
+    registrations are queued on a source editor, so the entry point is
+    parsed and rewritten once per run rather than once per feature, and
+    nothing is written when planning fails. Existing features and resources
+    are looked up in the project index, a single file read; projects
+    without an index get one built from their feature packages.
+
+    Features may use the options of the structure, which are recorded in
+    the index. The project files and settings an option needs are added
+    with the first feature using it.
+    """
+
+    def __init__(
+        self,
+        file_ops: IFileOperations,
+        structure: FeatureStructure,
+        project_path: Path,
+    ):
+        """
+        Initialize with dependencies.
+
+        Args:
+            file_ops: File operations service
+            structure: Feature package structure
+            project_path: Root of the project to extend
+        """
+        self._file_ops = file_ops
+        self._structure = structure
+        self._project_path = project_path
+        self.write_stats: Optional[WriteStats] = None
+
+    def plan(
+        self, features: List[FeatureSpec], enable: Sequence[str] = ()
+    ) -> FeaturePlan:
+        """
+        Render all features and compute the edits of existing modules.
+
+        Args:
+            features: Features to create or extend
+            enable: Options to enable for every feature of the project,
+                including the existing ones
+
+        Returns:
+            New files and edited modules, keyed by absolute path
+
+        Raises:
+            ValidationError: If a name or option is invalid or a component
+                exists
+            LazyAPIError: If an existing module cannot be edited
+        """
+        self._validate_names(features)
+        self._validate_options(features, enable)
+        services = self._project_path / SERVICES_DIR
+        plan = FeaturePlan()
+        editor = SourceEditor(self._file_ops)
+        index = ProjectIndex.load(self._file_ops, self._project_path)
+        index_exists = index is not None
+        if index is None:
+            index = self._discover()
+        added_options = set()
+
+        for name in enable:
+            if name in index.project_feature_options:
+                raise ValidationError(f"Option '{name}' is already enabled")
+            index.project_feature_options.append(name)
+            added_options.add(name)
+            self._add_option(name, editor, plan, index)
+            for feature in index.features:
+                options = index.feature_options(feature)
+                if name in options:
+                    continue
+                index.add_feature(feature, _router_module(feature), [*options, name])
+                resources = index.resources(feature)
+                context = self._context(feature, resources, [*options, name])
+                self._render(
+                    self._structure.options[name].feature_files,
+                    f"{SERVICES_DIR.as_posix()}/{feature}/",
+                    context,
+                    plan,
+                    index,
+                )
+                for resource in resources:
+                    self._render(
+                        self._structure.options[name].resource_files,
+                        "",
+                        {**context, "resource": {"name": resource}},
+                        plan,
+                        index,
+                    )
+
+        for spec in features:
+            feature_dir = services / spec.name
+            exists = index.has_feature(spec.name)
+            if spec.extend and not exists:
+                raise ValidationError(f"Feature '{spec.name}' does not exist")
+            if not spec.extend and exists:
+                raise ValidationError(f"Feature '{spec.name}' already exists")
+            clashes = set(spec.resources).intersection(index.resources(spec.name))
+            if clashes:
+                raise ValidationError(
+                    f"Feature '{spec.name}' already has resource(s): "
+                    f"{', '.join(sorted(clashes))}"
+                )
+
+            # Extended features keep the options they were created with
+            requested = (
+                index.feature_options(spec.name) if spec.extend else spec.options
+            )
+            options = sorted({*requested, *index.project_feature_options})
+            context = self._context(spec.name, spec.resources, options)
+            for name in options:
+                if name not in added_options:
+                    added_options.add(name)
+                    self._add_option(name, editor, plan, index)
+            prefix = f"{SERVICES_DIR.as_posix()}/{spec.name}/"
+            if spec.extend:
+                module = feature_dir / f"{spec.name}.py"
+                for resource in spec.resources:
+                    self._register(editor, module, "router", f".routers.{resource}")
+            else:
+                index.add_feature(spec.name, _router_module(spec.name), options)
+                self._render(
+                    self._structure.feature_files, prefix, context, plan, index
+                )
+                for name in options:
+                    self._render(
+                        self._structure.options[name].feature_files,
+                        prefix,
+                        context,
+                        plan,
+                        index,
+                    )
+                self._register(
+                    editor,
+                    self._project_path / MAIN_MODULE,
+                    "app",
+                    _router_module(spec.name),
+                )
+            for resource in spec.resources:
+                index.add_resource(
+                    spec.name, resource, _router_module(spec.name, resource)
+                )
+                resource_context = {**context, "resource": {"name": resource}}
+                self._render(
+                    self._structure.resource_files,
+                    prefix,
+                    resource_context,
+                    plan,
+                    index,
+                )
+                for name in options:
+                    self._render(
+                        self._structure.options[name].resource_files,
+                        "",
+                        resource_context,
+                        plan,
+                        index,
+                    )
+
+        # All router registrations are applied in one pass per module
+        plan.edits.update(editor.render())
+        for path, content in plan.edits.items():
+            index.record_file(path.relative_to(self._project_path).as_posix(), content)
+
+        target = plan.edits if index_exists else plan.files
+        target[self._project_path / INDEX_PATH] = index.to_json()
+        return plan
+
+    def apply(self, plan: FeaturePlan) -> None:
+        """
+        Write a plan to disk.
+
+        New files are written in one batch to a staging directory inside
+        the project and renamed into place; edited modules are rewritten
+        last, so the entry point never references missing modules.
+
+        Args:
+            plan: Plan returned by ``plan``
+
+        Raises:
+            LazyAPIError: If writing fails
+        """
+        staging = self._project_path / f".lazyapi-staging-{uuid.uuid4().hex}"
+        try:
+            self.write_stats = self._file_ops.write_files(
+                {
+                    staging / path.relative_to(self._project_path): content
+                    for path, content in plan.files.items()
+                }
+            )
+            for path in self._move_roots(plan.files):
+                relative = path.relative_to(self._project_path)
+                self._file_ops.move(staging / relative, path)
+            self._file_ops.write_files(plan.edits)
+        except Exception as e:
+            raise LazyAPIError(f"Failed to add features: {e}") from e
+        finally:
+            self._file_ops.remove_directory(staging)
+
+    @staticmethod
+    def _register(editor: SourceEditor, path: Path, target: str, module: str) -> None:
+        """Queue the import and inclusion of ``module.router`` into ``target``."""
+        alias = f"{module.rsplit('.', 1)[-1]}_router"
+        editor.add_import(path, module, "router", alias)
+        editor.add_call(path, target, "include_router", alias)
+
+    def _add_option(
+        self,
+        name: str,
+        editor: SourceEditor,
+        plan: FeaturePlan,
+        index: ProjectIndex,
+    ) -> None:
+        """Render the project files of an option and queue its wiring."""
+        option = self._structure.options[name]
+        context = {"project_name": self._project_path.name}
+        for file_spec in option.files:
+            relative = render_template(file_spec.path, context)
+            path = self._project_path / relative
+            # Shared with earlier features; never overwrite local changes
+            if path in plan.files or self._file_ops.file_exists(path):
+                continue
+            content = file_spec.generator.generate(context)
+            plan.files[path] = content
+            index.record_file(relative, content, file_spec.generator)
+        main = self._project_path / MAIN_MODULE
+        for hook in option.shutdown:
+            editor.add_import(main, hook.module, hook.function)
+            editor.add_shutdown(main, "lifespan", f"await {hook.function}()")
+        for i, setting in enumerate(option.settings):
+            editor.add_field(
+                self._project_path / CONFIG_MODULE,
+                "Settings",
+                setting.name,
+                setting.annotation,
+                setting.default,
+                comment=option.settings_comment if i == 0 else None,
+            )
+
+    def _context(
+        self, feature: str, resources: List[str], options: List[str]
+    ) -> Dict[str, Any]:
+        """Template variables of a feature."""
+        return {
+            "project_name": self._project_path.name,
+            "feature": {
+                "name": feature,
+                "resources": resources,
+                **{name: name in options for name in self._structure.options},
+            },
+        }
+
+    def _render(
+        self,
+        files: List[FeatureFileSpec],
+        prefix: str,
+        context: Dict[str, Any],
+        plan: FeaturePlan,
+        index: ProjectIndex,
+    ) -> None:
+        """Render file specs below a directory prefix into the plan."""
+        # Relative paths are built as strings; pathlib dominated planning
+        for file_spec in files:
+            relative = prefix + render_template(file_spec.path, context)
+            path = self._project_path / relative
+            if path in plan.files:
+                raise ValidationError(f"Duplicate file {relative} in request")
+            content = file_spec.generator.generate(context)
+            plan.files[path] = content
+            index.record_file(relative, content, file_spec.generator)
+
+    def _discover(self) -> ProjectIndex:
+        """Build an index for a project created before indexes existed."""
+        index = ProjectIndex(project_name=self._project_path.name, layout="scaled")
+        services = self._project_path / SERVICES_DIR
+        for name in self._file_ops.list_directory(services):
+            if not self._file_ops.file_exists(services / name / f"{name}.py"):
+                continue
+            index.add_feature(name, _router_module(name))
+            routers = services / name / "routers"
+            if not self._file_ops.directory_exists(routers):
+                continue
+            for entry in self._file_ops.list_directory(routers):
+                if entry.endswith(".py") and entry != "__init__.py":
+                    resource = entry[: -len(".py")]
+                    index.add_resource(name, resource, _router_module(name, resource))
+        return index
+
+    def _move_roots(self, files: Dict[Path, str]) -> List[Path]:
+        """Find the outermost new paths, which are renamed as a whole."""
+        roots: List[Path] = []
+        known_missing = set()
+        for path in files:
+            relative = path.relative_to(self._project_path)
+            candidate = self._project_path
+            for part in relative.parts:
+                candidate = candidate / part
+                if candidate in known_missing:
+                    break
+                if candidate == path or not self._file_ops.directory_exists(candidate):
+                    known_missing.add(candidate)
+                    roots.append(candidate)
+                    break
+        return roots
+
+    @staticmethod
+    def _validate_names(features: List[FeatureSpec]) -> None:
+        """Validate feature and resource names and reject duplicates."""
+        validator = ComponentNameValidator()
+        seen = set()
+        for spec in features:
+            if spec.name in seen:
+                raise ValidationError(f"Feature '{spec.name}' requested twice")
+            seen.add(spec.name)
+            if len(set(spec.resources)) != len(spec.resources):
+                raise ValidationError(
+                    f"Feature '{spec.name}' lists a resource more than once"
+                )
+            for name in [spec.name, *spec.resources]:
+                if not validator.validate(name):
+                    raise ValidationError(validator.get_error_message())
+
+    def _validate_options(
+        self, features: List[FeatureSpec], enable: Sequence[str]
+    ) -> None:
+        """Reject options the structure does not define."""
+        requested = [(f"Feature '{spec.name}'", spec.options) for spec in features]
+        requested.append(("Project", list(enable)))
+        for owner, options in requested:
+            unknown = set(options) - self._structure.options.keys()
+            if unknown:
+                raise ValidationError(
+                    f"{owner} uses unknown option(s): "
+                    f"{', '.join(sorted(unknown))} "
+                    f"(available: {', '.join(sorted(self._structure.options))})"
+                )
+
+
+def _router_module(feature: str, resource: Optional[str] = None) -> str:
+    """Module exporting the router of a feature or one of its resources."""
+    if resource is None:
+        return f"src.app.services.{feature}.{feature}"
+    return f"src.app.services.{feature}.routers.{resource}"
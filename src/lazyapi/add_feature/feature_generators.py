@@ -0,0 +1,1695 @@
+"""FastAPI-specific content generators for the add-feature feature."""
+
+from ..shared.content_generators import (
+    StaticContentGenerator,
+    TemplateContentGenerator,
+)
+
+
+class FeatureModuleGenerator(TemplateContentGenerator):
+    """Generate the feature module that combines all resource routers."""
+
+    def __init__(self):
+        super().__init__('''"""{{ feature.name | pascal }} feature."""
+
+from fastapi import APIRouter
+
+{% for resource in feature.resources | sort %}
+from .routers.{{ resource }} import router as {{ resource }}_router
+{% endfor %}
+
+router = APIRouter(prefix="/{{ feature.name | kebab }}", tags=["{{ feature.name }}"])
+{% for resource in feature.resources %}
+router.include_router({{ resource }}_router)
+{% endfor %}
+''')
+
+
+class ResourceModelsGenerator(TemplateContentGenerator):
+    """Generate the Pydantic models of a resource."""
+
+    def __init__(self):
+        super().__init__('''"""{{ resource.name | pascal }} data models."""
+
+from pydantic import BaseModel
+
+
+class {{ resource.name | pascal }}Base(BaseModel):
+    """Fields shared by all {{ resource.name }} models."""
+
+    name: str
+
+
+class {{ resource.name | pascal }}Create({{ resource.name | pascal }}Base):
+    """Payload for creating a {{ resource.name }}."""
+
+
+class {{ resource.name | pascal }}({{ resource.name | pascal }}Base):
+    """A stored {{ resource.name }}."""
+
+    id: int
+''')
+
+
+class ResourceServiceGenerator(TemplateContentGenerator):
+    """Generate the service layer of a resource."""
+
+    def __init__(self):
+        super().__init__('''"""{{ resource.name | pascal }} service layer."""
+
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+{% if feature.http %}
+import httpx
+from fastapi import Depends
+
+{% endif %}
+{% if feature.cache %}
+from src.app.shared.cache import cache
+{% endif %}
+{% if feature.http %}
+from src.app.shared.http_client import get_http_client
+{% endif %}
+from src.app.shared.pagination import DEFAULT_LIMIT, Page
+
+from ..models.{{ resource.name }} import {{ resource.name | pascal }}, {{ resource.name | pascal }}Create
+{% if feature.jobs %}
+from ..tasks import item_created
+{% endif %}
+{% if feature.cache %}
+
+# Cached responses of this resource; invalidated by every write
+CACHE_NAMESPACE = "{{ feature.name }}.{{ resource.name }}"
+{% endif %}
+
+
+class {{ resource.name | pascal }}Service:
+    """Business logic for {{ resource.name }} items."""
+
+    def __init__(self):
+        self._items: Dict[int, {{ resource.name | pascal }}] = {}
+        # Ids in ascending order, so a page starts with a binary search
+        self._ids: List[int] = []
+        self._next_id = 1
+{% if feature.http %}
+        # Pooled client for calls to other services, set by the dependency
+        self.http: Optional[httpx.AsyncClient] = None
+{% endif %}
+
+    def list(
+        self,
+        after: Optional[Tuple[int]] = None,
+        limit: int = DEFAULT_LIMIT,
+        count: bool = False,
+    ) -> Page[{{ resource.name | pascal }}]:
+        """Return the page of items following the key ``after``, in id order."""
+        start = bisect.bisect_right(self._ids, after[0]) if after else 0
+        ids = self._ids[start : start + limit + 1]
+        items = [self._items[item_id] for item_id in ids]
+        return Page[{{ resource.name | pascal }}].of(
+            items,
+            limit,
+            key=lambda item: (item.id,),
+            total_estimate=len(self._items) if count else None,
+        )
+
+    def get(self, item_id: int) -> Optional[{{ resource.name | pascal }}]:
+        """Return one item, or None if it does not exist."""
+        return self._items.get(item_id)
+
+{% if feature.cache or feature.jobs %}
+    async def create(self, data: {{ resource.name | pascal }}Create) -> {{ resource.name | pascal }}:
+{% if feature.cache and feature.jobs %}
+        """Store a new item, invalidate cached responses and queue follow-up work."""
+{% elif feature.cache %}
+        """Store a new item and invalidate cached responses."""
+{% else %}
+        """Store a new item and queue follow-up work."""
+{% endif %}
+        item = {{ resource.name | pascal }}(id=self._next_id, **data.model_dump())
+        self._items[item.id] = item
+        self._ids.append(item.id)
+        self._next_id += 1
+{% if feature.cache %}
+        await cache.invalidate(CACHE_NAMESPACE)
+{% endif %}
+{% if feature.jobs %}
+        await item_created.enqueue({"resource": "{{ resource.name }}", "id": item.id})
+{% endif %}
+        return item
+{% else %}
+    def create(self, data: {{ resource.name | pascal }}Create) -> {{ resource.name | pascal }}:
+        """Store a new item."""
+        item = {{ resource.name | pascal }}(id=self._next_id, **data.model_dump())
+        self._items[item.id] = item
+        self._ids.append(item.id)
+        self._next_id += 1
+        return item
+{% endif %}
+
+{% if feature.cache %}
+    async def delete(self, item_id: int) -> bool:
+        """Delete an item, returning whether it existed."""
+        if self._items.pop(item_id, None) is None:
+            return False
+        del self._ids[bisect.bisect_left(self._ids, item_id)]
+        await cache.invalidate(CACHE_NAMESPACE)
+        return True
+{% else %}
+    def delete(self, item_id: int) -> bool:
+        """Delete an item, returning whether it existed."""
+        if self._items.pop(item_id, None) is None:
+            return False
+        del self._ids[bisect.bisect_left(self._ids, item_id)]
+        return True
+{% endif %}
+
+
+{{ resource.name }}_service = {{ resource.name | pascal }}Service()
+
+
+{% if feature.http %}
+def get_{{ resource.name }}_service(
+    http: httpx.AsyncClient = Depends(get_http_client),
+) -> {{ resource.name | pascal }}Service:
+    """Provide the {{ resource.name }} service with the pooled HTTP client."""
+    # The client is shared by the process, so this only changes it when
+    # tests override get_http_client
+    {{ resource.name }}_service.http = http
+    return {{ resource.name }}_service
+{% else %}
+def get_{{ resource.name }}_service() -> {{ resource.name | pascal }}Service:
+    """Provide the {{ resource.name }} service as a dependency."""
+    return {{ resource.name }}_service
+{% endif %}
+''')
+
+
+class ResourceRouterGenerator(TemplateContentGenerator):
+    """Generate the router of a resource."""
+
+    def __init__(self):
+        super().__init__('''"""{{ resource.name | pascal }} routes."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+{% if feature.cache %}
+from src.app.shared.cache import cached
+{% endif %}
+from src.app.shared.pagination import (
+    DEFAULT_LIMIT,
+    Count,
+    Cursor,
+    Limit,
+    Page,
+    decode_cursor,
+)
+
+from ..models.{{ resource.name }} import {{ resource.name | pascal }}, {{ resource.name | pascal }}Create
+{% if feature.cache %}
+from ..services.{{ resource.name }} import CACHE_NAMESPACE, {{ resource.name | pascal }}Service, get_{{ resource.name }}_service
+{% else %}
+from ..services.{{ resource.name }} import {{ resource.name | pascal }}Service, get_{{ resource.name }}_service
+{% endif %}
+
+{% if resource.name == feature.name %}
+router = APIRouter()
+{% else %}
+router = APIRouter(prefix="/{{ resource.name | kebab }}")
+{% endif %}
+
+
+@router.get("/", response_model=Page[{{ resource.name | pascal }}])
+{% if feature.cache %}
+@cached(CACHE_NAMESPACE)
+{% endif %}
+async def list_{{ resource.name }}(
+    cursor: Cursor = None,
+    limit: Limit = DEFAULT_LIMIT,
+    count: Count = False,
+    service: {{ resource.name | pascal }}Service = Depends(get_{{ resource.name }}_service),
+):
+    """List {{ resource.name }} items, one page at a time."""
+    return service.list(decode_cursor(cursor, int), limit, count)
+
+
+@router.get("/{item_id}", response_model={{ resource.name | pascal }})
+{% if feature.cache %}
+@cached(CACHE_NAMESPACE)
+{% endif %}
+async def get_{{ resource.name }}(
+    item_id: int,
+    service: {{ resource.name | pascal }}Service = Depends(get_{{ resource.name }}_service),
+):
+    """Get a {{ resource.name }} by id."""
+    item = service.get(item_id)
+    if item is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "{{ resource.name | pascal }} not found")
+    return item
+
+
+@router.post("/", response_model={{ resource.name | pascal }}, status_code=status.HTTP_201_CREATED)
+async def create_{{ resource.name }}(
+    data: {{ resource.name | pascal }}Create,
+    service: {{ resource.name | pascal }}Service = Depends(get_{{ resource.name }}_service),
+):
+    """Create a {{ resource.name }}."""
+{% if feature.cache or feature.jobs %}
+    return await service.create(data)
+{% else %}
+    return service.create(data)
+{% endif %}
+
+
+@router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_{{ resource.name }}(
+    item_id: int,
+    service: {{ resource.name | pascal }}Service = Depends(get_{{ resource.name }}_service),
+) -> None:
+    """Delete a {{ resource.name }}."""
+{% if feature.cache %}
+    if not await service.delete(item_id):
+{% else %}
+    if not service.delete(item_id):
+{% endif %}
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "{{ resource.name | pascal }} not found")
+''')
+
+
+class CacheModuleGenerator(StaticContentGenerator):
+    """Generate the response cache shared by features created with caching."""
+
+    def __init__(self):
+        super().__init__('''"""Response cache for feature routers.
+
+Entries live in a pluggable backend: an in-process TTL and LRU cache by
+default, or Redis when ``CACHE_URL`` is set. Routes opt in with the
+``cached`` decorator and services invalidate a namespace after writing::
+
+    @router.get("/{item_id}", response_model=Order)
+    @cached(CACHE_NAMESPACE)
+    async def get_order(item_id: int, service=Depends(get_order_service)):
+        ...
+
+    await cache.invalidate(CACHE_NAMESPACE)
+
+Invalidation bumps a per-namespace generation that is part of every key,
+so stale entries are never read again and simply expire. Values are
+stored JSON-encoded, so every backend returns the same data.
+"""
+
+import functools
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+from src.app.config import settings
+
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+class CacheBackend(ABC):
+    """Storage of cache entries and namespace generations."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a value, or None if it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        """Store a JSON-compatible value for ``ttl`` seconds (None: no expiry)."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Increment a counter, starting from 0, and return its new value."""
+
+
+class MemoryBackend(CacheBackend):
+    """
+    In-process cache with per-entry expiry and least-recently-used eviction.
+
+    Each worker process has its own copy, so invalidation only reaches the
+    process that performed it; use Redis when running several workers.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        # Kept apart from entries, so eviction never resets a generation
+        self._counters: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        if key in self._counters:
+            return self._counters[key]
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._counters.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+class RedisBackend(CacheBackend):
+    """
+    Cache stored in Redis, shared by all workers and instances.
+
+    Works with any client implementing the ``get``, ``set``, ``delete`` and
+    ``incr`` coroutines of ``redis.asyncio.Redis``, such as ``InMemoryRedis``.
+    """
+
+    def __init__(self, client: Any, prefix: str = "cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self.client.get(self.prefix + key)
+        return None if data is None else json.loads(data)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        await self.client.set(
+            self.prefix + key,
+            json.dumps(value, separators=(",", ":")),
+            px=None if ttl is None else max(1, int(ttl * 1000)),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(self.prefix + key)
+
+
+class InMemoryRedis:
+    """In-memory stand-in for the ``redis.asyncio.Redis`` calls RedisBackend makes."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+
+    async def get(self, name: str) -> Optional[bytes]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._data[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: Any, px: Optional[int] = None) -> bool:
+        expires = None if px is None else time.monotonic() + px / 1000
+        data = value if isinstance(value, bytes) else str(value).encode()
+        self._data[name] = (expires, data)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._data.pop(name, None) is not None for name in names)
+
+    async def incr(self, name: str) -> int:
+        value = int(await self.get(name) or 0) + 1
+        expires = self._data.get(name, (None, b""))[0]
+        self._data[name] = (expires, str(value).encode())
+        return value
+
+
+class Cache:
+    """Namespaced cache on top of a backend."""
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Entry storage
+            ttl: Default lifetime of entries in seconds (None: until evicted)
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+    async def key(self, namespace: str, key: str) -> str:
+        """Return the backend key of an entry in the current namespace generation."""
+        generation = await self.backend.get(f"{namespace}:generation") or 0
+        return f"{namespace}:{generation}:{key}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None."""
+        return await self.backend.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a JSON-compatible value; ``ttl`` overrides the default."""
+        await self.backend.set(key, value, self.ttl if ttl is None else ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        """Make every entry of a namespace unreachable."""
+        await self.backend.incr(f"{namespace}:generation")
+
+
+def _default_backend() -> CacheBackend:
+    """Build the backend selected by the settings."""
+    if settings.cache_url:
+        from redis.asyncio import Redis
+
+        return RedisBackend(Redis.from_url(settings.cache_url))
+    return MemoryBackend(settings.cache_max_entries)
+
+
+cache = Cache(_default_backend(), settings.cache_ttl)
+
+
+def configure_cache(backend: CacheBackend, ttl: Optional[float] = None) -> None:
+    """Replace the backend of the shared cache, e.g. in tests."""
+    cache.backend = backend
+    if ttl is not None:
+        cache.ttl = ttl
+
+
+def request_key(arguments: Dict[str, Any]) -> str:
+    """
+    Derive a cache key from the arguments of a route.
+
+    Path and query parameters are plain values and make up the key;
+    dependencies such as services and sessions are ignored.
+    """
+    parts = []
+    for name, value in sorted(arguments.items()):
+        if isinstance(value, (list, tuple)) and all(
+            isinstance(item, _KEY_TYPES) for item in value
+        ):
+            value = list(value)
+        elif not isinstance(value, _KEY_TYPES):
+            continue
+        parts.append(f"{name}={json.dumps(value)}")
+    return "&".join(parts)
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[float] = None,
+    key: Callable[[Dict[str, Any]], str] = request_key,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the responses of an async route.
+
+    Apply below the router decorator. Errors and ``Response`` objects are
+    not cached.
+
+    Args:
+        namespace: Namespace invalidated by the service owning the data
+        ttl: Lifetime of entries; defaults to ``settings.cache_ttl``
+        key: Derives the key from the route's keyword arguments
+    """
+
+    def decorator(
+        route: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        name = f"{route.__module__}.{route.__qualname__}"
+
+        @functools.wraps(route)
+        async def wrapper(**arguments: Any) -> Any:
+            # Keyed by the generation before the call: a result computed
+            # while the namespace is invalidated is never read
+            entry = await cache.key(namespace, f"{name}:{key(arguments)}")
+            value = await cache.get(entry)
+            if value is not None:
+                return value
+            result = await route(**arguments)
+            if not isinstance(result, Response):
+                await cache.set(entry, jsonable_encoder(result), ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+''')
+
+
+class JobsModuleGenerator(StaticContentGenerator):
+    """Generate the shared background job module."""
+
+    def __init__(self):
+        super().__init__('''"""Background jobs, run outside the request path by a worker process.
+
+A route enqueues a job and returns at once, and ``python -m src.app.worker``
+runs it. Jobs are kept by a broker, so neither a restart of the API nor a
+worker shutdown loses them::
+
+    @task("orders.send_receipt", retries=5)
+    async def send_receipt(payload: Dict[str, Any]) -> None:
+        ...
+
+    await send_receipt.enqueue({"order_id": order.id})
+
+``JOBS_URL`` selects the broker. ``sqlite:///./jobs.db``, the default,
+keeps jobs in a SQLite file shared by the API and worker processes.
+``memory://`` keeps them in the process, for tests. Other backends
+implement ``Broker``.
+
+Workers reserve jobs in batches of up to ``JOBS_BATCH_SIZE`` and run at
+most ``JOBS_CONCURRENCY`` at once. A job that is neither finished nor
+released within ``JOBS_VISIBILITY_TIMEOUT`` seconds is delivered again,
+because its worker died, so handlers must be idempotent. Failed jobs are
+retried with exponential backoff until the task's retries are used up.
+Then they are kept as dead jobs for inspection.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from src.app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class Job:
+    """A unit of work for a task."""
+
+    task: str
+    payload: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    # Deliveries so far, including the current one
+    attempts: int = 0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how late a failed job is tried again."""
+
+    retries: int
+    backoff: float
+    backoff_max: float = 3600.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds before the attempt following ``attempt``, with full jitter."""
+        limit = min(self.backoff * 2 ** (attempt - 1), self.backoff_max)
+        return random.uniform(0, limit)
+
+
+class Broker(ABC):
+    """Storage of pending jobs."""
+
+    @abstractmethod
+    async def enqueue(self, jobs: Sequence[Job], delay: float = 0.0) -> None:
+        """Store jobs, runnable after ``delay`` seconds."""
+
+    @abstractmethod
+    async def reserve(self, limit: int, visibility: float) -> List[Job]:
+        """
+        Hand out up to ``limit`` runnable jobs, oldest first.
+
+        Each job's ``attempts`` is incremented. A reserved job is handed out
+        again if it is not acked, retried or failed within ``visibility``
+        seconds.
+        """
+
+    @abstractmethod
+    async def ack(self, job: Job) -> None:
+        """Remove a finished job."""
+
+    @abstractmethod
+    async def retry(self, job: Job, delay: float) -> None:
+        """Make a reserved job runnable again after ``delay`` seconds."""
+
+    @abstractmethod
+    async def fail(self, job: Job, error: str) -> None:
+        """Keep a job that will not be retried as dead."""
+
+    async def close(self) -> None:
+        """Release the broker's resources."""
+
+
+class MemoryBroker(Broker):
+    """Jobs of this process only; for tests and single-process development."""
+
+    def __init__(self):
+        self.dead: Dict[str, Tuple[Job, str]] = {}
+        self._jobs: Dict[str, Tuple[Job, float]] = {}
+        # (runnable at, sequence, id); entries left by earlier states are skipped
+        self._queue: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    async def enqueue(self, jobs: Sequence[Job], delay: float = 0.0) -> None:
+        for job in jobs:
+            # Copied through JSON, like any broker that stores jobs
+            payload = json.loads(json.dumps(job.payload))
+            job = Job(job.task, payload, job.id, job.attempts)
+            self._schedule(job, time.monotonic() + delay)
+
+    async def reserve(self, limit: int, visibility: float) -> List[Job]:
+        now = time.monotonic()
+        reserved: List[Job] = []
+        while self._queue and len(reserved) < limit and self._queue[0][0] <= now:
+            ready_at, _, job_id = heapq.heappop(self._queue)
+            entry = self._jobs.get(job_id)
+            if entry is None or entry[1] != ready_at:
+                continue
+            job = entry[0]
+            job.attempts += 1
+            self._schedule(job, now + visibility)
+            reserved.append(Job(job.task, job.payload, job.id, job.attempts))
+        return reserved
+
+    async def ack(self, job: Job) -> None:
+        self._jobs.pop(job.id, None)
+
+    async def retry(self, job: Job, delay: float) -> None:
+        if job.id in self._jobs:
+            self._schedule(self._jobs[job.id][0], time.monotonic() + delay)
+
+    async def fail(self, job: Job, error: str) -> None:
+        entry = self._jobs.pop(job.id, None)
+        if entry is not None:
+            self.dead[job.id] = (entry[0], error)
+
+    def _schedule(self, job: Job, ready_at: float) -> None:
+        self._jobs[job.id] = (job, ready_at)
+        self._sequence += 1
+        heapq.heappush(self._queue, (ready_at, self._sequence, job.id))
+
+
+class SQLiteBroker(Broker):
+    """
+    Jobs in a SQLite file, shared by every process on the machine.
+
+    Queries run in a thread, so the event loop never waits for the disk.
+    A reservation is one write transaction, so two workers never reserve
+    the same job.
+    """
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._lock = threading.Lock()
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                task TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                ready_at REAL NOT NULL,
+                dead INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS ix_jobs_ready ON jobs (dead, ready_at);
+            """
+        )
+
+    async def enqueue(self, jobs: Sequence[Job], delay: float = 0.0) -> None:
+        ready_at = time.time() + delay
+        rows = [(job.id, job.task, json.dumps(job.payload), ready_at) for job in jobs]
+        await self._run(
+            lambda db: db.executemany(
+                "INSERT INTO jobs (id, task, payload, ready_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        )
+
+    async def reserve(self, limit: int, visibility: float) -> List[Job]:
+        def reserve(db: sqlite3.Connection) -> List[Job]:
+            now = time.time()
+            rows = db.execute(
+                "SELECT id, task, payload, attempts FROM jobs "
+                "WHERE dead = 0 AND ready_at <= ? ORDER BY ready_at LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            db.executemany(
+                "UPDATE jobs SET attempts = attempts + 1, ready_at = ? WHERE id = ?",
+                [(now + visibility, row[0]) for row in rows],
+            )
+            return [
+                Job(task, json.loads(payload), job_id, attempts + 1)
+                for job_id, task, payload, attempts in rows
+            ]
+
+        return await self._run(reserve)
+
+    async def ack(self, job: Job) -> None:
+        await self._run(
+            lambda db: db.execute("DELETE FROM jobs WHERE id = ?", (job.id,))
+        )
+
+    async def retry(self, job: Job, delay: float) -> None:
+        ready_at = time.time() + delay
+        await self._run(
+            lambda db: db.execute(
+                "UPDATE jobs SET ready_at = ? WHERE id = ?", (ready_at, job.id)
+            )
+        )
+
+    async def fail(self, job: Job, error: str) -> None:
+        await self._run(
+            lambda db: db.execute(
+                "UPDATE jobs SET dead = 1, error = ? WHERE id = ?", (error, job.id)
+            )
+        )
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._connection.close)
+
+    async def _run(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run an operation in one write transaction, in a thread."""
+
+        def run() -> Any:
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    result = operation(self._connection)
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+                return result
+
+        return await asyncio.to_thread(run)
+
+
+def create_broker(url: str) -> Broker:
+    """Create the broker named by a ``JOBS_URL``."""
+    if url == "memory://":
+        return MemoryBroker()
+    if url.startswith("sqlite:///"):
+        return SQLiteBroker(url[len("sqlite:///") :])
+    raise ValueError(f"Unsupported JOBS_URL: {url}")
+
+
+class Task:
+    """A registered job handler."""
+
+    def __init__(self, name: str, handler: Handler, policy: RetryPolicy):
+        self.name = name
+        self.handler = handler
+        self.policy = policy
+
+    async def __call__(self, payload: Dict[str, Any]) -> None:
+        """Run the handler directly, bypassing the queue."""
+        await self.handler(payload)
+
+    async def enqueue(
+        self, payload: Optional[Dict[str, Any]] = None, delay: float = 0.0
+    ) -> str:
+        """Queue one job; returns its id."""
+        job = Job(self.name, payload or {})
+        await get_broker().enqueue([job], delay)
+        return job.id
+
+    async def enqueue_many(
+        self, payloads: Sequence[Dict[str, Any]], delay: float = 0.0
+    ) -> List[str]:
+        """Queue many jobs in one broker call; returns their ids."""
+        jobs = [Job(self.name, payload) for payload in payloads]
+        await get_broker().enqueue(jobs, delay)
+        return [job.id for job in jobs]
+
+
+tasks: Dict[str, Task] = {}
+
+
+def task(
+    name: str, retries: Optional[int] = None, backoff: Optional[float] = None
+) -> Callable[[Handler], Task]:
+    """
+    Register an async function taking the job payload as a task.
+
+    Args:
+        name: Unique name stored with the jobs, e.g. ``feature.action``
+        retries: Retries after the first failure; default ``JOBS_RETRIES``
+        backoff: Delay before the first retry, doubled for each further
+            retry; default ``JOBS_RETRY_BACKOFF``
+    """
+
+    def register(handler: Handler) -> Task:
+        if name in tasks:
+            raise ValueError(f"Task {name} is already registered")
+        policy = RetryPolicy(
+            settings.jobs_retries if retries is None else retries,
+            settings.jobs_retry_backoff if backoff is None else backoff,
+        )
+        tasks[name] = Task(name, handler, policy)
+        return tasks[name]
+
+    return register
+
+
+_broker: Optional[Broker] = None
+
+
+def configure_jobs(broker: Optional[Broker] = None) -> Broker:
+    """Use ``broker``, or the one named by ``JOBS_URL``, for all jobs."""
+    global _broker
+    _broker = create_broker(settings.jobs_url) if broker is None else broker
+    return _broker
+
+
+def get_broker() -> Broker:
+    """Return the broker, creating it from ``JOBS_URL`` on first use."""
+    return configure_jobs() if _broker is None else _broker
+
+
+async def close_jobs() -> None:
+    """Close the broker."""
+    global _broker
+    if _broker is not None:
+        await _broker.close()
+    _broker = None
+
+
+class Worker:
+    """Run queued jobs with bounded concurrency until stopped."""
+
+    def __init__(
+        self,
+        broker: Broker,
+        concurrency: int = 8,
+        batch_size: int = 16,
+        poll_interval: float = 1.0,
+        visibility_timeout: float = 300.0,
+    ):
+        self._broker = broker
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._visibility_timeout = visibility_timeout
+        self.processed = 0
+
+    async def run(self, stop: asyncio.Event, shutdown_timeout: float = 30.0) -> None:
+        """
+        Run jobs until ``stop`` is set, then wait for the running ones.
+
+        Jobs still running after ``shutdown_timeout`` seconds are cancelled
+        and released to the broker, so another worker can run them.
+        """
+        running: Set["asyncio.Task[None]"] = set()
+        stopping = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                free = self._concurrency - len(running)
+                if not free:
+                    await asyncio.wait(
+                        {stopping, *running}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+                batch = min(free, self._batch_size)
+                jobs = await self._broker.reserve(batch, self._visibility_timeout)
+                for job in jobs:
+                    runner = asyncio.create_task(self._run(job))
+                    running.add(runner)
+                    runner.add_done_callback(running.discard)
+                if len(jobs) < batch:
+                    # Nothing else is runnable yet
+                    await asyncio.wait({stopping}, timeout=self._poll_interval)
+        finally:
+            stopping.cancel()
+
+        if running:
+            _, pending = await asyncio.wait(running, timeout=shutdown_timeout)
+            for runner in pending:
+                runner.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(self, job: Job) -> None:
+        """Run one job and record its outcome with the broker."""
+        handler = tasks.get(job.task)
+        if handler is None:
+            await self._broker.fail(job, f"Unknown task {job.task}")
+            return
+        try:
+            await handler(job.payload)
+        except asyncio.CancelledError:
+            await self._broker.retry(job, 0)
+            raise
+        except Exception as e:
+            if job.attempts > handler.policy.retries:
+                logger.exception("Job %s of %s failed for good", job.id, job.task)
+                await self._broker.fail(job, repr(e))
+            else:
+                delay = handler.policy.delay(job.attempts)
+                logger.warning(
+                    "Job %s of %s failed (attempt %d), retrying in %.1fs: %r",
+                    job.id,
+                    job.task,
+                    job.attempts,
+                    delay,
+                    e,
+                )
+                await self._broker.retry(job, delay)
+            return
+        await self._broker.ack(job)
+        self.processed += 1
+''')
+
+
+class JobsWorkerGenerator(StaticContentGenerator):
+    """Generate the background job worker entry point."""
+
+    def __init__(self):
+        super().__init__('''"""Background job worker.
+
+Run with ``python -m src.app.worker``, as many processes as needed. The
+worker imports the ``tasks`` module of every feature and runs their queued
+jobs. On SIGINT or SIGTERM it stops reserving jobs and gives the running
+ones ``GRACEFUL_TIMEOUT`` seconds to finish. Jobs still running then are
+released to the broker, so no job is lost.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import pkgutil
+import signal
+
+from src.app import services
+from src.app.config import settings
+from src.app.shared.jobs import Worker, close_jobs, get_broker, tasks
+from src.app.shared.logger import configure_logging, shutdown_logging
+
+
+def load_tasks() -> None:
+    """Import the tasks module of every feature, registering its tasks."""
+    for feature in pkgutil.iter_modules(services.__path__):
+        module = f"{services.__name__}.{feature.name}.tasks"
+        if feature.ispkg and importlib.util.find_spec(module) is not None:
+            importlib.import_module(module)
+
+
+async def run() -> None:
+    """Run jobs until a termination signal arrives."""
+    load_tasks()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    worker = Worker(
+        get_broker(),
+        concurrency=settings.jobs_concurrency,
+        batch_size=settings.jobs_batch_size,
+        poll_interval=settings.jobs_poll_interval,
+        visibility_timeout=settings.jobs_visibility_timeout,
+    )
+    print(f"Worker running {len(tasks)} task(s): {', '.join(sorted(tasks))}")
+    try:
+        await worker.run(stop, shutdown_timeout=settings.graceful_timeout)
+    finally:
+        await close_jobs()
+
+
+def main() -> None:
+    """Start the worker with the application's logging."""
+    configure_logging()
+    try:
+        asyncio.run(run())
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
+''')
+
+
+class JobsTestGenerator(StaticContentGenerator):
+    """Generate the tests of the background job module."""
+
+    def __init__(self):
+        super().__init__('''"""Tests of the background job queue, run against the in-memory broker."""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, List
+
+from src.app.shared.jobs import (
+    Job,
+    MemoryBroker,
+    SQLiteBroker,
+    Worker,
+    configure_jobs,
+    task,
+    tasks,
+)
+
+
+class WorkerTest(unittest.IsolatedAsyncioTestCase):
+    """Each test registers tasks under its own names and removes them."""
+
+    async def asyncSetUp(self) -> None:
+        self.broker = MemoryBroker()
+        configure_jobs(self.broker)
+        self.calls: List[Dict[str, Any]] = []
+
+    def tearDown(self) -> None:
+        for name in [name for name in tasks if name.startswith("test.")]:
+            del tasks[name]
+
+    async def drain(self, worker: Worker) -> None:
+        """Run the worker until the broker holds no runnable job."""
+        stop = asyncio.Event()
+        running = asyncio.create_task(worker.run(stop))
+        while len(self.broker) > 0:
+            await asyncio.sleep(0.01)
+        stop.set()
+        await running
+
+    async def test_runs_enqueued_jobs(self) -> None:
+        @task("test.record")
+        async def record(payload: Dict[str, Any]) -> None:
+            self.calls.append(payload)
+
+        await record.enqueue_many([{"n": n} for n in range(20)])
+        worker = Worker(self.broker, batch_size=4, poll_interval=0.01)
+        await self.drain(worker)
+        self.assertEqual(sorted(call["n"] for call in self.calls), list(range(20)))
+        self.assertEqual(worker.processed, 20)
+
+    async def test_limits_concurrency(self) -> None:
+        active = peak = 0
+
+        @task("test.slow")
+        async def slow(payload: Dict[str, Any]) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await slow.enqueue_many([{}] * 12)
+        await self.drain(Worker(self.broker, concurrency=3, poll_interval=0.01))
+        self.assertEqual(peak, 3)
+
+    async def test_retries_then_succeeds(self) -> None:
+        @task("test.flaky", retries=2, backoff=0)
+        async def flaky(payload: Dict[str, Any]) -> None:
+            self.calls.append(payload)
+            if len(self.calls) < 3:
+                raise RuntimeError("downstream unavailable")
+
+        await flaky.enqueue({"id": 1})
+        await self.drain(Worker(self.broker, poll_interval=0.01))
+        self.assertEqual(len(self.calls), 3)
+        self.assertFalse(self.broker.dead)
+
+    async def test_keeps_failed_jobs_as_dead(self) -> None:
+        @task("test.broken", retries=1, backoff=0)
+        async def broken(payload: Dict[str, Any]) -> None:
+            self.calls.append(payload)
+            raise RuntimeError("always fails")
+
+        job_id = await broken.enqueue()
+        await self.drain(Worker(self.broker, poll_interval=0.01))
+        self.assertEqual(len(self.calls), 2)
+        self.assertIn("always fails", self.broker.dead[job_id][1])
+
+    async def test_redelivers_abandoned_jobs(self) -> None:
+        await self.broker.enqueue([Job("test.any", {})])
+        first = await self.broker.reserve(10, visibility=0.01)
+        self.assertEqual(await self.broker.reserve(10, visibility=0.01), [])
+        await asyncio.sleep(0.02)
+        again = await self.broker.reserve(10, visibility=0.01)
+        self.assertEqual([job.id for job in again], [first[0].id])
+        self.assertEqual(again[0].attempts, 2)
+
+
+class SQLiteBrokerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.broker = SQLiteBroker(os.path.join(directory.name, "jobs.db"))
+        self.addAsyncCleanup(self.broker.close)
+
+    async def test_reserves_each_job_once(self) -> None:
+        await self.broker.enqueue([Job("test.any", {"n": n}) for n in range(5)])
+        first = await self.broker.reserve(3, visibility=60)
+        second = await self.broker.reserve(3, visibility=60)
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertFalse({job.id for job in first} & {job.id for job in second})
+
+    async def test_ack_retry_and_fail(self) -> None:
+        await self.broker.enqueue([Job("test.any", {}) for _ in range(3)])
+        done, again, dead = await self.broker.reserve(3, visibility=60)
+        await self.broker.ack(done)
+        await self.broker.retry(again, 0)
+        await self.broker.fail(dead, "error")
+        self.assertEqual(
+            [(job.id, job.attempts) for job in await self.broker.reserve(3, 60)],
+            [(again.id, 2)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
+''')
+
+
+class FeatureTasksGenerator(TemplateContentGenerator):
+    """Generate the background jobs module of a feature."""
+
+    def __init__(self):
+        super().__init__('''"""{{ feature.name | pascal }} background jobs.
+
+Handlers run in the worker process (``python -m src.app.worker``), never on
+the request path. Services enqueue them::
+
+    await item_created.enqueue({"resource": "{{ feature.name }}", "id": item.id})
+
+Jobs may be delivered more than once; make handlers idempotent.
+"""
+
+import logging
+from typing import Any, Dict
+
+from src.app.shared.jobs import task
+
+logger = logging.getLogger(__name__)
+
+
+@task("{{ feature.name }}.item_created")
+async def item_created(payload: Dict[str, Any]) -> None:
+    """Do the slow follow-up work of a new item, such as sending email."""
+    logger.info("Created %s %s", payload["resource"], payload["id"])
+''')
+
+
+class LoadTestPackageGenerator(StaticContentGenerator):
+    """Generate the scenario registry of the load-test harness."""
+
+    def __init__(self):
+        super().__init__('''"""Load-test harness.
+
+Scenarios are registered by the modules in ``tests/loadtest/scenarios``;
+``lazyapi add feature`` and ``lazyapi add resource`` generate one module per
+resource. Run ``python -m tests.loadtest --help`` for the options.
+"""
+
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Scenario:
+    """
+    One kind of request in the load mix.
+
+    ``path`` may contain ``{id}``, filled with an id taken from the pool
+    named by ``ids``. Scenarios naming a pool in ``collect`` add the ``id``
+    of their JSON responses to it, and run a few times before the
+    measurement starts so the pool is not empty.
+    """
+
+    name: str
+    method: str
+    path: str
+    weight: float = 1.0
+    json: Any = None
+    ids: Optional[str] = None
+    collect: Optional[str] = None
+
+
+_registry: Dict[str, Scenario] = {}
+
+
+def register(*scenarios: Scenario) -> None:
+    """Add scenarios to the mix, replacing any with the same name."""
+    for scenario in scenarios:
+        _registry[scenario.name] = scenario
+
+
+def load_scenarios() -> List[Scenario]:
+    """Import every scenario module and return the registered scenarios."""
+    from . import scenarios
+
+    for module in pkgutil.iter_modules(scenarios.__path__):
+        importlib.import_module(f"{scenarios.__name__}.{module.name}")
+    return list(_registry.values())
+''')
+
+
+class LoadTestRunnerGenerator(StaticContentGenerator):
+    """Generate the request loop and report of the load-test harness."""
+
+    def __init__(self):
+        super().__init__('''"""Drive a weighted request mix and summarize the latencies."""
+
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from . import Scenario
+
+# Ids kept per pool; enough variety without growing during long runs
+POOL_SIZE = 10_000
+
+
+@dataclass
+class _Stats:
+    """Results of one scenario."""
+
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+
+class LoadTest:
+    """
+    Run scenarios from ``concurrency`` clients for ``duration`` seconds.
+
+    Each client sends its next request as soon as the previous one
+    finished, picking scenarios at random by weight.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        scenarios: List[Scenario],
+        concurrency: int = 16,
+        duration: float = 10.0,
+        seed_requests: int = 20,
+        random_seed: Optional[int] = None,
+    ):
+        self._client = client
+        self._scenarios = scenarios
+        self._concurrency = concurrency
+        self._duration = duration
+        self._seed_requests = seed_requests
+        self._random = random.Random(random_seed)
+        self._pools: Dict[str, List[Any]] = {}
+        self._stats: Dict[str, _Stats] = {}
+
+    async def run(self) -> Dict[str, Any]:
+        """Seed the id pools, run the mix and return the report."""
+        for scenario in self._scenarios:
+            if scenario.collect:
+                for _ in range(self._seed_requests):
+                    await self._send(scenario, _Stats())
+        runnable = [
+            scenario
+            for scenario in self._scenarios
+            if not scenario.ids or self._pools.get(scenario.ids)
+        ]
+        if not runnable:
+            raise RuntimeError("No runnable scenarios")
+        self._stats = {scenario.name: _Stats() for scenario in runnable}
+
+        started = time.perf_counter()
+        deadline = started + self._duration
+        await asyncio.gather(
+            *(self._client_loop(runnable, deadline) for _ in range(self._concurrency))
+        )
+        return self._report(time.perf_counter() - started)
+
+    async def _client_loop(self, scenarios: List[Scenario], deadline: float) -> None:
+        weights = [scenario.weight for scenario in scenarios]
+        while time.perf_counter() < deadline:
+            (scenario,) = self._random.choices(scenarios, weights)
+            await self._send(scenario, self._stats[scenario.name])
+
+    async def _send(self, scenario: Scenario, stats: _Stats) -> None:
+        path = scenario.path
+        if scenario.ids:
+            path = path.format(id=self._random.choice(self._pools[scenario.ids]))
+        start = time.perf_counter()
+        try:
+            response = await self._client.request(
+                scenario.method, path, json=scenario.json
+            )
+        except httpx.HTTPError:
+            stats.errors += 1
+            return
+        stats.latencies.append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            stats.errors += 1
+        elif scenario.collect:
+            pool = self._pools.setdefault(scenario.collect, [])
+            item = response.json().get("id")
+            if len(pool) < POOL_SIZE:
+                pool.append(item)
+            else:
+                pool[self._random.randrange(POOL_SIZE)] = item
+
+    def _report(self, elapsed: float) -> Dict[str, Any]:
+        everything = _Stats()
+        scenarios = {}
+        for name, stats in sorted(self._stats.items()):
+            everything.latencies.extend(stats.latencies)
+            everything.errors += stats.errors
+            scenarios[name] = _summary(stats, elapsed)
+        return {
+            "concurrency": self._concurrency,
+            "duration_s": round(elapsed, 3),
+            "total": _summary(everything, elapsed),
+            "scenarios": scenarios,
+        }
+
+
+def _summary(stats: _Stats, elapsed: float) -> Dict[str, Any]:
+    """Throughput and latency percentiles in milliseconds."""
+    latencies = sorted(stats.latencies)
+
+    def percentile(fraction: float) -> float:
+        if not latencies:
+            return 0.0
+        rank = max(0, math.ceil(fraction * len(latencies)) - 1)
+        return round(latencies[rank] * 1000, 3)
+
+    return {
+        "requests": len(latencies),
+        "errors": stats.errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": percentile(0.50),
+        "p90_ms": percentile(0.90),
+        "p99_ms": percentile(0.99),
+        "max_ms": percentile(1.0),
+    }
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Find scenarios that got slower, lost throughput or started failing.
+
+    Args:
+        report: Report of this run
+        baseline: Report of an earlier run
+        tolerance: Accepted relative change, e.g. 0.25 for 25%
+
+    Returns:
+        One message per regression
+    """
+    regressions = []
+    for name, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        if current["p99_ms"] > previous["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p99 {current['p99_ms']:.1f}ms > "
+                f"{previous['p99_ms']:.1f}ms baseline"
+            )
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {current['rps']:.0f} req/s < "
+                f"{previous['rps']:.0f} req/s baseline"
+            )
+        if current["errors"] and not previous["errors"]:
+            regressions.append(f"{name}: {current['errors']} errors")
+    return regressions
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a report as a table."""
+    rows = [*report["scenarios"].items(), ("total", report["total"])]
+    width = max(len(name) for name, _ in rows)
+    lines = [
+        f"{'scenario':<{width}}  {'requests':>8}  {'req/s':>8}  {'p50 ms':>8}  "
+        f"{'p90 ms':>8}  {'p99 ms':>8}  {'max ms':>8}  {'errors':>6}"
+    ]
+    for name, row in rows:
+        lines.append(
+            f"{name:<{width}}  {row['requests']:>8}  {row['rps']:>8.1f}  "
+            f"{row['p50_ms']:>8.2f}  {row['p90_ms']:>8.2f}  {row['p99_ms']:>8.2f}  "
+            f"{row['max_ms']:>8.2f}  {row['errors']:>6}"
+        )
+    return "\\n".join(lines)
+''')
+
+
+class LoadTestMainGenerator(StaticContentGenerator):
+    """Generate the command line of the load-test harness."""
+
+    def __init__(self):
+        super().__init__('''"""Load-test the application.
+
+Examples::
+
+    python -m tests.loadtest                      # in-process, 16 clients, 10s
+    python -m tests.loadtest --serve -c 64 -d 30  # against a local uvicorn
+    python -m tests.loadtest --url http://staging:8000
+    python -m tests.loadtest --output loadtest.json          # write a baseline
+    python -m tests.loadtest --baseline loadtest.json        # fail on regressions
+"""
+
+import argparse
+import asyncio
+import contextlib
+import fnmatch
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Optional
+
+import httpx
+
+from . import Scenario, load_scenarios
+from .runner import LoadTest, compare, format_report
+
+
+@contextlib.asynccontextmanager
+async def in_process_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Call the application in this process, with its lifespan running."""
+    from src.app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest"
+        ) as client:
+            yield client
+
+
+@contextlib.contextmanager
+def local_server(timeout: float = 30.0) -> Iterator[str]:
+    """Start uvicorn on a free port and return its URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ]
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                httpx.get(f"{url}/health").raise_for_status()
+                break
+            except httpx.HTTPError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise SystemExit("uvicorn did not start")
+                time.sleep(0.1)
+        yield url
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def select(
+    scenarios: List[Scenario], patterns: List[str], weights: List[str]
+) -> List[Scenario]:
+    """Filter scenarios by name and override their weights."""
+    if patterns:
+        scenarios = [
+            scenario
+            for scenario in scenarios
+            if any(fnmatch.fnmatch(scenario.name, pattern) for pattern in patterns)
+        ]
+    overrides = {}
+    for entry in weights:
+        name, _, weight = entry.partition("=")
+        overrides[name] = float(weight)
+    for scenario in scenarios:
+        scenario.weight = overrides.get(scenario.name, scenario.weight)
+    return [scenario for scenario in scenarios if scenario.weight > 0]
+
+
+async def run(arguments: argparse.Namespace, url: Optional[str]) -> dict:
+    scenarios = select(load_scenarios(), arguments.scenario, arguments.weight)
+    if url is None:
+        client_context = in_process_client()
+    else:
+        limits = httpx.Limits(max_connections=arguments.concurrency)
+        client_context = httpx.AsyncClient(base_url=url, limits=limits)
+    async with client_context as client:
+        return await LoadTest(
+            client,
+            scenarios,
+            concurrency=arguments.concurrency,
+            duration=arguments.duration,
+            seed_requests=arguments.seed_requests,
+            random_seed=arguments.random_seed,
+        ).run()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.loadtest", description="Load-test the application."
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Server to test (default: in-process)")
+    target.add_argument(
+        "--serve", action="store_true", help="Start a local uvicorn and test it"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-d", "--duration", type=float, default=10.0)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        default=[],
+        help="Only run scenarios matching this glob (repeatable)",
+    )
+    parser.add_argument(
+        "--weight",
+        action="append",
+        default=[],
+        metavar="NAME=WEIGHT",
+        help="Override the weight of a scenario; 0 disables it (repeatable)",
+    )
+    parser.add_argument("--seed-requests", type=int, default=20)
+    parser.add_argument("--random-seed", type=int)
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    parser.add_argument(
+        "--baseline", type=Path, help="Fail if slower than this JSON report"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    arguments = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        url = stack.enter_context(local_server()) if arguments.serve else arguments.url
+        report = asyncio.run(run(arguments, url))
+
+    print(format_report(report))
+    if arguments.output:
+        arguments.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\\n")
+    if arguments.baseline:
+        baseline = json.loads(arguments.baseline.read_text())
+        regressions = compare(report, baseline, arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+''')
+
+
+class LoadTestAppScenariosGenerator(StaticContentGenerator):
+    """Generate the load-test scenarios of the application's own routes."""
+
+    def __init__(self):
+        super().__init__('''"""Load-test scenarios of the application's own routes."""
+
+from tests.loadtest import Scenario, register
+
+register(Scenario("app.health", "GET", "/health", weight=1))
+''')
+
+
+class ResourceScenariosGenerator(TemplateContentGenerator):
+    """Generate the load-test scenarios of a resource."""
+
+    def __init__(self):
+        super().__init__('''"""Load-test scenarios of the {{ feature.name }} {{ resource.name }} routes."""
+
+from tests.loadtest import Scenario, register
+
+{% if resource.name == feature.name %}
+PREFIX = "/{{ feature.name | kebab }}"
+{% else %}
+PREFIX = "/{{ feature.name | kebab }}/{{ resource.name | kebab }}"
+{% endif %}
+POOL = "{{ feature.name }}.{{ resource.name }}"
+
+register(
+    Scenario(
+        f"{POOL}.create",
+        "POST",
+        PREFIX + "/",
+        weight=1,
+        json={"name": "load test"},
+        collect=POOL,
+    ),
+    Scenario(f"{POOL}.list", "GET", PREFIX + "/", weight=2),
+    Scenario(f"{POOL}.get", "GET", PREFIX + "/{id}", weight=7, ids=POOL),
+)
+''')
@@ -0,0 +1,97 @@
+"""Feature manifests: many features and resources declared in one TOML file.
+
+Example::
+
+    [features.users]
+    resources = ["profile", "address"]
+
+    [features.orders]          # resources default to ["orders"]
+    cache = true               # options of the feature structure
+    http = true
+    jobs = true
+"""
+
+import tomllib
+from pathlib import Path
+from typing import Collection, List
+from ..shared.interfaces import IFileOperations
+from ..shared.exceptions import ValidationError
+from .feature_config import FeatureSpec
+
+
+def parse_manifest(
+    source: str,
+    origin: str = "<manifest>",
+    options: Collection[str] = ("cache", "http", "jobs"),
+) -> List[FeatureSpec]:
+    """
+    Parse a feature manifest.
+
+    Args:
+        source: TOML document
+        origin: Name used in error messages
+        options: Option names accepted as boolean keys of a feature
+
+    Returns:
+        Feature specifications in manifest order
+
+    Raises:
+        ValidationError: If the manifest is malformed
+    """
+    try:
+        data = tomllib.loads(source)
+    except tomllib.TOMLDecodeError as e:
+        raise ValidationError(f"Invalid manifest {origin}: {e}") from e
+
+    features = data.get("features")
+    if not isinstance(features, dict) or not features:
+        raise ValidationError(f"Manifest {origin} declares no [features.<name>] tables")
+
+    specs = []
+    for name, table in features.items():
+        if not isinstance(table, dict):
+            raise ValidationError(
+                f"Manifest {origin}: 'features.{name}' must be a table"
+            )
+        unknown = set(table) - {"resources", *options}
+        if unknown:
+            raise ValidationError(
+                f"Manifest {origin}: unknown key(s) in 'features.{name}': "
+                f"{', '.join(sorted(unknown))}"
+            )
+        resources = table.get("resources", [name])
+        if not isinstance(resources, list) or not all(
+            isinstance(resource, str) for resource in resources
+        ):
+            raise ValidationError(
+                f"Manifest {origin}: 'features.{name}.resources' must be a list of names"
+            )
+        enabled = []
+        for option in options:
+            value = table.get(option, False)
+            if not isinstance(value, bool):
+                raise ValidationError(
+                    f"Manifest {origin}: 'features.{name}.{option}' must be true or false"
+                )
+            if value:
+                enabled.append(option)
+        specs.append(FeatureSpec(name=name, resources=resources, options=enabled))
+    return specs
+
+
+def load_manifest(file_ops: IFileOperations, path: Path) -> List[FeatureSpec]:
+    """
+    Read and parse a feature manifest file.
+
+    Args:
+        file_ops: File operations service
+        path: Manifest path
+
+    Returns:
+        Feature specifications in manifest order
+
+    Raises:
+        FileSystemError: If the file cannot be read
+        ValidationError: If the manifest is malformed
+    """
+    return parse_manifest(file_ops.read_file(path), str(path))
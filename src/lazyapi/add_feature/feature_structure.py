@@ -0,0 +1,150 @@
+"""Feature package structure configuration."""
+
+from .feature_config import (
+    FeatureFileSpec,
+    FeatureOption,
+    FeatureStructure,
+    SettingSpec,
+    ShutdownSpec,
+)
+from ..shared.content_generators import EmptyFileGenerator
+from .feature_generators import (
+    CacheModuleGenerator,
+    FeatureModuleGenerator,
+    FeatureTasksGenerator,
+    JobsModuleGenerator,
+    JobsTestGenerator,
+    JobsWorkerGenerator,
+    LoadTestAppScenariosGenerator,
+    LoadTestMainGenerator,
+    LoadTestPackageGenerator,
+    LoadTestRunnerGenerator,
+    ResourceScenariosGenerator,
+    ResourceModelsGenerator,
+    ResourceServiceGenerator,
+    ResourceRouterGenerator,
+)
+
+
+def get_feature_structure() -> FeatureStructure:
+    """
+    Define the layout of a feature package below ``src/app/services``.
+
+    Each feature is a self-contained mini-API; each resource adds a model,
+    service and router module to it. With the ``cache`` option, GET routes
+    are cached and writes invalidate them through ``src/app/shared/cache.py``.
+    With the ``http`` option, services receive the pooled client of
+    ``src/app/shared/http_client.py``. The ``jobs`` option adds a
+    ``tasks.py`` module to the feature, a job queue in
+    ``src/app/shared/jobs.py`` and the worker ``src/app/worker.py``.
+    The ``loadtest`` option, enabled for the whole project by
+    ``lazyapi add loadtest``, registers every resource with the load-test
+    harness in ``tests/loadtest``.
+    """
+    empty_gen = EmptyFileGenerator()
+
+    return FeatureStructure(
+        feature_files=[
+            FeatureFileSpec(path="__init__.py", generator=empty_gen),
+            FeatureFileSpec(
+                path="{{ feature.name }}.py", generator=FeatureModuleGenerator()
+            ),
+            FeatureFileSpec(path="models/__init__.py", generator=empty_gen),
+            FeatureFileSpec(path="routers/__init__.py", generator=empty_gen),
+            FeatureFileSpec(path="services/__init__.py", generator=empty_gen),
+            FeatureFileSpec(path="functions/__init__.py", generator=empty_gen),
+        ],
+        resource_files=[
+            FeatureFileSpec(
+                path="models/{{ resource.name }}.py",
+                generator=ResourceModelsGenerator(),
+            ),
+            FeatureFileSpec(
+                path="services/{{ resource.name }}.py",
+                generator=ResourceServiceGenerator(),
+            ),
+            FeatureFileSpec(
+                path="routers/{{ resource.name }}.py",
+                generator=ResourceRouterGenerator(),
+            ),
+        ],
+        options={
+            "cache": FeatureOption(
+                files=[
+                    FeatureFileSpec(
+                        path="src/app/shared/cache.py",
+                        generator=CacheModuleGenerator(),
+                    ),
+                ],
+                settings=[
+                    SettingSpec("cache_url", "str", '""'),
+                    SettingSpec("cache_max_entries", "int", "10_000"),
+                    SettingSpec("cache_ttl", "float", "60.0"),
+                ],
+                settings_comment="Cache, see shared/cache.py",
+            ),
+            # The client module and its lifespan wiring come with the project
+            "http": FeatureOption(),
+            "jobs": FeatureOption(
+                files=[
+                    FeatureFileSpec(
+                        path="src/app/shared/jobs.py",
+                        generator=JobsModuleGenerator(),
+                    ),
+                    FeatureFileSpec(
+                        path="src/app/worker.py",
+                        generator=JobsWorkerGenerator(),
+                    ),
+                    FeatureFileSpec(
+                        path="tests/test_jobs.py",
+                        generator=JobsTestGenerator(),
+                    ),
+                ],
+                feature_files=[
+                    FeatureFileSpec(path="tasks.py", generator=FeatureTasksGenerator()),
+                ],
+                settings=[
+                    SettingSpec("jobs_url", "str", '"sqlite:///./jobs.db"'),
+                    SettingSpec("jobs_concurrency", "int", "8"),
+                    SettingSpec("jobs_batch_size", "int", "16"),
+                    SettingSpec("jobs_poll_interval", "float", "1.0"),
+                    SettingSpec("jobs_visibility_timeout", "float", "300.0"),
+                    SettingSpec("jobs_retries", "int", "3"),
+                    SettingSpec("jobs_retry_backoff", "float", "1.0"),
+                ],
+                settings_comment="Jobs, see shared/jobs.py",
+                shutdown=[ShutdownSpec("src.app.shared.jobs", "close_jobs")],
+            ),
+            "loadtest": FeatureOption(
+                files=[
+                    FeatureFileSpec(
+                        path="tests/loadtest/__init__.py",
+                        generator=LoadTestPackageGenerator(),
+                    ),
+                    FeatureFileSpec(
+                        path="tests/loadtest/__main__.py",
+                        generator=LoadTestMainGenerator(),
+                    ),
+                    FeatureFileSpec(
+                        path="tests/loadtest/runner.py",
+                        generator=LoadTestRunnerGenerator(),
+                    ),
+                    FeatureFileSpec(
+                        path="tests/loadtest/scenarios/__init__.py",
+                        generator=empty_gen,
+                    ),
+                    FeatureFileSpec(
+                        path="tests/loadtest/scenarios/app.py",
+                        generator=LoadTestAppScenariosGenerator(),
+                    ),
+                ],
+                resource_files=[
+                    FeatureFileSpec(
+                        path="tests/loadtest/scenarios/"
+                        "{{ feature.name }}_{{ resource.name }}.py",
+                        generator=ResourceScenariosGenerator(),
+                    ),
+                ],
+            ),
+        },
+    )
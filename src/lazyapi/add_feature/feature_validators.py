@@ -0,0 +1,69 @@
+"""Feature-specific validators for add-feature."""
+
+import keyword
+import re
+from pathlib import Path
+from typing import Any
+from ..shared.interfaces import IValidator, IFileOperations
+
+MAIN_MODULE = Path("src/app/main.py")
+CONFIG_MODULE = Path("src/app/config.py")
+SERVICES_DIR = Path("src/app/services")
+
+
+class ComponentNameValidator(IValidator):
+    """Validate feature and resource names, which become Python modules."""
+
+    _PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
+    _RESERVED = {"models", "routers", "services", "functions"}
+    _error = ""
+
+    def validate(self, value: Any) -> bool:
+        """Validate a feature or resource name."""
+        if not isinstance(value, str) or not value:
+            self._error = "Name must be a non-empty string"
+            return False
+        if len(value) > 64:
+            self._error = f"Name '{value[:64]}...' too long (max 64 characters)"
+            return False
+        if not self._PATTERN.match(value):
+            self._error = (
+                f"Name '{value}' must start with a letter and contain only "
+                "lowercase letters, digits and underscores"
+            )
+            return False
+        if keyword.iskeyword(value) or value in self._RESERVED:
+            self._error = f"'{value}' is a reserved name"
+            return False
+        return True
+
+    def get_error_message(self) -> str:
+        return self._error
+
+
+class FeatureProjectValidator(IValidator):
+    """Validate a directory holds a feature-based LazyAPI project."""
+
+    def __init__(self, file_ops: IFileOperations):
+        self._file_ops = file_ops
+        self._error = ""
+
+    def validate(self, value: Any) -> bool:
+        """Validate project path."""
+        if not isinstance(value, (str, Path)):
+            self._error = "Path must be a string or Path object"
+            return False
+        project_path = Path(value)
+        if not self._file_ops.file_exists(
+            project_path / MAIN_MODULE
+        ) or not self._file_ops.directory_exists(project_path / SERVICES_DIR):
+            self._error = (
+                f"No feature-based project found in '{project_path}' "
+                f"(expected {MAIN_MODULE.as_posix()} and {SERVICES_DIR.as_posix()}/; "
+                "create one with 'lazyapi init --scale')"
+            )
+            return False
+        return True
+
+    def get_error_message(self) -> str:
+        return self._error
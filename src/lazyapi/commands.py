@@ -0,0 +1,636 @@
+"""Typer command definitions for LazyAPI.
+
+Only Typer is imported at module level. Each command imports its services,
+validators and structure modules when it is dispatched, so ``--help`` and
+shell completion stay fast.
+"""
+
+import typer
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, List, Optional
+
+from .cli import get_version
+
+if TYPE_CHECKING:
+    from .shared.interfaces import ITracer
+
+app = typer.Typer(
+    name="lazyapi",
+    help="LazyAPI - A CLI tool for scaffolding FastAPI projects.",
+    add_completion=False,
+)
+add_app = typer.Typer(help="Add features and resources to an existing project.")
+app.add_typer(add_app, name="add")
+pack_app = typer.Typer(help="Build and inspect template packs.")
+app.add_typer(pack_app, name="pack")
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        typer.echo(f"lazyapi {get_version()}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: Annotated[
+        Optional[bool],
+        typer.Option(
+            "--version",
+            "-V",
+            help="Show the LazyAPI version and exit",
+            callback=_version_callback,
+            is_eager=True,
+        ),
+    ] = None,
+):
+    """LazyAPI - A CLI tool for scaffolding FastAPI projects."""
+
+
+@app.command()
+def init(
+    name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--name",
+            "-n",
+            help="Name of the FastAPI project to create",
+            prompt="Enter the project name",
+        ),
+    ] = None,
+    scale: Annotated[
+        bool,
+        typer.Option(
+            "--scale",
+            help="Create a scaled, feature-based project structure",
+        ),
+    ] = False,
+    basic: Annotated[
+        bool,
+        typer.Option(
+            "--basic",
+            help="Create a basic project structure (default)",
+        ),
+    ] = False,
+    snapshot: Annotated[
+        bool,
+        typer.Option(
+            "--snapshot",
+            help="Copy the project from a cached, fully-synced snapshot",
+        ),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Show the files and commands without creating anything",
+        ),
+    ] = False,
+    profile: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--profile",
+            help="Write a Chrome trace of all steps to this JSON file",
+            dir_okay=False,
+        ),
+    ] = None,
+    template_pack: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--template-pack",
+            help="Create the project from a layout in this template pack",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    layout: Annotated[
+        Optional[str],
+        typer.Option(
+            "--layout",
+            help="Layout of the template pack to use",
+        ),
+    ] = None,
+    docker_profile: Annotated[
+        str,
+        typer.Option(
+            "--docker-profile",
+            help="Dockerfile variant: standard, or performance (multi-stage, "
+            "uv cache mounts, precompiled bytecode, slim runtime)",
+        ),
+    ] = "standard",
+    serializer: Annotated[
+        str,
+        typer.Option(
+            "--serializer",
+            help="JSON encoder of responses: json (FastAPI default), orjson "
+            "or msgspec (feature-based layout only)",
+        ),
+    ] = "json",
+    timeout: Annotated[
+        float,
+        typer.Option(
+            "--timeout",
+            help="Seconds each git/uv command may run before it is killed",
+        ),
+    ] = 600.0,
+    total_timeout: Annotated[
+        Optional[float],
+        typer.Option(
+            "--total-timeout",
+            help="Seconds all git/uv commands together may run",
+        ),
+    ] = None,
+):
+    """
+    Initialize a new FastAPI project structure.
+
+    Use --scale for a feature-based layout with shared utilities and services directory.
+    Use --basic (or no flag) for a simple, compact project structure.
+    Use --snapshot to reuse a cached golden project instead of regenerating it.
+    Use --dry-run to preview the project without touching the disk.
+    Use --profile to record a timeline and list the slowest steps.
+    Use --template-pack (and --layout) to create the project from a pack.
+    Use --docker-profile performance for a multi-stage, cache-friendly image.
+    Use --serializer orjson or msgspec to render JSON responses faster.
+    Use --timeout/--total-timeout to bound hung git/uv commands.
+    """
+    from .services import NullTracer, Tracer
+
+    tracer = Tracer() if profile else NullTracer()
+    try:
+        _init(
+            name=name,
+            scale=scale,
+            basic=basic,
+            snapshot=snapshot,
+            dry_run=dry_run,
+            tracer=tracer,
+            template_pack=template_pack,
+            layout=layout,
+            docker_profile=docker_profile,
+            serializer=serializer,
+            timeout=timeout,
+            total_timeout=total_timeout,
+        )
+    finally:
+        if profile:
+            _report_profile(tracer, profile)
+
+
+def _init(
+    *,
+    name: str,
+    scale: bool,
+    basic: bool,
+    snapshot: bool,
+    dry_run: bool,
+    tracer: "ITracer",
+    template_pack: Optional[Path],
+    layout: Optional[str],
+    docker_profile: str,
+    serializer: str,
+    timeout: float,
+    total_timeout: Optional[float],
+) -> None:
+    """Run the init command with the given tracer."""
+    from contextlib import ExitStack
+    from .services import AsyncShellExecutor, FileOperations
+    from .init_repo_setup import (
+        ProjectInitializer,
+        ProjectNameValidator,
+        ProjectPathValidator,
+        PrerequisiteValidator,
+    )
+    from .init_repo_setup.init_structure import get_fastapi_structure
+    from .init_repo_setup.init_scaled_structure import get_scaled_fastapi_structure
+    from .init_repo_setup.init_config import ProjectOptions
+    from .init_repo_setup.init_pack import get_pack_structure
+    from .init_repo_setup.init_snapshot import SnapshotCache
+    from .shared import LazyAPIError, ValidationError
+    from .shared.template_pack import TemplatePack
+
+    file_ops = FileOperations()
+    shell_exec = AsyncShellExecutor(
+        timeout=timeout,
+        total_timeout=total_timeout,
+        progress=_progress_printer(),
+        tracer=tracer,
+    )
+
+    with tracer.span("validate", "phase"):
+        # Validate prerequisites (a dry run never invokes them)
+        prereq_validator = PrerequisiteValidator(["git", "uv"])
+        if not dry_run and not prereq_validator.validate():
+            typer.echo(f"Error: {prereq_validator.get_error_message()}", err=True)
+            raise typer.Exit(code=1)
+
+        # Validate project name
+        name_validator = ProjectNameValidator()
+        if not name_validator.validate(name):
+            typer.echo(f"Error: {name_validator.get_error_message()}", err=True)
+            raise typer.Exit(code=1)
+
+        # Validate project path
+        project_path = Path.cwd() / name
+        path_validator = ProjectPathValidator(file_ops)
+        if not path_validator.validate(project_path):
+            typer.echo(f"Error: {path_validator.get_error_message()}", err=True)
+            raise typer.Exit(code=1)
+
+    # Determine structure
+    if template_pack and (scale or basic):
+        typer.echo(
+            "Warning: --template-pack given; ignoring --scale/--basic.", err=True
+        )
+    elif scale and basic:
+        typer.echo(
+            "Warning: Both --scale and --basic specified. Using --scale.", err=True
+        )
+    use_scaled = scale or not basic
+
+    try:
+        with ExitStack() as resources:
+            options = ProjectOptions(
+                docker_profile=docker_profile, serializer=serializer
+            )
+            if template_pack:
+                pack = resources.enter_context(TemplatePack(template_pack))
+                structure = get_pack_structure(pack, layout, options)
+            elif use_scaled:
+                structure = get_scaled_fastapi_structure(options)
+            elif serializer != "json":
+                raise ValidationError("--serializer requires the feature-based layout")
+            else:
+                structure = get_fastapi_structure(options)
+            structure_type = structure.layout
+            typer.echo(f"Creating {structure_type} FastAPI project: {name}")
+
+            initializer = ProjectInitializer(file_ops, shell_exec, structure, tracer)
+            if dry_run:
+                staged = initializer.render(project_path, name)
+                for path in sorted(staged.files):
+                    typer.echo(f"  create {path.relative_to(Path.cwd())}")
+                for number, stage in enumerate(initializer.plan(), start=1):
+                    for cmd_spec in stage:
+                        typer.echo(f"  run    [{number}] {' '.join(cmd_spec.argv)}")
+                return
+
+            if snapshot:
+                with tracer.span("snapshot", "phase"):
+                    reused = SnapshotCache(
+                        file_ops, shell_exec, tracer=tracer
+                    ).materialize(structure, project_path, name)
+                if not reused:
+                    typer.echo("Built new project snapshot")
+            else:
+                initializer.initialize(project_path, name)
+                stats = initializer.write_stats
+                typer.echo(
+                    f"Wrote {stats.files} files ({stats.bytes} bytes) in "
+                    f"{stats.seconds * 1000:.1f} ms ({stats.files_per_second:.0f} files/s)"
+                )
+
+            typer.echo(f"✓ Successfully created {structure_type} project '{name}'")
+            typer.echo("\nNext steps:")
+            typer.echo(f"  cd {name}")
+            typer.echo("  source .venv/bin/activate")
+            typer.echo("  uvicorn src.app.main:app --reload")
+
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def sync(
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Also overwrite generated files you edited or deleted",
+        ),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show the changes without writing anything"),
+    ] = False,
+):
+    """
+    Regenerate the current project with the installed templates.
+
+    Only files whose generated content changed are written; files you
+    edited are skipped and unchanged files keep their modification times.
+    """
+    from .services import FileOperations, ShellExecutor
+    from .sync_project import ProjectSynchronizer
+    from .shared import LazyAPIError
+
+    try:
+        synchronizer = ProjectSynchronizer(
+            FileOperations(), ShellExecutor(), Path.cwd()
+        )
+        plan = synchronizer.plan(force=force)
+        for item in plan.actions:
+            if item.action in ("create", "update", "skip", "orphan"):
+                reason = f" ({item.reason})" if item.reason else ""
+                typer.echo(f"  {item.action:<6} {item.path}{reason}")
+        if not dry_run:
+            synchronizer.apply(plan)
+
+        typer.echo(
+            f"{'Would sync' if dry_run else '✓ Synced'}: "
+            f"{plan.count('create')} created, {plan.count('update')} updated, "
+            f"{plan.count('unchanged') + plan.count('adopt')} unchanged, "
+            f"{plan.count('skip')} skipped"
+        )
+
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@add_app.command("feature")
+def add_feature(
+    name: Annotated[str, typer.Argument(help="Name of the feature to create")],
+    resource: Annotated[
+        Optional[List[str]],
+        typer.Option(
+            "--resource",
+            "-r",
+            help="Resource to generate in the feature (repeatable; default: NAME)",
+        ),
+    ] = None,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help="Cache GET routes and invalidate them on writes "
+            "(adds src/app/shared/cache.py)",
+        ),
+    ] = False,
+    http: Annotated[
+        bool,
+        typer.Option(
+            "--http",
+            help="Give the services the pooled outbound HTTP client "
+            "(src/app/shared/http_client.py)",
+        ),
+    ] = False,
+    jobs: Annotated[
+        bool,
+        typer.Option(
+            "--jobs",
+            help="Add a tasks.py enqueuing background jobs "
+            "(adds src/app/shared/jobs.py and the src.app.worker entry point)",
+        ),
+    ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show the changes without writing anything"),
+    ] = False,
+):
+    """
+    Add a feature module and wire its router into the application.
+
+    Use --cache to generate cached routes backed by an in-process TTL/LRU
+    cache, or Redis when CACHE_URL is set. Use --http for services that call
+    other services; they receive the client through a dependency. Use --jobs
+    to move slow work to a background worker (python -m src.app.worker).
+    """
+    from .add_feature import FeatureSpec
+
+    _add(
+        [
+            FeatureSpec(
+                name=name,
+                resources=resource or [name],
+                options=[
+                    option
+                    for option, enabled in (
+                        ("cache", cache),
+                        ("http", http),
+                        ("jobs", jobs),
+                    )
+                    if enabled
+                ],
+            )
+        ],
+        dry_run,
+    )
+
+
+@add_app.command("features")
+def add_features(
+    manifest: Annotated[
+        Path,
+        typer.Option(
+            "--file",
+            "-f",
+            help="TOML manifest with [features.<name>] tables",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show the changes without writing anything"),
+    ] = False,
+):
+    """
+    Add all features declared in a manifest in one pass.
+
+    Every feature is rendered in memory and the application entry point is
+    edited once, so dozens of features cost about as much as one.
+    """
+    from .add_feature import load_manifest
+    from .services import FileOperations
+    from .shared import LazyAPIError
+
+    try:
+        features = load_manifest(FileOperations(), manifest)
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    _add(features, dry_run)
+
+
+@add_app.command("resource")
+def add_resource(
+    name: Annotated[str, typer.Argument(help="Name of the resource to create")],
+    feature: Annotated[
+        str,
+        typer.Option("--feature", "-f", help="Existing feature to extend"),
+    ],
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show the changes without writing anything"),
+    ] = False,
+):
+    """
+    Add a resource (models, service and router) to an existing feature.
+    """
+    from .add_feature import FeatureSpec
+
+    _add([FeatureSpec(name=feature, resources=[name], extend=True)], dry_run)
+
+
+@add_app.command("loadtest")
+def add_loadtest(
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Show the changes without writing anything"),
+    ] = False,
+):
+    """
+    Add an asyncio load-test harness in tests/loadtest.
+
+    Every existing and future resource registers its routes with it. Run it
+    with: uv run python -m tests.loadtest --help.
+    """
+    _add([], dry_run, enable=["loadtest"])
+
+
+def _add(features, dry_run: bool, enable=()) -> None:
+    """Plan and apply feature generation in the current project."""
+    from .services import FileOperations
+    from .add_feature import (
+        FeatureGenerator,
+        FeatureProjectValidator,
+        get_feature_structure,
+    )
+    from .shared import LazyAPIError
+
+    file_ops = FileOperations()
+    project_path = Path.cwd()
+
+    project_validator = FeatureProjectValidator(file_ops)
+    if not project_validator.validate(project_path):
+        typer.echo(f"Error: {project_validator.get_error_message()}", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        generator = FeatureGenerator(file_ops, get_feature_structure(), project_path)
+        plan = generator.plan(features, enable)
+        if dry_run:
+            for path in sorted(plan.files):
+                typer.echo(f"  create {path.relative_to(project_path)}")
+            for path in sorted(plan.edits):
+                typer.echo(f"  update {path.relative_to(project_path)}")
+            return
+
+        generator.apply(plan)
+        changes = f"{len(plan.files)} files created, {len(plan.edits)} updated"
+        if enable:
+            typer.echo(f"✓ Enabled {', '.join(enable)}: {changes}")
+        else:
+            resources = sum(len(spec.resources) for spec in features)
+            typer.echo(
+                f"✓ Added {resources} resource(s) in {len(features)} feature(s): "
+                f"{changes}"
+            )
+
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Unexpected error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@pack_app.command("build")
+def pack_build(
+    source: Annotated[
+        Path,
+        typer.Argument(
+            help="Directory with manifest.toml and the templates",
+            exists=True,
+            file_okay=False,
+        ),
+    ],
+    output: Annotated[
+        Path,
+        typer.Option("--output", "-o", help="Pack file to write", dir_okay=False),
+    ],
+):
+    """
+    Build a template pack from a directory.
+
+    Every file besides manifest.toml becomes a template. All templates are
+    compiled and every layout is checked before the pack is written.
+    """
+    from .shared import LazyAPIError
+    from .shared.template_pack import TemplatePack, build_template_pack
+
+    try:
+        count = build_template_pack(source, output)
+        with TemplatePack(output) as pack:
+            layouts = pack.layouts()
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+    typer.echo(
+        f"✓ Built {output} ({count} templates, {output.stat().st_size} bytes) "
+        f"with layouts: {', '.join(layouts)}"
+    )
+
+
+@pack_app.command("show")
+def pack_show(
+    pack_path: Annotated[
+        Path,
+        typer.Argument(help="Template pack to inspect", exists=True, dir_okay=False),
+    ],
+    templates: Annotated[
+        bool,
+        typer.Option("--templates", help="Also list every template"),
+    ] = False,
+):
+    """List the layouts (and optionally templates) of a template pack."""
+    from .shared import LazyAPIError
+    from .shared.template_pack import TemplatePack
+
+    try:
+        with TemplatePack(pack_path) as pack:
+            typer.echo(f"{pack_path}: {len(pack)} templates")
+            for name, spec in pack.manifest["layouts"].items():
+                typer.echo(
+                    f"  layout {name}: {len(spec.get('files', []))} files, "
+                    f"{len(spec.get('commands', []))} commands"
+                )
+            if templates:
+                for name in pack.names():
+                    typer.echo(f"  {pack.version(name)}  {name}")
+    except LazyAPIError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+def _progress_printer():
+    """Return a callback printing command output lines as they arrive."""
+    import threading
+
+    lock = threading.Lock()
+
+    def progress(command: List[str], line: str) -> None:
+        # Commands of one stage run in parallel threads
+        with lock:
+            typer.echo(f"  [{' '.join(command[:2])}] {line}", err=True)
+
+    return progress
+
+
+def _report_profile(tracer, path: Path, limit: int = 10) -> None:
+    """Write the trace file and print the slowest steps."""
+    tracer.write_chrome_trace(path)
+    typer.echo(f"\nProfile written to {path} (open in chrome://tracing)")
+    typer.echo(f"{'ms':>10}  {'kind':<10} step")
+    # Process spans duplicate the command spans that wrap them
+    for event in tracer.slowest(limit, exclude=("process",)):
+        typer.echo(f"{event['dur'] / 1000:>10.1f}  {event['cat']:<10} {event['name']}")
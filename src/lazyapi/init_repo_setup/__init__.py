@@ -7,6 +7,7 @@ from .init_validators import (
     PrerequisiteValidator,
 )
 from .init_structure import get_fastapi_structure
+from .init_pack import get_pack_structure
 
 __all__ = [
     "ProjectInitializer",
@@ -14,4 +15,5 @@ __all__ = [
     "ProjectPathValidator",
     "PrerequisiteValidator",
     "get_fastapi_structure",
+    "get_pack_structure",
 ]
@@ -1,8 +1,12 @@
 """Configuration for FastAPI project structure."""
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, List, Optional
 from ..shared.interfaces import IContentGenerator
+from ..shared.exceptions import ValidationError
+
+DOCKER_PROFILES = ("standard", "performance")
+SERIALIZERS = ("json", "orjson", "msgspec")
 
 
 @dataclass
@@ -22,15 +26,83 @@ class DirectorySpec:
 
 @dataclass
 class CommandSpec:
-    """Specification for a command to execute."""
+    """
+    Specification for a command to execute.
+
+    Commands form a dependency graph. ``depends_on`` lists the names of the
+    commands that must finish first; ``None`` means "after the previous
+    command", which keeps plain lists of commands sequential. Specs sharing
+    the same ``command`` prefix that declare ``packages`` are merged into a
+    single invocation (e.g. one ``uv add`` for all packages).
+    """
 
     command: List[str]
+    name: Optional[str] = None
+    depends_on: Optional[List[str]] = None
+    packages: List[str] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Name used to reference this command in dependencies."""
+        return self.name or " ".join(self.command)
+
+    @property
+    def argv(self) -> List[str]:
+        """Full command line including any packages."""
+        return [*self.command, *self.packages]
+
+
+@dataclass
+class ProjectOptions:
+    """
+    Generation options chosen at ``init``.
+
+    Templates see each option as a variable of the same name, and the
+    project index records them so ``sync`` renders the same variant.
+    """
+
+    docker_profile: str = "standard"
+    serializer: str = "json"
+
+    def __post_init__(self):
+        if self.docker_profile not in DOCKER_PROFILES:
+            raise ValidationError(
+                f"Unknown Docker profile '{self.docker_profile}' "
+                f"(choose from {', '.join(DOCKER_PROFILES)})"
+            )
+        if self.serializer not in SERIALIZERS:
+            raise ValidationError(
+                f"Unknown serializer '{self.serializer}' "
+                f"(choose from {', '.join(SERIALIZERS)})"
+            )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProjectOptions":
+        """Create options from an index entry, ignoring unknown keys."""
+        known = {option.name for option in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the options as recorded in the project index."""
+        return asdict(self)
 
 
 @dataclass
 class ProjectStructure:
-    """Complete project structure specification."""
+    """
+    Complete project structure specification.
+
+    ``template_pack`` is the pack file a layout was loaded from; it is
+    recorded in the project index so the project can be re-rendered.
+    """
 
     directories: List[DirectorySpec]
     files: List[FileSpec]
     commands: List[CommandSpec]
+    layout: str = "custom"
+    template_pack: Optional[str] = None
+    options: ProjectOptions = field(default_factory=ProjectOptions)
+
+    def context(self, project_name: str) -> Dict[str, Any]:
+        """Template variables for rendering this structure."""
+        return {"project_name": project_name, **self.options.to_dict()}
@@ -1,5 +1,7 @@
 """FastAPI-specific content generators for repo-setup feature."""
 
+import json
+from typing import List
 from ..shared.content_generators import TemplateContentGenerator, StaticContentGenerator
 
 
@@ -12,7 +14,7 @@ class BasicReadmeGenerator(TemplateContentGenerator):
     """Generate README.md for basic FastAPI project."""
 
     def __init__(self):
-        super().__init__("# {project_name}\n\nA FastAPI project.\n")
+        super().__init__("# {{ project_name }}\n\nA FastAPI project.\n")
 
 
 class BasicDockerfileGenerator(StaticContentGenerator):
@@ -38,8 +40,10 @@ class BasicDockerComposeGenerator(TemplateContentGenerator):
     def __init__(self):
         super().__init__("""services:
   api:
-    build: .
-    container_name: {project_name}
+    build:
+      context: .
+      dockerfile: src/Dockerfile
+    container_name: {{ project_name }}
     expose:
       - "8000"
     volumes:
@@ -70,7 +74,7 @@ class ScaledReadmeGenerator(TemplateContentGenerator):
     """Generate README.md for scaled FastAPI project."""
 
     def __init__(self):
-        super().__init__("""# {project_name}
+        super().__init__("""# {{ project_name }}
 
 A feature-based FastAPI project with scalable architecture.
 
@@ -87,10 +91,30 @@ src/
 ## Setup
 
 ```bash
-cd {project_name}
+cd {{ project_name }}
 source .venv/bin/activate
-uvicorn src.main:app --reload
+uvicorn src.app.main:app --reload   # development
+python -m src.app.server            # production
 ```
+
+The production server sizes its workers from the available CPUs (including
+container CPU quotas), uses uvloop and httptools when installed, and reads
+its keep-alive, backlog and graceful-shutdown settings from the environment;
+see `src/app/config.py`.
+
+Request latency histograms, status and error counters are served in
+Prometheus format on `/metrics`; see `src/app/shared/metrics.py`.
+
+List endpoints return pages with an opaque `next_cursor` instead of using
+offsets; see `src/app/shared/pagination.py` and
+`python -m benchmarks.bench_pagination`.
+
+Calls to other services share one pooled `httpx` client per process, created
+by the lifespan; see `src/app/shared/http_client.py`. Run the tests with
+`python -m unittest`.
+
+Logs are written to stdout as JSON lines by a background thread, tagged with
+the request's `X-Request-ID`; see `src/app/shared/logger.py`.
 """)
 
 
@@ -100,48 +124,1478 @@ class ScaledCoreConfigGenerator(StaticContentGenerator):
     def __init__(self):
         super().__init__('''"""Core configuration."""
 
-from pydantic_settings import BaseSettings
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings."""
-    
+    """Application settings, read from the environment and .env."""
+
+    model_config = SettingsConfigDict(env_file=".env")
+
     app_name: str = "FastAPI"
     debug: bool = False
-    
-    class Config:
-        env_file = ".env"
+
+    # Logging, see shared/logger.py
+    log_level: str = "info"
+    log_debug_sample_rate: float = 1.0  # fraction of requests logging DEBUG
+    log_queue_size: int = 10_000  # records buffered before new ones are dropped
+
+    # Production server, see server.py
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 0  # 0: one per available CPU, capped at max_workers
+    max_workers: int = 8
+    loop: str = "auto"  # auto: uvloop when installed, else asyncio
+    http: str = "auto"  # auto: httptools when installed, else h11
+    backlog: int = 2048
+    # Above the idle timeout of common load balancers (60s), which otherwise
+    # reuse connections the server has just closed and return 502s
+    keep_alive: int = 65
+    graceful_timeout: int = 30  # seconds in-flight requests get on shutdown
+    limit_concurrency: Optional[int] = None
+    max_requests: Optional[int] = None  # restart workers after this many requests
+    forwarded_allow_ips: str = "127.0.0.1"
+    access_log: bool = False
+
+    # Database, see shared/database.py. Each worker process has its own
+    # pool, so the server holds up to workers * (pool_size + max_overflow)
+    # connections.
+    database_url: str = "sqlite+aiosqlite:///./app.db"
+    database_echo: bool = False
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: int = 30  # seconds to wait for a free connection
+    database_pool_recycle: int = 1800  # replace connections older than this
+    database_pool_pre_ping: bool = True  # detect connections dropped by the server
+
+    # List endpoints, see shared/pagination.py
+    page_size: int = 50
+    page_size_max: int = 500
+
+    # Outbound HTTP client, see shared/http_client.py. Each worker process
+    # has its own pool.
+    http_client_max_connections: int = 100
+    http_client_max_keepalive: int = 20  # idle connections kept open
+    http_client_keepalive_expiry: float = 30.0
+    http_client_timeout: float = 10.0  # seconds to send or receive data
+    http_client_connect_timeout: float = 5.0
+    http_client_pool_timeout: float = 5.0  # seconds to wait for a free connection
+    http_client_retries: int = 2  # retries of idempotent requests
+    http_client_retry_backoff: float = 0.1  # doubled after each retry
+    http_client_retry_backoff_max: float = 2.0
 
 
 settings = Settings()
 ''')
 
 
+class ScaledServerGenerator(StaticContentGenerator):
+    """Generate the production server entry point for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Production server entry point.
+
+Run with ``python -m src.app.server``. Worker count, event loop, HTTP
+parser and connection tuning come from ``Settings`` in config.py, so every
+value can be overridden through the environment.
+"""
+
+import math
+import os
+from importlib.util import find_spec
+from pathlib import Path
+
+import uvicorn
+
+from src.app.config import settings
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring container CPU quotas."""
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    """Number of worker processes to start."""
+    if settings.workers > 0:
+        return settings.workers
+    return max(1, min(available_cpus(), settings.max_workers))
+
+
+def implementation(setting: str, fast: str, fallback: str) -> str:
+    """Resolve an "auto" setting to the fast implementation if installed."""
+    if setting != "auto":
+        return setting
+    return fast if find_spec(fast) is not None else fallback
+
+
+def main() -> None:
+    """Start uvicorn with the production settings."""
+    uvicorn.run(
+        "src.app.main:app",
+        host=settings.host,
+        port=settings.port,
+        workers=worker_count(),
+        loop=implementation(settings.loop, "uvloop", "asyncio"),
+        http=implementation(settings.http, "httptools", "h11"),
+        backlog=settings.backlog,
+        timeout_keep_alive=settings.keep_alive,
+        timeout_graceful_shutdown=settings.graceful_timeout,
+        limit_concurrency=settings.limit_concurrency,
+        limit_max_requests=settings.max_requests,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+        access_log=settings.access_log,
+        log_level=settings.log_level,
+    )
+
+
+if __name__ == "__main__":
+    main()
+''')
+
+
+class ScaledEnvExampleGenerator(StaticContentGenerator):
+    """Generate .env.example for scaled project."""
+
+    def __init__(self):
+        super().__init__("""# Environment variables (see src/app/config.py)
+DEBUG=false
+LOG_LEVEL=info
+LOG_DEBUG_SAMPLE_RATE=1.0
+
+# Production server (python -m src.app.server)
+WORKERS=0
+MAX_WORKERS=8
+KEEP_ALIVE=65
+GRACEFUL_TIMEOUT=30
+BACKLOG=2048
+
+# Database (any async SQLAlchemy URL, e.g. postgresql+asyncpg://...)
+DATABASE_URL=sqlite+aiosqlite:///./app.db
+DATABASE_POOL_SIZE=5
+DATABASE_MAX_OVERFLOW=10
+DATABASE_POOL_RECYCLE=1800
+
+# Outbound HTTP client
+HTTP_CLIENT_MAX_CONNECTIONS=100
+HTTP_CLIENT_TIMEOUT=10
+HTTP_CLIENT_RETRIES=2
+""")
+
+
+class ScaledDatabaseGenerator(StaticContentGenerator):
+    """Generate the async database module for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Async database engine and request-scoped sessions.
+
+Each process creates one engine, and with it one connection pool, in the
+application lifespan and disposes of it on shutdown. Requests borrow a
+session from that pool through the ``get_session`` dependency::
+
+    @router.get("/")
+    async def list_items(session: AsyncSession = Depends(get_session)):
+        ...
+"""
+
+from collections.abc import AsyncIterator
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+
+from src.app.config import settings
+
+
+class Base(DeclarativeBase):
+    """Base class of all ORM models."""
+
+
+_engine: Optional[AsyncEngine] = None
+_sessions: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def create_engine() -> AsyncEngine:
+    """Create an engine with the pool settings from ``Settings``."""
+    options: Dict[str, Any] = {
+        "echo": settings.database_echo,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+    # SQLite gets SQLAlchemy's default pool; sizing applies to server databases
+    if not settings.database_url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+        )
+    return create_async_engine(settings.database_url, **options)
+
+
+async def init_database() -> None:
+    """Create the process-wide engine and session factory."""
+    global _engine, _sessions
+    _engine = create_engine()
+    _sessions = async_sessionmaker(_engine, expire_on_commit=False)
+
+
+async def close_database() -> None:
+    """Close all pooled connections."""
+    global _engine, _sessions
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = _sessions = None
+
+
+def get_engine() -> AsyncEngine:
+    """Return the engine created by the lifespan."""
+    if _engine is None:
+        raise RuntimeError("Database not initialized; is the app lifespan running?")
+    return _engine
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """Provide a session for one request; uncommitted work is rolled back."""
+    if _sessions is None:
+        raise RuntimeError("Database not initialized; is the app lifespan running?")
+    async with _sessions() as session:
+        yield session
+''')
+
+
+class ScaledPaginationGenerator(StaticContentGenerator):
+    """Generate the keyset pagination module for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Keyset (cursor) pagination for list endpoints.
+
+A page holds the items that follow the last item of the previous page in a
+stable order, plus an opaque ``next_cursor`` that encodes that item's sort
+key. The query seeks straight to the key through an index, so page 10,000
+costs the same as page 1. ``OFFSET`` has to read and discard every earlier
+row instead. Rows inserted or deleted between requests never shift items
+into the wrong page.
+
+The order must be unique and covered by an index, so end it with the
+primary key::
+
+    @router.get("/", response_model=Page[Order])
+    async def list_orders(
+        cursor: Cursor = None,
+        limit: Limit = DEFAULT_LIMIT,
+        session: AsyncSession = Depends(get_session),
+    ):
+        after = decode_cursor(cursor, str, int)
+        columns = (OrderRow.created, OrderRow.id)
+        rows = await session.scalars(
+            keyset_select(select(OrderRow), columns, after, limit)
+        )
+        return Page[Order].of(list(rows), limit, key=lambda o: (o.created, o.id))
+
+Counting all rows is as slow as a deep offset. ``estimate_count`` reads the
+planner's statistics instead.
+"""
+
+import base64
+import binascii
+import json
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import Select, Table, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import settings
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = settings.page_size
+
+Cursor = Annotated[Optional[str], Query(description="next_cursor of the previous page")]
+Limit = Annotated[
+    int, Query(ge=1, le=settings.page_size_max, description="Items per page")
+]
+Count = Annotated[
+    bool, Query(description="Include an estimate of the total number of items")
+]
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list, with the cursor of the next page."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
+
+    @classmethod
+    def of(
+        cls,
+        rows: Sequence[T],
+        limit: int,
+        key: Callable[[T], Tuple[Any, ...]],
+        total_estimate: Optional[int] = None,
+    ) -> "Page[T]":
+        """
+        Build a page from up to ``limit + 1`` rows in key order.
+
+        The extra row only shows that another page exists; it is not
+        returned.
+        """
+        items = list(rows[:limit])
+        next_cursor = encode_cursor(key(items[-1])) if len(rows) > limit else None
+        return cls(items=items, next_cursor=next_cursor, total_estimate=total_estimate)
+
+
+def encode_cursor(key: Tuple[Any, ...]) -> str:
+    """Encode the sort key of the last item of a page."""
+    data = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str], *types: type) -> Optional[Tuple[Any, ...]]:
+    """
+    Decode a cursor into a sort key of the given column types.
+
+    Returns:
+        The key, or None for the first page
+
+    Raises:
+        HTTPException: 400 if the cursor was not produced for this order
+    """
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        key = None
+    if (
+        not isinstance(key, list)
+        or len(key) != len(types)
+        or not all(type(value) is kind for value, kind in zip(key, types))
+    ):
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor")
+    return tuple(key)
+
+
+def keyset_select(
+    statement: Select,
+    columns: Sequence[Any],
+    after: Optional[Tuple[Any, ...]],
+    limit: int,
+) -> Select:
+    """
+    Restrict a query to the page following ``after``.
+
+    Args:
+        statement: Query selecting the rows
+        columns: Sort columns; unique together and covered by an index
+        after: Decoded cursor, or None for the first page
+        limit: Page size; one extra row is fetched for ``Page.of``
+    """
+    statement = statement.order_by(*columns).limit(limit + 1)
+    if after is not None:
+        statement = statement.where(tuple_(*columns) > tuple_(*after))
+    return statement
+
+
+async def estimate_count(session: AsyncSession, table: Table) -> Optional[int]:
+    """
+    Estimate the rows of a table without scanning it.
+
+    PostgreSQL and MySQL report their planner statistics. SQLite reports
+    the highest rowid, which counts deleted rows too. Other databases
+    return None.
+    """
+    dialect = session.get_bind().dialect
+    if dialect.name == "postgresql":
+        query = text(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+        )
+    elif dialect.name in ("mysql", "mariadb"):
+        query = text(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = :name"
+        )
+    elif dialect.name == "sqlite":
+        quoted = dialect.identifier_preparer.quote(table.name)
+        query = text(f"SELECT max(rowid) FROM {quoted}")
+    else:
+        return None
+    estimate = await session.scalar(query, {"name": table.name})
+    return max(int(estimate), 0) if estimate is not None else 0
+''')
+
+
+class ScaledPaginationBenchmarkGenerator(StaticContentGenerator):
+    """Generate the pagination benchmark for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Compare offset and keyset pagination on a local SQLite table.
+
+Usage::
+
+    uv run python -m benchmarks.bench_pagination [--rows 1000000] [--limit 50]
+
+Fetches page 1, 100 and 10,000 both ways, ordered by the primary key and by
+an indexed (created, id) pair, and counts the rows with COUNT(*) and with
+``estimate_count``. Offset latency grows with the page number; keyset
+latency stays flat.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.app.shared.pagination import estimate_count, keyset_select
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("created", Integer, nullable=False),
+)
+Index("ix_items_created_id", items.c.created, items.c.id)
+
+PAGES = (1, 100, 10_000)
+
+
+async def measure(call: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    """Return the median time of one call in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await call()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+async def seed(session: AsyncSession, rows: int) -> None:
+    """Fill the table unless it already holds the requested rows."""
+    if await session.scalar(select(func.count()).select_from(items)) == rows:
+        return
+    await session.execute(items.delete())
+    # Several rows share each timestamp, so the id breaks the ties
+    await session.execute(
+        text(
+            "WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq "
+            "LIMIT :rows) INSERT INTO items (id, name, created) "
+            "SELECT n, 'item ' || n, n / 4 FROM seq"
+        ),
+        {"rows": rows},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE"))
+
+
+async def run(path: str, rows: int, limit: int, repeat: int) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        await seed(session, rows)
+        print(f"{rows} rows, {limit} per page, median milliseconds per page")
+        print(f"  {'order':<14}{'page':>7}{'offset':>10}{'keyset':>10}")
+        for name, columns in (
+            ("id", (items.c.id,)),
+            ("created, id", (items.c.created, items.c.id)),
+        ):
+            for page in PAGES:
+                offset = (page - 1) * limit
+                if offset >= rows:
+                    continue
+                # The cursor a client would hold after reading page - 1
+                after: Optional[Tuple[Any, ...]] = None
+                if page > 1:
+                    last = await session.execute(
+                        select(*columns).order_by(*columns).offset(offset - 1).limit(1)
+                    )
+                    after = tuple(last.one())
+
+                async def by_offset() -> List[Any]:
+                    query = select(items).order_by(*columns).offset(offset).limit(limit)
+                    return (await session.execute(query)).all()
+
+                async def by_keyset() -> List[Any]:
+                    query = keyset_select(select(items), columns, after, limit)
+                    return (await session.execute(query)).all()
+
+                offset_rows, keyset_rows = await by_offset(), await by_keyset()
+                assert offset_rows == keyset_rows[:limit], "pages differ"
+                print(
+                    f"  {name:<14}{page:>7}"
+                    f"{await measure(by_offset, repeat):>10.2f}"
+                    f"{await measure(by_keyset, repeat):>10.2f}"
+                )
+
+        exact = await measure(
+            lambda: session.scalar(select(func.count()).select_from(items)), repeat
+        )
+        estimate = await measure(lambda: estimate_count(session, items), repeat)
+        print(f"  count(*) {exact:.2f}, estimate_count {estimate:.2f}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--database",
+        default=os.path.join(tempfile.gettempdir(), "bench_pagination.db"),
+        help="SQLite file; reused while --rows is unchanged",
+    )
+    arguments = parser.parse_args()
+    asyncio.run(
+        run(arguments.database, arguments.rows, arguments.limit, arguments.repeat)
+    )
+
+
+if __name__ == "__main__":
+    main()
+''')
+
+
+class ScaledHttpClientGenerator(StaticContentGenerator):
+    """Generate the pooled outbound HTTP client module for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Pooled async HTTP client for calls to other services.
+
+Each process creates one ``httpx.AsyncClient`` in the application lifespan
+and closes it on shutdown. Connections and TLS sessions to downstream
+services are reused across requests instead of being opened for each one.
+Requests borrow the client through the ``get_http_client`` dependency::
+
+    @router.get("/stock")
+    async def stock(http: httpx.AsyncClient = Depends(get_http_client)):
+        response = await http.get("https://inventory.internal/stock")
+        ...
+
+Pool limits, timeouts and retries are ``HTTP_CLIENT_*`` settings. Idempotent
+requests are retried after connection errors and 429/502/503/504 responses,
+with exponential backoff and full jitter, and ``Retry-After`` is honoured up
+to the maximum backoff. Tests pass an ``httpx.MockTransport`` to
+``init_http_client`` to answer requests locally.
+"""
+
+import asyncio
+import random
+from typing import Optional
+
+import httpx
+
+from src.app.config import settings
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Failures before the server could have acted on the request. Timeouts
+# waiting for a response or a free connection are not retried, since
+# retrying them multiplies the latency they already caused.
+RETRY_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport retrying idempotent requests with exponential backoff."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int,
+        backoff: float,
+        backoff_max: float,
+    ):
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retries = self._retries if _retryable(request) else 0
+        attempt = 0
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRY_ERRORS:
+                if attempt == retries:
+                    raise
+                delay = self._delay(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == retries:
+                    return response
+                delay = self._delay(attempt, response.headers.get("Retry-After"))
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before the next attempt."""
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self._backoff_max)
+        # Full jitter spreads the retries of concurrent requests apart
+        return random.uniform(0, min(self._backoff * 2**attempt, self._backoff_max))
+
+
+def _retryable(request: httpx.Request) -> bool:
+    """Whether a request may be sent again."""
+    # A streamed body cannot be replayed
+    return request.method in IDEMPOTENT_METHODS and isinstance(
+        request.stream, httpx.ByteStream
+    )
+
+
+def create_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """
+    Create a client with the pool, timeout and retry settings from ``Settings``.
+
+    Args:
+        transport: Transport sending the requests; a pooled network
+            transport by default
+    """
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive,
+                keepalive_expiry=settings.http_client_keepalive_expiry,
+            )
+        )
+    return httpx.AsyncClient(
+        transport=RetryTransport(
+            transport,
+            retries=settings.http_client_retries,
+            backoff=settings.http_client_retry_backoff,
+            backoff_max=settings.http_client_retry_backoff_max,
+        ),
+        timeout=httpx.Timeout(
+            settings.http_client_timeout,
+            connect=settings.http_client_connect_timeout,
+            pool=settings.http_client_pool_timeout,
+        ),
+    )
+
+
+async def init_http_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> None:
+    """Create the process-wide client."""
+    global _client
+    _client = create_http_client(transport)
+
+
+async def close_http_client() -> None:
+    """Close all pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Provide the client created by the lifespan."""
+    if _client is None:
+        raise RuntimeError("HTTP client not initialized; is the app lifespan running?")
+    return _client
+''')
+
+
+class ScaledHttpClientTestGenerator(StaticContentGenerator):
+    """Generate the tests of the HTTP client module for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Tests of the pooled HTTP client, run against a local mock transport."""
+
+import unittest
+from typing import List
+from unittest import mock
+
+import httpx
+
+from src.app.config import settings
+from src.app.shared import http_client
+from src.app.shared.http_client import (
+    close_http_client,
+    get_http_client,
+    init_http_client,
+)
+
+
+class HttpClientTest(unittest.IsolatedAsyncioTestCase):
+    """Requests are answered by ``replies`` in order, the last one repeating."""
+
+    async def asyncSetUp(self) -> None:
+        self.sent: List[httpx.Request] = []
+        self.replies: List[object] = [httpx.Response(200)]
+        patcher = mock.patch.object(settings, "http_client_retry_backoff", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        await init_http_client(httpx.MockTransport(self.reply))
+        self.addAsyncCleanup(close_http_client)
+
+    def reply(self, request: httpx.Request) -> httpx.Response:
+        self.sent.append(request)
+        reply = self.replies[min(len(self.sent), len(self.replies)) - 1]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    async def test_one_client_per_process(self) -> None:
+        self.assertIs(get_http_client(), get_http_client())
+
+    async def test_retries_idempotent_requests(self) -> None:
+        self.replies = [httpx.Response(503), httpx.Response(502), httpx.Response(200)]
+        response = await get_http_client().get("https://downstream.test/items")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.sent), 3)
+
+    async def test_retries_connection_errors(self) -> None:
+        self.replies = [httpx.ConnectError("refused"), httpx.Response(200)]
+        response = await get_http_client().put(
+            "https://downstream.test/items/1", json={"name": "a"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.sent), 2)
+
+    async def test_gives_up_after_retries(self) -> None:
+        self.replies = [httpx.Response(503)]
+        response = await get_http_client().get("https://downstream.test/items")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.sent), settings.http_client_retries + 1)
+
+    async def test_does_not_retry_post(self) -> None:
+        self.replies = [httpx.Response(503)]
+        response = await get_http_client().post("https://downstream.test/items")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(self.sent), 1)
+
+    async def test_honours_retry_after(self) -> None:
+        self.replies = [httpx.Response(429, headers={"Retry-After": "1"})]
+        with mock.patch.object(http_client.asyncio, "sleep") as sleep:
+            await get_http_client().get("https://downstream.test/items")
+        sleep.assert_called_with(1.0)
+
+    async def test_requires_lifespan(self) -> None:
+        await close_http_client()
+        with self.assertRaises(RuntimeError):
+            get_http_client()
+
+
+if __name__ == "__main__":
+    unittest.main()
+''')
+
+
+class ScaledLoggerGenerator(StaticContentGenerator):
+    """Generate the structured logging module for scaled project."""
+
+    def __init__(self):
+        super().__init__(r'''"""Structured JSON logging that keeps formatting and I/O off the event loop.
+
+``configure_logging`` routes every logger, including uvicorn's, through a
+``QueueHandler``. Logging a record on the request path only copies it onto
+a bounded in-memory queue. A ``QueueListener`` thread encodes the records
+as JSON lines and writes them to stdout. When the queue is full, records
+are dropped and counted instead of blocking the request.
+
+Each record carries the id of the request that logged it. The id comes
+from the ``X-Request-ID`` header, or is generated by ``RequestIdMiddleware``,
+and is returned in the response header. Fields passed as ``extra`` become
+JSON keys::
+
+    logger = logging.getLogger(__name__)
+    logger.info("order created", extra={"order_id": order.id})
+
+The level is ``LOG_LEVEL``. ``LOG_DEBUG_SAMPLE_RATE`` keeps that fraction
+of DEBUG records. Sampling is decided per request, so a sampled request
+keeps all of its debug lines.
+"""
+
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Optional
+
+from src.app.config import settings
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "request_id", default="-"
+)
+
+# Attributes of every LogRecord; any others were passed as ``extra``
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "request_id",
+}
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_handler: Optional["NonBlockingQueueHandler"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """Keep a fraction of DEBUG records, deciding once per request."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+        self._threshold = rate * 2**32
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        current = request_id.get()
+        if current == "-":
+            return random.random() < self.rate
+        return zlib.crc32(current.encode()) < self._threshold
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that does as little as possible on the calling thread.
+
+    The message is interpolated here, because its arguments may change
+    once the call returns, but JSON encoding is left to the listener.
+    """
+
+    def __init__(self, records: "queue.Queue[logging.LogRecord]"):
+        super().__init__(records)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Updated in place: copying would double the cost on this thread
+        record.request_id = request_id.get()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks would keep every frame alive until written
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging() -> None:
+    """Route all logging through the queue and start the writer thread."""
+    global _handler, _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JSONFormatter())
+    records: "queue.Queue[logging.LogRecord]" = queue.Queue(settings.log_queue_size)
+    _handler = NonBlockingQueueHandler(records)
+    _handler.addFilter(DebugSampler(settings.log_debug_sample_rate))
+
+    root = logging.getLogger()
+    root.handlers[:] = [_handler]
+    root.setLevel(settings.log_level.upper())
+    # uvicorn installs its own blocking stream handlers
+    for name in _UVICORN_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+
+    _listener = logging.handlers.QueueListener(records, output)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Write the queued records and stop the writer thread."""
+    global _handler, _listener
+    if _listener is None or _handler is None:
+        return
+    _listener.stop()
+    # Anything logged after shutdown is written directly
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JSONFormatter())
+    root = logging.getLogger()
+    root.handlers[:] = [output]
+    if _handler.dropped:
+        root.warning("Log queue was full; dropped %d records", _handler.dropped)
+    _handler = _listener = None
+
+
+class RequestIdMiddleware:
+    """ASGI middleware binding a request id to everything a request logs."""
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        current = _header(scope["headers"]) or uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: List[Any] = list(message.get("headers", []))
+                headers.append((b"x-request-id", current.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        token = request_id.set(current)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id.reset(token)
+
+
+def _header(headers: List[Any]) -> Optional[str]:
+    """Return a usable X-Request-ID header value, if present."""
+    for name, value in headers:
+        if name == b"x-request-id":
+            # Bounded and printable, since it is echoed and logged
+            text = value.decode("latin-1")
+            if 0 < len(text) <= 128 and text.isprintable():
+                return text
+    return None
+''')
+
+
+class ScaledMetricsGenerator(StaticContentGenerator):
+    """Generate the request metrics module for scaled project."""
+
+    def __init__(self):
+        super().__init__(r'''"""Request metrics, served in Prometheus text format on ``/metrics``.
+
+``MetricsMiddleware`` records a latency histogram, a request counter per
+status code and an error counter for every route and method, plus the
+number of requests in flight. Routes are labelled with their path template,
+so ``/orders/{item_id}`` is one series however many ids are requested, and
+with their feature, taken from the ``src.app.services.<feature>`` package
+of the endpoint. Requests matching no route share one series.
+
+The p99 latency of each route over five minutes, in PromQL::
+
+    histogram_quantile(0.99, sum by (le, route)
+        (rate(http_request_duration_seconds_bucket[5m])))
+
+Each worker process counts its own requests, and ``/metrics`` reports the
+worker that answers the scrape; run one worker per container when scraping.
+"""
+
+import bisect
+import time
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# Upper bounds of the latency buckets, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_SERVICES_PACKAGE = "src.app.services."
+
+
+class _Series:
+    """Counters of one route and method."""
+
+    __slots__ = ("buckets", "total", "statuses", "errors")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+
+
+class Metrics:
+    """
+    Request metrics of this process.
+
+    Series are created on the first request of a route and method; later
+    requests only look them up and increment counters.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        # Keyed by id(): routes are unhashable and live as long as the app
+        self._series: Dict[int, Dict[str, _Series]] = {}
+        self._labels: Dict[int, Tuple[str, str]] = {}
+
+    def observe(self, scope: Scope, status: int, seconds: float) -> None:
+        """Record a finished request."""
+        # The router stores the matched route in the scope
+        route = scope.get("route")
+        key = id(route)
+        methods = self._series.get(key)
+        if methods is None:
+            methods = self._series[key] = {}
+            self._labels[key] = _labels(route, scope["path"])
+        method = scope["method"]
+        series = methods.get(method)
+        if series is None:
+            series = methods[method] = _Series()
+        series.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        series.total += seconds
+        series.statuses[status] = series.statuses.get(status, 0) + 1
+        if status >= 500:
+            series.errors += 1
+
+    def render(self) -> str:
+        """Return all metrics in Prometheus text format."""
+        lines = [
+            "# HELP http_requests_in_flight Requests being processed.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+            "# HELP http_request_duration_seconds Time to process a request.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        requests: List[str] = [
+            "# HELP http_requests_total Requests processed, by status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        errors: List[str] = [
+            "# HELP http_request_errors_total Requests that failed with a 5xx status.",
+            "# TYPE http_request_errors_total counter",
+        ]
+        for key, methods in self._series.items():
+            feature, path = self._labels[key]
+            for method, series in methods.items():
+                labels = (
+                    f'feature="{_escape(feature)}",method="{method}",'
+                    f'route="{_escape(path)}"'
+                )
+                name = "http_request_duration_seconds"
+                cumulative = 0
+                for bound, count in zip(BUCKETS, series.buckets):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                count = cumulative + series.buckets[-1]
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {series.total}")
+                lines.append(f"{name}_count{{{labels}}} {count}")
+                for status, total in sorted(series.statuses.items()):
+                    requests.append(
+                        f'http_requests_total{{{labels},status="{status}"}} {total}'
+                    )
+                errors.append(f"http_request_errors_total{{{labels}}} {series.errors}")
+        return "\n".join([*lines, *requests, *errors, ""])
+
+
+def _labels(route: Any, path: str) -> Tuple[str, str]:
+    """Return the feature and full path template of a route."""
+    if route is None:
+        return "", "<unmatched>"
+    module = getattr(getattr(route, "endpoint", None), "__module__", "") or ""
+    feature = ""
+    if module.startswith(_SERVICES_PACKAGE):
+        feature = module[len(_SERVICES_PACKAGE) :].split(".", 1)[0]
+    template = getattr(route, "path", "") or ""
+    regex = getattr(route, "path_regex", None)
+    # A route of an included router may only know the path below the
+    # router's prefix; recover the prefix from the path it matched
+    start = 0
+    while regex is not None and start != -1:
+        if regex.match(path[start:]):
+            return feature, path[:start] + template
+        start = path.find("/", start + 1)
+    return feature, template
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording every HTTP request in ``metrics``."""
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # An exception escaping the app becomes a 500 further out
+        status = 500
+
+        async def send_and_record_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_and_record_status)
+        finally:
+            metrics.in_flight -= 1
+            metrics.observe(scope, status, time.perf_counter() - start)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve the metrics of this process."""
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+''')
+
+
+class ScaledGitignoreGenerator(StaticContentGenerator):
+    """Generate .gitignore for scaled project."""
+
+    def __init__(self):
+        super().__init__("""# Environment
+.venv/
+.env
+
+# Python
+__pycache__/
+*.py[cod]
+.pytest_cache/
+.ruff_cache/
+
+# Local SQLite databases
+*.db
+*.db-journal
+""")
+
+
 class ScaledMainAppGenerator(TemplateContentGenerator):
     """Generate main.py for scaled project."""
 
     def __init__(self):
         super().__init__('''"""Main FastAPI application."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from src.core.config import settings
+
+from src.app.config import settings
+from src.app.shared.database import close_database, init_database
+from src.app.shared.http_client import close_http_client, init_http_client
+from src.app.shared.logger import (
+    RequestIdMiddleware,
+    configure_logging,
+    shutdown_logging,
+)
+from src.app.shared.metrics import MetricsMiddleware, metrics_endpoint
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create process-wide resources at startup and release them on shutdown."""
+    configure_logging()
+    await init_database()
+    await init_http_client()
+    yield
+    await close_http_client()
+    await close_database()
+    shutdown_logging()
+
 
 app = FastAPI(
-    title="{project_name}",
+    title="{{ project_name }}",
     debug=settings.debug,
+    lifespan=lifespan,
 )
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
 
 @app.get("/")
 def root():
     """Root endpoint."""
-    return {{"message": "Welcome to {project_name}"}}
+    return {"message": "Welcome to {{ project_name }}"}
 
 
 @app.get("/health")
 def health():
     """Health check endpoint."""
-    return {{"status": "healthy"}}
+    return {"status": "healthy"}
+''')
+
+
+class ScaledSerializationGenerator(TemplateContentGenerator):
+    """Generate the fast JSON response module for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""JSON responses rendered with {{ serializer }}.
+
+Routes with a ``response_model`` are best left to FastAPI, which dumps
+them to JSON in one pydantic-core pass; it only does so with its default
+response class, which is why ``FastJSONResponse`` is not installed as the
+application default. Routes without a model are converted by FastAPI's
+``jsonable_encoder``, which walks the whole payload in Python and costs far
+more than encoding it. Routes returning large plain payloads, such as rows
+or aggregates, skip that pass with ``json_response``::
+
+    @router.get("/report")
+    async def report():
+        return json_response(await build_report())
+
+Compare the paths with ``benchmarks/bench_serialization.py``.
+"""
+
+from typing import Any, Mapping, Optional
+
+{% if serializer == "orjson" %}
+import orjson
+{% else %}
+import msgspec
+{% endif %}
+from fastapi.responses import JSONResponse
+from pydantic_core import to_jsonable_python
+
+{% if serializer == "orjson" %}
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content as JSON.
+
+    Pydantic models, decimals and sets are converted by pydantic-core.
+    """
+    return orjson.dumps(
+        content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS
+    )
+{% else %}
+_encoder = msgspec.json.Encoder(enc_hook=to_jsonable_python)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content as JSON.
+
+    Pydantic models and other unsupported types are converted by
+    pydantic-core.
+    """
+    return _encoder.encode(content)
+{% endif %}
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with {{ serializer }}."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FastJSONResponse:
+    """
+    Return content encoded in a single pass, skipping FastAPI's conversion.
+
+    A ``response_model`` of the route still documents the schema but is not
+    applied, so the content must already have the documented shape.
+    """
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
+''')
+
+
+class ScaledSerializationBenchmarkGenerator(TemplateContentGenerator):
+    """Generate the serialization micro-benchmark for scaled project."""
+
+    def __init__(self):
+        super().__init__('''"""Compare FastAPI's default JSON rendering with {{ serializer }}.
+
+Usage::
+
+    uv run python -m benchmarks.bench_serialization [--items 1000]
+
+Each case renders the same list response, once from Pydantic models (routes
+with a ``response_model``) and once from plain dicts (routes without one),
+the way FastAPI does by default, with ``response_class=FastJSONResponse``
+and with ``json_response``.
+"""
+
+import argparse
+import datetime
+import json
+import timeit
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+from src.app.shared.serialization import dumps
+
+
+class Item(BaseModel):
+    """A typical list entry."""
+
+    id: int
+    name: str
+    price: float
+    tags: List[str]
+    created: datetime.datetime
+
+
+def starlette_json(content: object) -> bytes:
+    """Render like FastAPI's default JSONResponse."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def measure(function: Callable[[], bytes], repeat: int = 5) -> float:
+    """Return the best time of one call in milliseconds."""
+    number = max(1, int(0.2 / max(timeit.timeit(function, number=1), 1e-6)))
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    items = [
+        Item(id=i, name=f"item {i}", price=i * 1.5, tags=["a", "b"], created=created)
+        for i in range(arguments.items)
+    ]
+    rows = [item.model_dump() for item in items]
+    adapter = TypeAdapter(List[Item])
+
+    cases: Dict[str, Dict[str, Callable[[], bytes]]] = {
+        "models": {
+            "default (pydantic-core JSON)": lambda: adapter.dump_json(
+                adapter.validate_python(items)
+            ),
+            "response_class=FastJSONResponse": lambda: dumps(
+                adapter.dump_python(adapter.validate_python(items), mode="json")
+            ),
+            "json_response()": lambda: dumps(items),
+        },
+        "rows": {
+            "default (jsonable_encoder + json)": lambda: starlette_json(
+                jsonable_encoder(rows)
+            ),
+            "response_class=FastJSONResponse": lambda: dumps(jsonable_encoder(rows)),
+            "json_response()": lambda: dumps(rows),
+        },
+    }
+
+    print(f"{arguments.items} items, milliseconds per response")
+    for payload, variants in cases.items():
+        baseline = None
+        for name, function in variants.items():
+            elapsed = measure(function)
+            baseline = baseline or elapsed
+            print(f"  {payload:<7}{name:<36}{elapsed:9.3f}{baseline / elapsed:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
 ''')
 
 
@@ -163,7 +1617,7 @@ COPY src/ src/
 # Expose port
 EXPOSE 8000
 
-CMD ["uvicorn", "src.main:app", "--host", "0.0.0.0", "--port", "8000"]
+CMD ["uv", "run", "--no-sync", "python", "-m", "src.app.server"]
 """)
 
 
@@ -173,8 +1627,10 @@ class ScaledDockerComposeGenerator(TemplateContentGenerator):
     def __init__(self):
         super().__init__("""services:
   api:
-    build: .
-    container_name: {project_name}-api
+    build:
+      context: .
+      dockerfile: src/Dockerfile
+    container_name: {{ project_name }}-api
     expose:
       - "8000"
     volumes:
@@ -184,4 +1640,82 @@ class ScaledDockerComposeGenerator(TemplateContentGenerator):
     environment:
       - DEBUG=true
       - LOG_LEVEL=info
+      - WORKERS=1
+    # Longer than GRACEFUL_TIMEOUT, so in-flight requests can finish
+    stop_grace_period: 40s
+""")
+
+
+# ============================================================================
+# Docker Profile Generators
+# ============================================================================
+
+
+_PERFORMANCE_DOCKERFILE = """# syntax=docker/dockerfile:1.7
+# Build from the project root: docker build -f src/Dockerfile .
+
+FROM ghcr.io/astral-sh/uv:python3.12-bookworm-slim AS builder
+
+ENV UV_COMPILE_BYTECODE=1 \\
+    UV_LINK_MODE=copy \\
+    UV_PYTHON_DOWNLOADS=0
+
+WORKDIR /app
+
+# Dependencies only: this layer is reused until pyproject.toml or uv.lock change
+RUN --mount=type=cache,target=/root/.cache/uv \\
+    --mount=type=bind,source=uv.lock,target=uv.lock \\
+    --mount=type=bind,source=pyproject.toml,target=pyproject.toml \\
+    uv sync --frozen --no-install-project --no-dev
+
+COPY pyproject.toml uv.lock ./
+COPY src/ src/
+RUN --mount=type=cache,target=/root/.cache/uv \\
+    uv sync --frozen --no-dev
+
+
+FROM python:3.12-slim-bookworm AS runtime
+
+ENV PATH="/app/.venv/bin:$PATH" \\
+    PYTHONUNBUFFERED=1 \\
+    PYTHONDONTWRITEBYTECODE=1
+
+RUN groupadd --system app && useradd --system --gid app --no-create-home app
+
+WORKDIR /app
+COPY --from=builder --chown=app:app /app /app
+
+USER app
+EXPOSE 8000
+
+"""
+
+
+class PerformanceDockerfileGenerator(StaticContentGenerator):
+    """Generate a multi-stage, cache-friendly Dockerfile (performance profile)."""
+
+    def __init__(self, command: List[str]):
+        """
+        Initialize with the server command.
+
+        Args:
+            command: Command the runtime image starts
+        """
+        super().__init__(_PERFORMANCE_DOCKERFILE + f"CMD {json.dumps(command)}\n")
+
+
+class DockerIgnoreGenerator(StaticContentGenerator):
+    """Generate .dockerignore keeping the build context small and cacheable."""
+
+    def __init__(self):
+        super().__init__("""# Local state that must not invalidate Docker layer caches
+.git
+.venv
+.lazyapi
+**/__pycache__
+**/*.pyc
+.pytest_cache
+.ruff_cache
+.env
+docker-compose*.yml
 """)
@@ -1,9 +1,28 @@
 """Feature implementation: Initialize FastAPI project."""
 
+import uuid
 from pathlib import Path
-from ..shared.interfaces import IFileOperations, ICommandExecutor
+from typing import List, Optional
+from ..shared.interfaces import IFileOperations, ICommandExecutor, ITracer, WriteStats
 from ..shared.exceptions import LazyAPIError
-from .init_config import ProjectStructure
+from ..shared.project_index import INDEX_PATH, ProjectIndex
+from ..services.memory_file_operations import InMemoryFileOperations
+from ..services.tracer import NullTracer
+from ..services.tree_copier import TreeCopier
+from .init_config import CommandSpec, ProjectStructure
+from .init_scheduler import CommandScheduler
+
+
+def staging_path(project_path: Path) -> Path:
+    """
+    Return a unique staging location for a project.
+
+    The staging directory is a sibling of the project, so it is on the same
+    file system and can be renamed into place atomically. The project keeps
+    its own name inside it, because uv derives the package name from it.
+    """
+    staging_root = project_path.parent / f".lazyapi-staging-{uuid.uuid4().hex}"
+    return staging_root / project_path.name
 
 
 class ProjectInitializer:
@@ -18,6 +37,8 @@ class ProjectInitializer:
         file_ops: IFileOperations,
         shell_exec: ICommandExecutor,
         structure: ProjectStructure,
+        tracer: Optional[ITracer] = None,
+        copier: Optional[TreeCopier] = None,
     ):
         """
         Initialize with dependencies.
@@ -26,15 +47,70 @@ class ProjectInitializer:
             file_ops: File operations service
             shell_exec: Shell executor service
             structure: Project structure configuration
+            tracer: Tracer receiving spans per phase, directory, file and command
+            copier: Tree copy service, used to relocate the virtual environment
         """
         self._file_ops = file_ops
         self._shell_exec = shell_exec
         self._structure = structure
+        self._tracer = tracer or NullTracer()
+        self._copier = copier or TreeCopier()
+        self.write_stats: Optional[WriteStats] = None
+
+    def render(self, project_path: Path, project_name: str) -> InMemoryFileOperations:
+        """
+        Render the project into an in-memory tree.
+
+        Args:
+            project_path: Path where project should be created
+            project_name: Name of the project
+
+        Returns:
+            Virtual tree containing all directories and files, including
+            the project index
+        """
+        context = self._structure.context(project_name)
+        staged = InMemoryFileOperations()
+        index = ProjectIndex(
+            project_name=project_name,
+            layout=self._structure.layout,
+            template_pack=self._structure.template_pack,
+            options=self._structure.options.to_dict(),
+        )
+        with self._tracer.span("render", "phase"):
+            staged.create_directory(project_path)
+            for dir_spec in self._structure.directories:
+                with self._tracer.span(dir_spec.path, "directory"):
+                    staged.create_directory(project_path / dir_spec.path)
+            for file_spec in self._structure.files:
+                with self._tracer.span(
+                    file_spec.path,
+                    "file",
+                    generator=file_spec.generator.name,
+                ):
+                    content = file_spec.generator.generate(context)
+                    staged.write_file(project_path / file_spec.path, content)
+                index.record_file(file_spec.path, content, file_spec.generator)
+            staged.write_file(project_path / INDEX_PATH, index.to_json())
+        return staged
+
+    def plan(self) -> List[List[CommandSpec]]:
+        """
+        Plan the setup commands.
+
+        Returns:
+            Stages of commands that may run concurrently
+        """
+        return self._scheduler().plan()
 
     def initialize(self, project_path: Path, project_name: str) -> None:
         """
         Initialize a new FastAPI project.
 
+        The project is rendered in memory, flushed in one batch to a
+        staging directory, set up there and then renamed into place, so a
+        failure never leaves a half-built project behind.
+
         Args:
             project_path: Path where project should be created
             project_name: Name of the project
@@ -42,22 +118,43 @@ class ProjectInitializer:
         Raises:
             LazyAPIError: If initialization fails
         """
+        staging = staging_path(project_path)
         try:
-            self._file_ops.create_directory(project_path)
-
-            # Create all directories (write_file will create parent dirs as needed)
-            for dir_spec in self._structure.directories:
-                self._file_ops.create_directory(project_path / dir_spec.path)
+            staged = self.render(project_path, project_name)
+            with self._tracer.span("write", "phase") as details:
+                self.write_stats = staged.flush(self._file_ops, project_path, staging)
+                details.update(
+                    files=self.write_stats.files, bytes=self.write_stats.bytes
+                )
 
-            # Generate and write all files
-            context = {"project_name": project_name}
-            for file_spec in self._structure.files:
-                content = file_spec.generator.generate(context)
-                self._file_ops.write_file(project_path / file_spec.path, content)
+            # Execute all commands, independent ones concurrently
+            with self._tracer.span("commands", "phase"):
+                self._scheduler().run(staging)
 
-            # Execute all commands
-            for cmd_spec in self._structure.commands:
-                self._shell_exec.execute(cmd_spec.command, cwd=project_path)
+            with self._tracer.span("commit", "phase"):
+                self._relocate_environment(staging, project_path)
+                self._file_ops.move(staging, project_path)
 
         except Exception as e:
             raise LazyAPIError(f"Failed to initialize project: {e}") from e
+        finally:
+            self._file_ops.remove_directory(staging.parent)
+
+    def _scheduler(self) -> CommandScheduler:
+        """Create the command scheduler for this structure."""
+        return CommandScheduler(
+            self._shell_exec, self._structure.commands, tracer=self._tracer
+        )
+
+    def _relocate_environment(self, staging: Path, project_path: Path) -> None:
+        """Point virtual environment scripts at the final project path."""
+        venv = staging / ".venv"
+        if not self._file_ops.directory_exists(venv):
+            return
+        self._copier.rewrite_files(
+            venv,
+            self._copier.find_files_containing(
+                venv, [str(staging)], exclude=["lib", "lib64", "Lib"]
+            ),
+            {str(staging): str(project_path)},
+        )
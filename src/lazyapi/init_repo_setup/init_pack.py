@@ -0,0 +1,71 @@
+"""Project structures loaded from template packs."""
+
+from typing import Optional
+from ..shared.content_generators import EmptyFileGenerator
+from ..shared.exceptions import ValidationError
+from ..shared.template_pack import PackTemplateGenerator, TemplatePack
+from .init_config import (
+    ProjectStructure,
+    ProjectOptions,
+    DirectorySpec,
+    FileSpec,
+    CommandSpec,
+)
+
+
+def get_pack_structure(
+    pack: TemplatePack,
+    layout: Optional[str] = None,
+    options: Optional[ProjectOptions] = None,
+) -> ProjectStructure:
+    """
+    Build a project structure from a layout declared in a template pack.
+
+    Only the manifest is decoded here; each template is decoded from the
+    pack the first time its file is rendered.
+
+    Args:
+        pack: Open template pack
+        layout: Layout name; may be omitted if the pack declares only one
+        options: Generation options, available to the pack's templates
+
+    Returns:
+        Project structure whose files render the pack's templates
+
+    Raises:
+        ValidationError: If the layout is unknown or ambiguous
+    """
+    layouts = pack.layouts()
+    if layout is None:
+        if len(layouts) != 1:
+            raise ValidationError(
+                f"Template pack {pack.path} has several layouts; "
+                f"choose one with --layout: {', '.join(layouts)}"
+            )
+        layout = layouts[0]
+    if layout not in layouts:
+        raise ValidationError(
+            f"Template pack {pack.path} has no layout '{layout}' "
+            f"(available: {', '.join(layouts)})"
+        )
+
+    spec = pack.manifest["layouts"][layout]
+    empty_gen = EmptyFileGenerator()
+    return ProjectStructure(
+        layout=layout,
+        template_pack=str(pack.path),
+        options=options or ProjectOptions(),
+        directories=[DirectorySpec(path=path) for path in spec.get("directories", [])],
+        files=[
+            FileSpec(
+                path=entry["path"],
+                generator=(
+                    PackTemplateGenerator(pack, entry["template"])
+                    if entry.get("template")
+                    else empty_gen
+                ),
+            )
+            for entry in spec.get("files", [])
+        ],
+        commands=[CommandSpec(**entry) for entry in spec.get("commands", [])],
+    )
@@ -1,6 +1,13 @@
 """Scaled FastAPI project structure configuration."""
 
-from .init_config import ProjectStructure, DirectorySpec, FileSpec, CommandSpec
+from typing import List, Optional
+from .init_config import (
+    ProjectStructure,
+    ProjectOptions,
+    DirectorySpec,
+    FileSpec,
+    CommandSpec,
+)
 from ..shared.content_generators import EmptyFileGenerator
 from .init_generators import (
     ScaledReadmeGenerator,
@@ -8,18 +15,73 @@ from .init_generators import (
     ScaledMainAppGenerator,
     ScaledDockerfileGenerator,
     ScaledDockerComposeGenerator,
+    ScaledServerGenerator,
+    ScaledEnvExampleGenerator,
+    ScaledDatabaseGenerator,
+    ScaledGitignoreGenerator,
+    ScaledHttpClientGenerator,
+    ScaledHttpClientTestGenerator,
+    ScaledLoggerGenerator,
+    ScaledPaginationGenerator,
+    ScaledPaginationBenchmarkGenerator,
+    ScaledMetricsGenerator,
+    ScaledSerializationGenerator,
+    ScaledSerializationBenchmarkGenerator,
 )
+from .init_structure import docker_files
+
+
+def _uv_add(package: str) -> CommandSpec:
+    """Declare a package to add to the project environment."""
+    return CommandSpec(
+        command=["uv", "add"],
+        name="uv-add",
+        depends_on=["uv-init"],
+        packages=[package],
+    )
+
+
+def serializer_files(options: ProjectOptions) -> List[FileSpec]:
+    """
+    Return the fast JSON response module and its benchmark, if chosen.
 
+    Args:
+        options: Generation options
 
-def get_scaled_fastapi_structure() -> ProjectStructure:
+    Returns:
+        File specs; none for the default serializer
+    """
+    if options.serializer == "json":
+        return []
+    return [
+        FileSpec(
+            path="src/app/shared/serialization.py",
+            generator=ScaledSerializationGenerator(),
+        ),
+        FileSpec(
+            path="benchmarks/bench_serialization.py",
+            generator=ScaledSerializationBenchmarkGenerator(),
+        ),
+    ]
+
+
+def get_scaled_fastapi_structure(
+    options: Optional[ProjectOptions] = None,
+) -> ProjectStructure:
     """
     Define the scaled/feature-based FastAPI project structure.
 
     This creates a more complex, production-ready structure.
+
+    Args:
+        options: Generation options (defaults apply if omitted)
     """
+    options = options or ProjectOptions()
     empty_gen = EmptyFileGenerator()
 
     return ProjectStructure(
+        layout="scaled",
+        options=options,
         directories=[
             # Main app directory
             DirectorySpec(path="src/app"),
@@ -36,32 +98,72 @@ def get_scaled_fastapi_structure() -> ProjectStructure:
             FileSpec(
                 path="docker-compose.dev.yml", generator=ScaledDockerComposeGenerator()
             ),
-            FileSpec(path=".env.example", generator=empty_gen),
-            FileSpec(path=".gitignore", generator=empty_gen),
+            FileSpec(path=".env.example", generator=ScaledEnvExampleGenerator()),
+            FileSpec(path=".gitignore", generator=ScaledGitignoreGenerator()),
             # Source structure
-            FileSpec(path="src/Dockerfile", generator=ScaledDockerfileGenerator()),
+            *docker_files(
+                options,
+                FileSpec(path="src/Dockerfile", generator=ScaledDockerfileGenerator()),
+                ["python", "-m", "src.app.server"],
+            ),
             # App
             FileSpec(path="src/app/__init__.py", generator=empty_gen),
             FileSpec(path="src/app/main.py", generator=ScaledMainAppGenerator()),
             FileSpec(path="src/app/config.py", generator=ScaledCoreConfigGenerator()),
+            FileSpec(path="src/app/server.py", generator=ScaledServerGenerator()),
             # Shared utilities
             FileSpec(path="src/app/shared/__init__.py", generator=empty_gen),
-            FileSpec(path="src/app/shared/logger.py", generator=empty_gen),
+            FileSpec(
+                path="src/app/shared/logger.py", generator=ScaledLoggerGenerator()
+            ),
+            FileSpec(
+                path="src/app/shared/database.py", generator=ScaledDatabaseGenerator()
+            ),
+            FileSpec(
+                path="src/app/shared/metrics.py", generator=ScaledMetricsGenerator()
+            ),
+            FileSpec(
+                path="src/app/shared/pagination.py",
+                generator=ScaledPaginationGenerator(),
+            ),
+            FileSpec(
+                path="src/app/shared/http_client.py",
+                generator=ScaledHttpClientGenerator(),
+            ),
+            *serializer_files(options),
             # Services (features will be added here)
             FileSpec(path="src/app/services/__init__.py", generator=empty_gen),
+            # Benchmarks
+            FileSpec(path="benchmarks/__init__.py", generator=empty_gen),
+            FileSpec(
+                path="benchmarks/bench_pagination.py",
+                generator=ScaledPaginationBenchmarkGenerator(),
+            ),
             # Tests
             FileSpec(path="tests/__init__.py", generator=empty_gen),
+            FileSpec(
+                path="tests/test_http_client.py",
+                generator=ScaledHttpClientTestGenerator(),
+            ),
         ],
         commands=[
-            CommandSpec(command=["git", "init"]),
-            CommandSpec(command=["uv", "init", "--no-readme"]),
-            CommandSpec(command=["rm", "-f", "main.py"]),
-            CommandSpec(command=["uv", "add", "fastapi"]),
-            CommandSpec(command=["uv", "add", "uvicorn[standard]"]),
-            CommandSpec(command=["uv", "add", "pydantic-settings"]),
-            CommandSpec(command=["uv", "add", "sqlalchemy"]),
-            CommandSpec(command=["uv", "add", "alembic"]),
-            CommandSpec(command=["uv", "add", "python-dotenv"]),
-            CommandSpec(command=["uv", "sync"]),
+            CommandSpec(command=["git", "init"], name="git-init", depends_on=[]),
+            CommandSpec(
+                command=["uv", "init", "--no-readme", "--vcs", "none"],
+                name="uv-init",
+                depends_on=[],
+            ),
+            CommandSpec(command=["rm", "-f", "main.py"], depends_on=["uv-init"]),
+            # Package additions are coalesced into a single `uv add`
+            _uv_add("fastapi"),
+            _uv_add("uvicorn[standard]"),
+            _uv_add("pydantic-settings"),
+            _uv_add("sqlalchemy[asyncio]"),
+            _uv_add("aiosqlite"),
+            _uv_add("alembic"),
+            _uv_add("python-dotenv"),
+            _uv_add("httpx"),
+            *([_uv_add(options.serializer)] if options.serializer != "json" else []),
+            CommandSpec(command=["uv", "sync"], depends_on=["uv-add"]),
         ],
     )
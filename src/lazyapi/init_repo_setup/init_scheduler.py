@@ -0,0 +1,186 @@
+"""Dependency-aware scheduling of project setup commands."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+from ..shared.interfaces import ICommandExecutor, ITracer
+from ..shared.exceptions import LazyAPIError
+from ..services.tracer import NullTracer
+from .init_config import CommandSpec
+
+
+class CommandScheduler:
+    """
+    Execute command specs as a dependency graph.
+
+    Package additions sharing a command prefix are coalesced into a single
+    invocation, and commands whose dependencies are satisfied run
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        shell_exec: ICommandExecutor,
+        commands: List[CommandSpec],
+        max_workers: int = 4,
+        tracer: Optional[ITracer] = None,
+    ):
+        """
+        Initialize with dependencies.
+
+        Args:
+            shell_exec: Shell executor service
+            commands: Command specifications in declaration order
+            max_workers: Maximum number of commands running at once
+            tracer: Tracer receiving a span per command
+        """
+        self._shell_exec = shell_exec
+        self._commands = commands
+        self._max_workers = max_workers
+        self._tracer = tracer or NullTracer()
+
+    def resolve(self) -> Dict[str, CommandSpec]:
+        """
+        Coalesce package commands and resolve dependencies.
+
+        Returns:
+            Mapping of command name to resolved spec, in declaration order
+
+        Raises:
+            LazyAPIError: If names clash or a dependency is unknown
+        """
+        resolved: Dict[str, CommandSpec] = {}
+        aliases: Dict[str, str] = {}
+        merge_targets: Dict[tuple, str] = {}
+        previous = None
+
+        for spec in self._commands:
+            depends_on = (
+                spec.depends_on
+                if spec.depends_on is not None
+                else ([previous] if previous else [])
+            )
+            previous = spec.key
+
+            merge_key = tuple(spec.command) if spec.packages else None
+            if merge_key in merge_targets:
+                target = resolved[merge_targets[merge_key]]
+                target.packages.extend(
+                    p for p in spec.packages if p not in target.packages
+                )
+                target.depends_on.extend(
+                    d for d in depends_on if d not in target.depends_on
+                )
+                aliases[spec.key] = target.key
+                continue
+
+            if spec.key in resolved or spec.key in aliases:
+                raise LazyAPIError(f"Duplicate command name '{spec.key}'")
+
+            resolved[spec.key] = CommandSpec(
+                command=list(spec.command),
+                name=spec.key,
+                depends_on=list(depends_on),
+                packages=list(spec.packages),
+            )
+            aliases[spec.key] = spec.key
+            if merge_key is not None:
+                merge_targets[merge_key] = spec.key
+
+        for spec in resolved.values():
+            deps = []
+            for dep in spec.depends_on:
+                if dep not in aliases:
+                    raise LazyAPIError(
+                        f"Command '{spec.key}' depends on unknown command '{dep}'"
+                    )
+                target = aliases[dep]
+                if target != spec.key and target not in deps:
+                    deps.append(target)
+            spec.depends_on = deps
+
+        return resolved
+
+    def plan(self) -> List[List[CommandSpec]]:
+        """
+        Group resolved commands into stages that may run concurrently.
+
+        Returns:
+            List of stages; every command only depends on earlier stages
+
+        Raises:
+            LazyAPIError: If the dependencies contain a cycle
+        """
+        pending = self.resolve()
+        done: set = set()
+        stages: List[List[CommandSpec]] = []
+
+        while pending:
+            stage = [
+                spec
+                for spec in pending.values()
+                if all(dep in done for dep in spec.depends_on)
+            ]
+            if not stage:
+                raise LazyAPIError(
+                    f"Command dependency cycle between: {', '.join(pending)}"
+                )
+            for spec in stage:
+                del pending[spec.key]
+                done.add(spec.key)
+            stages.append(stage)
+
+        return stages
+
+    def run(self, cwd: Path) -> None:
+        """
+        Execute all commands, starting each as soon as its dependencies finish.
+
+        Args:
+            cwd: Working directory for execution
+
+        Raises:
+            LazyAPIError: If the plan is invalid
+            CommandExecutionError: If a command fails
+        """
+        order = [spec for stage in self.plan() for spec in stage]
+        finished: set = set()
+        running: Dict[Future, CommandSpec] = {}
+        error = None
+
+        pool = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            while order or running:
+                if error is None:
+                    for spec in [
+                        s for s in order if all(d in finished for d in s.depends_on)
+                    ]:
+                        order.remove(spec)
+                        future = pool.submit(self._execute, spec, cwd)
+                        running[future] = spec
+                elif not running:
+                    break
+
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    spec = running.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                    else:
+                        finished.add(spec.key)
+        except BaseException:
+            # Ctrl+C only interrupts this thread; stop the workers' commands
+            self._shell_exec.terminate()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+        if error is not None:
+            raise error
+
+    def _execute(self, spec: CommandSpec, cwd: Path) -> None:
+        """Execute a single command inside a trace span."""
+        with self._tracer.span(
+            spec.key, "command", argv=spec.argv, depends_on=spec.depends_on
+        ):
+            self._shell_exec.execute(spec.argv, cwd=cwd)
@@ -0,0 +1,233 @@
+"""Snapshot cache for instant project creation."""
+
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import List, Optional
+from ..shared.interfaces import IFileOperations, ICommandExecutor, ITracer
+from ..shared.exceptions import LazyAPIError
+from ..services.tracer import NullTracer
+from ..services.tree_copier import TreeCopier
+from ..shared.project_index import INDEX_PATH
+from .init_config import ProjectStructure
+from .init_initializer import ProjectInitializer, staging_path
+from .init_scheduler import CommandScheduler
+
+
+# Files written by uv, which records the normalized project name
+_UV_FILES = ("pyproject.toml", "uv.lock")
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used for LazyAPI caches."""
+    if os.environ.get("LAZYAPI_CACHE_DIR"):
+        return Path(os.environ["LAZYAPI_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "lazyapi"
+
+
+class SnapshotCache:
+    """
+    Create projects by copying a cached, fully-synced golden project.
+
+    The golden project is generated once per snapshot key with a
+    placeholder project name. New projects are materialized by cloning the
+    golden tree and re-rendering only the files that embed the placeholder
+    or the golden project's absolute path. uv's files get the name as uv
+    normalizes it, e.g. ``my-project`` for ``My_Project``.
+    """
+
+    TOKEN = "lazyapisnapshotproject"
+    _METADATA = "snapshot.json"
+
+    def __init__(
+        self,
+        file_ops: IFileOperations,
+        shell_exec: ICommandExecutor,
+        cache_dir: Optional[Path] = None,
+        copier: Optional[TreeCopier] = None,
+        tracer: Optional[ITracer] = None,
+    ):
+        """
+        Initialize with dependencies.
+
+        Args:
+            file_ops: File operations service
+            shell_exec: Shell executor service
+            cache_dir: Cache root (defaults to the user cache directory)
+            copier: Tree copy service
+            tracer: Tracer receiving spans for building and restoring snapshots
+        """
+        self._file_ops = file_ops
+        self._shell_exec = shell_exec
+        self._cache_dir = (cache_dir or default_cache_dir()) / "snapshots"
+        self._copier = copier or TreeCopier()
+        self._tracer = tracer or NullTracer()
+
+    def key(self, structure: ProjectStructure, cwd: Optional[Path] = None) -> str:
+        """
+        Compute the snapshot key for a structure.
+
+        The key covers the rendered templates, the resolved command plan
+        (and therefore the dependency set), the LazyAPI version, the uv
+        version and the interpreter uv builds the virtual environment with.
+
+        Args:
+            structure: Project structure configuration
+            cwd: Directory uv resolves the interpreter from (default: current)
+
+        Returns:
+            Hex digest identifying the snapshot
+        """
+        try:
+            version = metadata.version("lazyapi")
+        except metadata.PackageNotFoundError:
+            version = "0"
+
+        digest = hashlib.sha256()
+        digest.update(f"{version}\0{sys.platform}\0{platform.machine()}\0".encode())
+        digest.update(f"{_uv_toolchain(cwd)}\0".encode())
+        context = structure.context(self.TOKEN)
+        for dir_spec in structure.directories:
+            digest.update(f"d\0{dir_spec.path}\0".encode())
+        for file_spec in structure.files:
+            content = file_spec.generator.generate(context)
+            digest.update(f"f\0{file_spec.path}\0{content}\0".encode())
+        scheduler = CommandScheduler(self._shell_exec, structure.commands)
+        for stage in scheduler.plan():
+            for spec in stage:
+                digest.update(f"c\0{json.dumps(spec.argv)}\0".encode())
+        return digest.hexdigest()[:32]
+
+    def materialize(
+        self, structure: ProjectStructure, project_path: Path, project_name: str
+    ) -> bool:
+        """
+        Create a project from the snapshot, building the snapshot if needed.
+
+        Args:
+            structure: Project structure configuration
+            project_path: Path where project should be created
+            project_name: Name of the project
+
+        Returns:
+            True if an existing snapshot was reused, False if it was built
+
+        Raises:
+            LazyAPIError: If building or copying the snapshot fails
+        """
+        with self._tracer.span("key", "phase"):
+            snapshot_dir = self._cache_dir / self.key(structure, project_path.parent)
+        reused = self._file_ops.file_exists(snapshot_dir / self._METADATA)
+        if not reused:
+            with self._tracer.span("build", "phase"):
+                self._build(structure, snapshot_dir)
+
+        info = json.loads((snapshot_dir / self._METADATA).read_text(encoding="utf-8"))
+        staging = staging_path(project_path)
+        try:
+            with self._tracer.span("copy", "phase"):
+                self._copier.copy_tree(
+                    snapshot_dir / self.TOKEN,
+                    staging,
+                    hardlink=[".venv"],
+                    rewrite=info["rewrite"],
+                    replacements={
+                        info["root"]: str(project_path),
+                        self.TOKEN: project_name,
+                    },
+                )
+                for relative in _UV_FILES:
+                    if relative in info["rewrite"]:
+                        content = self._file_ops.read_file(
+                            snapshot_dir / self.TOKEN / relative
+                        )
+                        self._file_ops.write_file(
+                            staging / relative,
+                            content.replace(info["root"], str(project_path)).replace(
+                                self.TOKEN, _normalize_name(project_name)
+                            ),
+                        )
+            # The index hashes the files as rendered for this project name
+            with self._tracer.span("index", "phase"):
+                rendered = ProjectInitializer(
+                    self._file_ops, self._shell_exec, structure
+                ).render(project_path, project_name)
+                self._file_ops.write_file(
+                    staging / INDEX_PATH, rendered.read_file(project_path / INDEX_PATH)
+                )
+            self._file_ops.move(staging, project_path)
+        finally:
+            self._file_ops.remove_directory(staging.parent)
+        return reused
+
+    def _build(self, structure: ProjectStructure, snapshot_dir: Path) -> None:
+        """Generate the golden project and publish it atomically."""
+        staging_dir = snapshot_dir.with_name(
+            f"{snapshot_dir.name}.partial-{os.getpid()}"
+        )
+        golden = staging_dir / self.TOKEN
+        try:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            ProjectInitializer(
+                self._file_ops,
+                self._shell_exec,
+                structure,
+                tracer=self._tracer,
+                copier=self._copier,
+            ).initialize(golden, self.TOKEN)
+            info = {
+                "root": str(golden),
+                "rewrite": self._copier.find_files_containing(
+                    golden, [str(golden), self.TOKEN]
+                ),
+            }
+            self._file_ops.write_file(staging_dir / self._METADATA, json.dumps(info))
+            try:
+                os.rename(staging_dir, snapshot_dir)
+            except OSError:
+                # Another process published the same snapshot first
+                if not self._file_ops.file_exists(snapshot_dir / self._METADATA):
+                    raise
+        except LazyAPIError:
+            raise
+        except Exception as e:
+            raise LazyAPIError(f"Failed to build project snapshot: {e}") from e
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _uv_toolchain(cwd: Optional[Path]) -> str:
+    """
+    Describe uv and the Python it would create a project environment with.
+
+    Each part that cannot be determined reads ``unknown``; a missing uv is
+    reported by the init commands themselves.
+    """
+
+    def output(command: List[str]) -> str:
+        try:
+            return subprocess.run(
+                command, cwd=cwd, capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return "unknown"
+
+    python = output(["uv", "python", "find"])
+    if python != "unknown":
+        python += " " + output(
+            [python, "-I", "-S", "-c", "import sys; print(sys.version)"]
+        )
+    return f"{output(['uv', '--version'])}\0{python}"
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a project name the way uv does (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
@@ -1,24 +1,64 @@
 """FastAPI project structure builder."""
 
-from .init_config import ProjectStructure, DirectorySpec, FileSpec, CommandSpec
+from typing import List, Optional
+from .init_config import (
+    ProjectStructure,
+    ProjectOptions,
+    DirectorySpec,
+    FileSpec,
+    CommandSpec,
+)
 from ..shared.content_generators import EmptyFileGenerator
 from .init_generators import (
     BasicReadmeGenerator,
     BasicDockerfileGenerator,
     BasicDockerComposeGenerator,
     BasicEnvExampleGenerator,
+    PerformanceDockerfileGenerator,
+    DockerIgnoreGenerator,
 )
 
 
-def get_fastapi_structure() -> ProjectStructure:
+def docker_files(
+    options: ProjectOptions, standard: FileSpec, command: List[str]
+) -> List[FileSpec]:
+    """
+    Return the Docker build files for the chosen profile.
+
+    Args:
+        options: Generation options
+        standard: Dockerfile spec of the standard profile
+        command: Server command of the performance image
+
+    Returns:
+        File specs replacing the standard Dockerfile
+    """
+    if options.docker_profile == "performance":
+        return [
+            FileSpec(
+                path=standard.path,
+                generator=PerformanceDockerfileGenerator(command),
+            ),
+            FileSpec(path=".dockerignore", generator=DockerIgnoreGenerator()),
+        ]
+    return [standard]
+
+
+def get_fastapi_structure(options: Optional[ProjectOptions] = None) -> ProjectStructure:
     """
     Define the FastAPI project structure.
 
     This is feature-specific configuration - knows about FastAPI projects.
+
+    Args:
+        options: Generation options (defaults apply if omitted)
     """
+    options = options or ProjectOptions()
     empty_gen = EmptyFileGenerator()
 
     return ProjectStructure(
+        layout="basic",
+        options=options,
         directories=[
             DirectorySpec(path="src/app"),
             DirectorySpec(path="tests"),
@@ -28,7 +68,11 @@ def get_fastapi_structure() -> ProjectStructure:
             FileSpec(path="src/app/main.py", generator=empty_gen),
             FileSpec(path="src/app/routes.py", generator=empty_gen),
             FileSpec(path="src/app/models.py", generator=empty_gen),
-            FileSpec(path="src/Dockerfile", generator=BasicDockerfileGenerator()),
+            *docker_files(
+                options,
+                FileSpec(path="src/Dockerfile", generator=BasicDockerfileGenerator()),
+                ["uvicorn", "src.app.main:app", "--host", "0.0.0.0", "--port", "8000"],
+            ),
             FileSpec(
                 path="docker-compose.dev.yml", generator=BasicDockerComposeGenerator()
             ),
@@ -36,8 +80,12 @@ def get_fastapi_structure() -> ProjectStructure:
             FileSpec(path="README.md", generator=BasicReadmeGenerator()),
         ],
         commands=[
-            CommandSpec(command=["git", "init"]),
-            CommandSpec(command=["uv", "init", "--no-readme"]),
-            CommandSpec(command=["uv", "sync"]),
+            CommandSpec(command=["git", "init"], name="git-init", depends_on=[]),
+            CommandSpec(
+                command=["uv", "init", "--no-readme", "--vcs", "none"],
+                name="uv-init",
+                depends_on=[],
+            ),
+            CommandSpec(command=["uv", "sync"], depends_on=["uv-init"]),
         ],
     )
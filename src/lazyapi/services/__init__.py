@@ -1,6 +1,21 @@
 """Generic services for LazyAPI."""
 
 from .file_operations import FileOperations
+from .memory_file_operations import InMemoryFileOperations
 from .shell_executor import ShellExecutor
+from .async_shell_executor import AsyncShellExecutor
+from .source_editor import ParseCache, SourceEditor
+from .tree_copier import TreeCopier
+from .tracer import NullTracer, Tracer
 
-__all__ = ["FileOperations", "ShellExecutor"]
+__all__ = [
+    "FileOperations",
+    "InMemoryFileOperations",
+    "ShellExecutor",
+    "AsyncShellExecutor",
+    "ParseCache",
+    "SourceEditor",
+    "TreeCopier",
+    "NullTracer",
+    "Tracer",
+]
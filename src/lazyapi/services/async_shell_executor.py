@@ -0,0 +1,237 @@
+"""Streaming shell command execution service."""
+
+import asyncio
+import os
+import signal
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, List, Optional, Set
+from ..shared.interfaces import ICommandExecutor, ITracer
+from ..shared.exceptions import CommandExecutionError
+from .tracer import NullTracer
+
+# Longest output line kept; longer lines are replaced by a marker
+_LINE_LIMIT = 1024 * 1024
+
+
+class AsyncShellExecutor(ICommandExecutor):
+    """
+    Shell command executor that streams output instead of buffering it.
+
+    Output lines of both streams are passed to an optional progress
+    callback as they arrive and only the last ``tail_lines`` are kept, so
+    memory stays bounded and failures report the tail of the output.
+    Commands are killed after ``timeout`` seconds each, and no command may
+    run past ``total_timeout`` seconds after the first one started. At most
+    ``max_concurrency`` commands run at once across all calling threads.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        max_concurrency: int = 4,
+        tail_lines: int = 50,
+        progress: Optional[Callable[[List[str], str], None]] = None,
+        tracer: Optional[ITracer] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            timeout: Seconds each command may run (None: unlimited)
+            total_timeout: Seconds all commands together may run
+            max_concurrency: Maximum number of commands running at once
+            tail_lines: Output lines kept for error messages
+            progress: Called with the command and each output line
+            tracer: Tracer receiving a span per executed process
+        """
+        self._timeout = timeout
+        self._total_timeout = total_timeout
+        self._tail_lines = tail_lines
+        self._progress = progress
+        self._tracer = tracer or NullTracer()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._deadline: Optional[float] = None
+        self._live: Set[int] = set()
+        self._terminated = False
+
+    def execute(self, command: List[str], cwd: Optional[Path] = None) -> None:
+        """
+        Execute a shell command, blocking the calling thread.
+
+        Safe to call from several threads; each call runs its own event loop.
+
+        Args:
+            command: Command and arguments to execute
+            cwd: Working directory for execution
+
+        Raises:
+            CommandExecutionError: If execution fails or times out
+        """
+        with self._slots:
+            asyncio.run(self.execute_async(command, cwd))
+
+    async def execute_async(
+        self, command: List[str], cwd: Optional[Path] = None
+    ) -> None:
+        """
+        Execute a shell command on the running event loop.
+
+        Args:
+            command: Command and arguments to execute
+            cwd: Working directory for execution
+
+        Raises:
+            CommandExecutionError: If execution fails or times out
+        """
+        display = " ".join(command)
+        if self._terminated:
+            raise CommandExecutionError(f"Command '{display}' not started: terminated")
+        timeout = self._time_left(display)
+        tail: Deque[str] = deque(maxlen=self._tail_lines)
+
+        with self._tracer.span(display, "process", cwd=str(cwd)) as details:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    cwd=cwd,
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=_LINE_LIMIT,
+                    # Own process group, so a timeout also kills grandchildren
+                    start_new_session=os.name == "posix",
+                )
+            except FileNotFoundError as e:
+                raise CommandExecutionError(
+                    f"Command '{command[0]}' not found. Is it installed?"
+                ) from e
+            with self._lock:
+                self._live.add(process.pid)
+                terminated = self._terminated
+            if terminated:
+                # Started while terminate() ran; it never saw this process
+                _kill(process.pid)
+
+            readers = [
+                asyncio.create_task(self._pump(stream, command, tail))
+                for stream in (process.stdout, process.stderr)
+            ]
+            try:
+                async with asyncio.timeout(timeout):
+                    await asyncio.gather(*readers)
+                    returncode = await process.wait()
+            except TimeoutError:
+                await _terminate(process, readers)
+                if timeout == self._timeout:
+                    reason = f"timed out after {_seconds(self._timeout)}"
+                else:
+                    reason = (
+                        f"total timeout of {_seconds(self._total_timeout)} exceeded"
+                    )
+                raise CommandExecutionError(
+                    f"Command '{display}' {reason}" + _format_tail(tail)
+                ) from None
+            except asyncio.CancelledError:
+                # Ctrl+C does not reach the separate process group
+                await _terminate(process, readers)
+                raise
+            finally:
+                with self._lock:
+                    self._live.discard(process.pid)
+            details.update(returncode=returncode)
+
+        if returncode != 0:
+            raise CommandExecutionError(
+                f"Command '{display}' failed with exit code {returncode}"
+                + _format_tail(tail)
+            )
+
+    def terminate(self) -> None:
+        """
+        Kill every running command and refuse to start new ones.
+
+        Commands run in their own process group, so the terminal's Ctrl+C
+        does not reach them; callers interrupted in the main thread call this
+        to stop the worker threads' processes.
+        """
+        with self._lock:
+            self._terminated = True
+            pids = list(self._live)
+        for pid in pids:
+            _kill(pid)
+
+    async def _pump(
+        self,
+        stream: asyncio.StreamReader,
+        command: List[str],
+        tail: Deque[str],
+    ) -> None:
+        """Forward the lines of one output stream to the tail and progress."""
+        while True:
+            try:
+                data = await stream.readline()
+            except ValueError:
+                # The reader discards lines longer than the limit
+                tail.append("[line too long, omitted]")
+                continue
+            if not data:
+                return
+            line = data.decode("utf-8", errors="replace").rstrip()
+            tail.append(line)
+            if self._progress is not None and line:
+                self._progress(command, line)
+
+    def _time_left(self, display: str) -> Optional[float]:
+        """Seconds the next command may run, honouring both timeouts."""
+        limits = [] if self._timeout is None else [self._timeout]
+        if self._total_timeout is not None:
+            with self._lock:
+                if self._deadline is None:
+                    self._deadline = time.monotonic() + self._total_timeout
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                raise CommandExecutionError(
+                    f"Command '{display}' not started: total timeout of "
+                    f"{_seconds(self._total_timeout)} exceeded"
+                )
+            limits.append(remaining)
+        return min(limits) if limits else None
+
+
+def _seconds(value: float) -> str:
+    """Format a timeout for messages: ``0.5s``, ``30s``."""
+    return f"{value:g}s"
+
+
+async def _terminate(
+    process: asyncio.subprocess.Process, readers: List[asyncio.Task]
+) -> None:
+    """Kill a process and, on POSIX, every process it started."""
+    for reader in readers:
+        reader.cancel()
+    _kill(process.pid)
+    await process.wait()
+
+
+def _kill(pid: int) -> None:
+    """Kill a process and, on POSIX, its whole process group."""
+    try:
+        if os.name == "posix":
+            os.killpg(pid, signal.SIGKILL)
+        else:
+            os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def _format_tail(tail: Deque[str]) -> str:
+    """Render the kept output lines for an error message."""
+    lines = [line for line in tail if line]
+    if not lines:
+        return ""
+    return ":\n" + "\n".join(f"  {line}" for line in lines)
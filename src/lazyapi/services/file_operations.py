@@ -1,7 +1,13 @@
 """Generic file system operations service."""
 
+import contextlib
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from ..shared.interfaces import IFileOperations
+from typing import Dict, Iterable, List, Optional, Set
+from ..shared.interfaces import IFileOperations, WriteStats
 from ..shared.exceptions import FileSystemError
 
 
@@ -12,6 +18,19 @@ class FileOperations(IFileOperations):
     No knowledge of any specific feature - pure file operations.
     """
 
+    # Batches smaller than this are written inline; thread start-up would
+    # cost more than it saves.
+    _PARALLEL_THRESHOLD = 32
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize file operations.
+
+        Args:
+            max_workers: Threads used for batch writes (default: executor choice)
+        """
+        self._max_workers = max_workers
+
     def create_directory(self, path: Path, parents: bool = True) -> None:
         """
         Create a directory.
@@ -30,6 +49,46 @@ class FileOperations(IFileOperations):
         except OSError as e:
             raise FileSystemError(f"Failed to create directory {path}: {e}") from e
 
+    def read_file(self, path: Path) -> str:
+        """
+        Read the content of a file.
+
+        Args:
+            path: File path to read
+
+        Returns:
+            File content
+
+        Raises:
+            FileSystemError: If read fails
+        """
+        try:
+            return path.read_text(encoding="utf-8")
+        except PermissionError as e:
+            raise FileSystemError(f"Permission denied: {path}") from e
+        except OSError as e:
+            raise FileSystemError(f"Failed to read file {path}: {e}") from e
+
+    def list_directory(self, path: Path) -> List[str]:
+        """
+        List the names of the entries of a directory.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Sorted entry names
+
+        Raises:
+            FileSystemError: If listing fails
+        """
+        try:
+            return sorted(os.listdir(path))
+        except PermissionError as e:
+            raise FileSystemError(f"Permission denied: {path}") from e
+        except OSError as e:
+            raise FileSystemError(f"Failed to list directory {path}: {e}") from e
+
     def write_file(self, path: Path, content: str) -> None:
         """
         Write content to a file.
@@ -49,6 +108,99 @@ class FileOperations(IFileOperations):
         except OSError as e:
             raise FileSystemError(f"Failed to write file {path}: {e}") from e
 
+    def write_files(
+        self, files: Dict[Path, str], directories: Iterable[Path] = ()
+    ) -> WriteStats:
+        """
+        Write many files and directories in one batch.
+
+        Directory creation is deduplicated: only the deepest directories are
+        created, each exactly once. Files are then written concurrently.
+
+        Args:
+            files: Mapping of file path to content
+            directories: Additional (possibly empty) directories to create
+
+        Returns:
+            Throughput report for the batch
+
+        Raises:
+            FileSystemError: If any write fails
+        """
+        start = time.perf_counter()
+        leaves = self._leaf_directories(
+            {*directories, *(path.parent for path in files)}
+        )
+        for directory in leaves:
+            self.create_directory(directory)
+
+        items = list(files.items())
+        if len(items) < self._PARALLEL_THRESHOLD:
+            written = sum(self._write(path, content) for path, content in items)
+        else:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                written = sum(pool.map(lambda item: self._write(*item), items))
+
+        return WriteStats(
+            files=len(items),
+            bytes=written,
+            directories=len(leaves),
+            seconds=time.perf_counter() - start,
+        )
+
+    def move(self, source: Path, destination: Path) -> None:
+        """
+        Atomically rename a file or directory.
+
+        Both paths must be on the same file system.
+
+        Args:
+            source: Existing path
+            destination: New path, which must not exist
+
+        Raises:
+            FileSystemError: If the destination exists or the rename fails
+        """
+        try:
+            if not source.is_dir():
+                # A link is never created over an existing path
+                os.link(source, destination)
+                os.unlink(source)
+            elif os.name == "posix":
+                # rename() replaces an empty directory, so claim the name first
+                os.mkdir(destination)
+                try:
+                    os.rename(source, destination)
+                except OSError:
+                    with contextlib.suppress(OSError):
+                        os.rmdir(destination)
+                    raise
+            else:
+                os.rename(source, destination)
+        except FileExistsError as e:
+            raise FileSystemError(f"Destination already exists: {destination}") from e
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to move {source} to {destination}: {e}"
+            ) from e
+
+    def remove_directory(self, path: Path) -> None:
+        """
+        Remove a directory and everything below it.
+
+        Args:
+            path: Directory to remove; missing directories are ignored
+
+        Raises:
+            FileSystemError: If removal fails
+        """
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            raise FileSystemError(f"Failed to remove directory {path}: {e}") from e
+
     def file_exists(self, path: Path) -> bool:
         """
         Check if file exists.
@@ -72,3 +224,22 @@ class FileOperations(IFileOperations):
             True if directory exists, False otherwise
         """
         return path.exists() and path.is_dir()
+
+    @staticmethod
+    def _leaf_directories(directories: Set[Path]) -> Set[Path]:
+        """Drop directories that are created implicitly by a descendant."""
+        ancestors = {parent for path in directories for parent in path.parents}
+        return {path for path in directories if path not in ancestors}
+
+    @staticmethod
+    def _write(path: Path, content: str) -> int:
+        """Write a file whose parent exists, returning the bytes written."""
+        data = content.encode("utf-8")
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+        except PermissionError as e:
+            raise FileSystemError(f"Permission denied: {path}") from e
+        except OSError as e:
+            raise FileSystemError(f"Failed to write file {path}: {e}") from e
+        return len(data)
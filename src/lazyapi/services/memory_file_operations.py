@@ -0,0 +1,247 @@
+"""In-memory file system operations service."""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from ..shared.interfaces import IFileOperations, WriteStats
+from ..shared.exceptions import FileSystemError
+
+
+def _rebaser(source_root: str, target_root: str) -> Callable[[str], Optional[str]]:
+    """
+    Build a function mapping paths below source_root to target_root.
+
+    Paths outside source_root map to None.
+    """
+    prefix = os.path.join(source_root, "")
+
+    def rebase(path: str) -> Optional[str]:
+        if path == source_root:
+            return target_root
+        if path.startswith(prefix):
+            return os.path.join(target_root, path[len(prefix) :])
+        return None
+
+    return rebase
+
+
+class InMemoryFileOperations(IFileOperations):
+    """
+    File operations against a virtual tree held in memory.
+
+    Used to stage a complete project before anything touches the disk,
+    which makes dry-runs free and lets the tree be flushed in one batch.
+    Paths are stored as strings: pathlib hashing and parent lookups are
+    the dominant cost when staging thousands of files.
+    """
+
+    def __init__(self):
+        """Initialize an empty virtual tree."""
+        self._files: Dict[str, str] = {}
+        self._directories: Set[str] = set()
+
+    @property
+    def files(self) -> Dict[Path, str]:
+        """Staged files mapped to their content."""
+        return {Path(path): content for path, content in self._files.items()}
+
+    @property
+    def directories(self) -> Set[Path]:
+        """Staged directories, including implicit parents."""
+        return {Path(path) for path in self._directories}
+
+    def create_directory(self, path: Path, parents: bool = True) -> None:
+        """
+        Create a directory.
+
+        Args:
+            path: Directory path to create
+            parents: Create parent directories if needed
+
+        Raises:
+            FileSystemError: If the parent is missing and parents is False
+        """
+        self._create_directory(str(path), parents)
+
+    def read_file(self, path: Path) -> str:
+        """
+        Read the content of a file.
+
+        Args:
+            path: File path to read
+
+        Returns:
+            File content
+
+        Raises:
+            FileSystemError: If the file does not exist
+        """
+        try:
+            return self._files[str(path)]
+        except KeyError:
+            raise FileSystemError(f"Failed to read file {path}: not found") from None
+
+    def list_directory(self, path: Path) -> List[str]:
+        """
+        List the names of the entries of a directory.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            Sorted entry names
+
+        Raises:
+            FileSystemError: If the directory does not exist
+        """
+        key = str(path)
+        if key not in self._directories:
+            raise FileSystemError(f"Failed to list directory {path}: not found")
+        return sorted(
+            os.path.basename(entry)
+            for entries in (self._files, self._directories)
+            for entry in entries
+            if os.path.dirname(entry) == key and entry != key
+        )
+
+    def write_file(self, path: Path, content: str) -> None:
+        """
+        Write content to a file.
+
+        Args:
+            path: File path to write
+            content: Content to write
+
+        Raises:
+            FileSystemError: If the path is a directory
+        """
+        key = str(path)
+        if key in self._directories:
+            raise FileSystemError(f"Failed to write file {path}: is a directory")
+        self._create_directory(os.path.dirname(key), True)
+        self._files[key] = content
+
+    def write_files(
+        self, files: Dict[Path, str], directories: Iterable[Path] = ()
+    ) -> WriteStats:
+        """
+        Write many files and directories in one batch.
+
+        Args:
+            files: Mapping of file path to content
+            directories: Additional (possibly empty) directories to create
+
+        Returns:
+            Throughput report for the batch
+        """
+        start = time.perf_counter()
+        before = len(self._directories)
+        for directory in directories:
+            self.create_directory(directory)
+        for path, content in files.items():
+            self.write_file(path, content)
+        return WriteStats(
+            files=len(files),
+            bytes=sum(len(content.encode("utf-8")) for content in files.values()),
+            directories=len(self._directories) - before,
+            seconds=time.perf_counter() - start,
+        )
+
+    def move(self, source: Path, destination: Path) -> None:
+        """
+        Rename a file or directory within the virtual tree.
+
+        Args:
+            source: Existing path
+            destination: New path, which must not exist
+
+        Raises:
+            FileSystemError: If the source is missing or the destination exists
+        """
+        src, dst = str(source), str(destination)
+        if dst in self._files or dst in self._directories:
+            raise FileSystemError(f"Destination already exists: {destination}")
+        if src not in self._files and src not in self._directories:
+            raise FileSystemError(f"Failed to move {source}: not found")
+
+        rebase = _rebaser(src, dst)
+        self._files = {rebase(p) or p: c for p, c in self._files.items()}
+        self._directories = {rebase(p) or p for p in self._directories}
+        self._create_directory(os.path.dirname(dst), True)
+
+    def remove_directory(self, path: Path) -> None:
+        """
+        Remove a directory and everything below it.
+
+        Args:
+            path: Directory to remove; missing directories are ignored
+        """
+        inside = _rebaser(str(path), str(path))
+        self._files = {p: c for p, c in self._files.items() if inside(p) is None}
+        self._directories = {p for p in self._directories if inside(p) is None}
+
+    def file_exists(self, path: Path) -> bool:
+        """
+        Check if file exists.
+
+        Args:
+            path: File path to check
+
+        Returns:
+            True if file exists, False otherwise
+        """
+        return str(path) in self._files
+
+    def directory_exists(self, path: Path) -> bool:
+        """
+        Check if directory exists.
+
+        Args:
+            path: Directory path to check
+
+        Returns:
+            True if directory exists, False otherwise
+        """
+        return str(path) in self._directories
+
+    def flush(
+        self, target: IFileOperations, source_root: Path, target_root: Path
+    ) -> WriteStats:
+        """
+        Write the staged tree below source_root to another file system.
+
+        Args:
+            target: File operations to write through
+            source_root: Root of the staged tree to flush
+            target_root: Directory that takes the place of source_root
+
+        Returns:
+            Throughput report for the batch
+        """
+        rebase = _rebaser(str(source_root), str(target_root))
+        files = {}
+        for path, content in self._files.items():
+            rebased = rebase(path)
+            if rebased is not None:
+                files[Path(rebased)] = content
+        directories = [
+            Path(rebased)
+            for rebased in map(rebase, self._directories)
+            if rebased is not None
+        ]
+        return target.write_files(files, directories=directories)
+
+    def _create_directory(self, path: str, parents: bool) -> None:
+        """Record a directory and, up to the first known one, its ancestors."""
+        if path in self._directories:
+            return
+        if path in self._files:
+            raise FileSystemError(f"Failed to create directory {path}: is a file")
+        parent = os.path.dirname(path)
+        if not parents and parent != path and parent not in self._directories:
+            raise FileSystemError(f"Failed to create directory {path}: no parent")
+        self._directories.add(path)
+        while parent != path and parent not in self._directories:
+            self._directories.add(parent)
+            path, parent = parent, os.path.dirname(parent)
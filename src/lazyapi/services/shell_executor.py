@@ -3,8 +3,9 @@
 import subprocess
 from pathlib import Path
 from typing import List, Optional
-from ..shared.interfaces import ICommandExecutor
+from ..shared.interfaces import ICommandExecutor, ITracer
 from ..shared.exceptions import CommandExecutionError
+from .tracer import NullTracer
 
 
 class ShellExecutor(ICommandExecutor):
@@ -14,6 +15,15 @@ class ShellExecutor(ICommandExecutor):
     No knowledge of any specific commands - pure execution.
     """
 
+    def __init__(self, tracer: Optional[ITracer] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            tracer: Tracer receiving a span per executed process
+        """
+        self._tracer = tracer or NullTracer()
+
     def execute(self, command: List[str], cwd: Optional[Path] = None) -> None:
         """
         Execute a shell command.
@@ -26,13 +36,14 @@ class ShellExecutor(ICommandExecutor):
             CommandExecutionError: If execution fails
         """
         try:
-            subprocess.run(
-                command,
-                cwd=cwd,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            with self._tracer.span(" ".join(command), "process", cwd=str(cwd)):
+                subprocess.run(
+                    command,
+                    cwd=cwd,
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
         except subprocess.CalledProcessError as e:
             raise CommandExecutionError(
                 f"Command '{' '.join(command)}' failed: {e.stderr}"
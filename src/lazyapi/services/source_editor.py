@@ -0,0 +1,502 @@
+"""Syntax-aware editing of Python modules - feature-agnostic service."""
+
+import ast
+import bisect
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from ..shared.interfaces import IFileOperations
+from ..shared.exceptions import LazyAPIError
+
+
+class ParseCache:
+    """
+    Least-recently-used cache of parsed modules keyed by content hash.
+
+    Identical sources share one tree, so a module is parsed once no matter
+    how many edits, editors or re-reads touch it.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Number of trees kept before the oldest is dropped
+        """
+        self._max_entries = max_entries
+        self._trees: "OrderedDict[str, ast.Module]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, source: str, origin: str = "<module>") -> ast.Module:
+        """
+        Return the tree of a module, parsing it only on a cache miss.
+
+        Args:
+            source: Module source
+            origin: Name used in error messages
+
+        Returns:
+            Parsed module; callers must not mutate it
+
+        Raises:
+            LazyAPIError: If the source is not valid Python
+        """
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        tree = self._trees.get(digest)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(digest)
+            return tree
+        self.misses += 1
+        try:
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            raise LazyAPIError(f"Cannot parse {origin}: {e}") from e
+        self._trees[digest] = tree
+        if len(self._trees) > self._max_entries:
+            self._trees.popitem(last=False)
+        return tree
+
+
+_DEFAULT_CACHE = ParseCache()
+
+
+@dataclass
+class _Import:
+    module: str
+    name: str
+    alias: Optional[str]
+
+
+@dataclass
+class _Call:
+    target: str
+    method: str
+    argument: str
+
+
+@dataclass
+class _Shutdown:
+    function: str
+    statement: str
+
+
+@dataclass
+class _Field:
+    class_name: str
+    name: str
+    annotation: str
+    default: Optional[str]
+    comment: Optional[str]
+
+
+class SourceEditor:
+    """
+    Queue edits against Python modules and apply them in one pass.
+
+    Each module is read and parsed once per editor; anchors for every
+    queued edit are located on that single tree and all insertions are
+    spliced into the original text together, so comments and formatting
+    outside the insertions are preserved. Edits that already exist in the
+    module are skipped, which makes re-running a generator harmless.
+    """
+
+    def __init__(self, file_ops: IFileOperations, cache: Optional[ParseCache] = None):
+        """
+        Initialize with dependencies.
+
+        Args:
+            file_ops: File operations used to read and write modules
+            cache: Parse cache (default: shared process-wide cache)
+        """
+        self._file_ops = file_ops
+        self._cache = cache or _DEFAULT_CACHE
+        self._sources: Dict[Path, str] = {}
+        self._edits: Dict[Path, List[object]] = {}
+
+    def source(self, path: Path) -> str:
+        """
+        Return the current content of a module, reading it at most once.
+
+        Args:
+            path: Module path
+
+        Returns:
+            Module source before any queued edits
+        """
+        if path not in self._sources:
+            self._sources[path] = self._file_ops.read_file(path)
+        return self._sources[path]
+
+    def add_import(
+        self, path: Path, module: str, name: str, alias: Optional[str] = None
+    ) -> None:
+        """
+        Queue ``from <module> import <name> [as <alias>]``.
+
+        The import goes to its sorted position in the group of top-level
+        imports from the same package, or starts a new group of its own,
+        so the module stays isort-clean.
+
+        Args:
+            path: Module to edit
+            module: Module to import from (may be relative, e.g. ``.routers``)
+            name: Imported name
+            alias: Optional local name
+        """
+        self._queue(path, _Import(module, name, alias))
+
+    def add_call(self, path: Path, target: str, method: str, argument: str) -> None:
+        """
+        Queue a top-level ``<target>.<method>(<argument>)`` statement.
+
+        The statement goes after the last call of the same method on
+        ``target``, or after the assignment of ``target``.
+
+        Args:
+            path: Module to edit
+            target: Name of the object, e.g. ``app``
+            method: Method to call, e.g. ``include_router``
+            argument: Argument source, e.g. ``users_router``
+        """
+        self._queue(path, _Call(target, method, argument))
+
+    def add_shutdown(self, path: Path, function: str, statement: str) -> None:
+        """
+        Queue a statement in the shutdown half of a lifespan function.
+
+        The statement goes right after the ``yield`` of the top-level
+        function, so it runs before the shutdown steps already there.
+
+        Args:
+            path: Module to edit
+            function: Name of the generator function, e.g. ``lifespan``
+            statement: Statement source, e.g. ``await close_jobs()``
+        """
+        self._queue(path, _Shutdown(function, statement))
+
+    def add_field(
+        self,
+        path: Path,
+        class_name: str,
+        name: str,
+        annotation: str,
+        default: Optional[str] = None,
+        comment: Optional[str] = None,
+    ) -> None:
+        """
+        Queue an annotated field in a top-level class, e.g. a settings entry.
+
+        The field goes after the last annotated field of the class. A
+        ``comment`` starts a new section: it is written above the field,
+        after a blank line.
+
+        Args:
+            path: Module to edit
+            class_name: Class receiving the field
+            name: Field name
+            annotation: Type annotation source
+            default: Optional default value source
+            comment: Optional section comment, without the leading ``#``
+        """
+        self._queue(path, _Field(class_name, name, annotation, default, comment))
+
+    def render(self) -> Dict[Path, str]:
+        """
+        Apply all queued edits in memory.
+
+        Returns:
+            New content of every module that changed
+
+        Raises:
+            LazyAPIError: If a module cannot be parsed, an anchor is missing
+                or the edited module is not valid Python
+        """
+        changed = {}
+        for path, edits in self._edits.items():
+            source = self.source(path)
+            edited = self._apply(source, edits, str(path))
+            if edited != source:
+                self._cache.parse(edited, str(path))
+                changed[path] = edited
+        return changed
+
+    def commit(self) -> Dict[Path, str]:
+        """
+        Apply all queued edits and write changed modules in one batch.
+
+        Returns:
+            New content of every module that changed
+        """
+        changed = self.render()
+        if changed:
+            self._file_ops.write_files(changed)
+        self._sources.update(changed)
+        self._edits.clear()
+        return changed
+
+    def _queue(self, path: Path, edit: object) -> None:
+        self._edits.setdefault(path, []).append(edit)
+
+    def _apply(self, source: str, edits: List[object], origin: str) -> str:
+        """Locate anchors for all edits on one tree and splice them in."""
+        tree = self._cache.parse(source, origin)
+        inserts: Dict[int, List[str]] = {}
+
+        def insert(line: int, text: str) -> None:
+            inserts.setdefault(line, []).append(text)
+
+        imports = [e for e in edits if isinstance(e, _Import)]
+        if imports:
+            existing = _imported(tree)
+            groups = _import_groups(tree)
+            slots = _import_slots(groups)
+            new_groups: Dict[bool, List[str]] = {}
+            ordered = sorted(
+                ((_sort_key(e.module), e) for e in imports), key=lambda pair: pair[0]
+            )
+            for order, edit in ordered:
+                key = (edit.module, edit.name, edit.alias)
+                if key in existing:
+                    continue
+                existing.add(key)
+                alias = f" as {edit.alias}" if edit.alias else ""
+                text = f"from {edit.module} import {edit.name}{alias}\n"
+                slot = slots.get(_package(edit.module))
+                if slot is None:
+                    new_groups.setdefault(edit.module.startswith("."), []).append(text)
+                    continue
+                orders, lines = slot
+                insert(lines[bisect.bisect_right(orders, order)], text)
+            for relative, texts in new_groups.items():
+                local = [g for g in groups if _node_module(g[0]).startswith(".")]
+                if not groups:
+                    for text in texts:
+                        insert(_last_import(tree), text)
+                elif not relative and local:
+                    # Packages go before the relative imports
+                    line = local[0][0].lineno - 1
+                    for text in [*texts, "\n"]:
+                        insert(line, text)
+                else:
+                    for text in ["\n", *texts]:
+                        insert(groups[-1][-1].end_lineno, text)
+
+        calls: Dict[Tuple[str, str], List[_Call]] = {}
+        for edit in edits:
+            if isinstance(edit, _Call):
+                calls.setdefault((edit.target, edit.method), []).append(edit)
+        for (target, method), group in calls.items():
+            anchor, existing_args = _call_anchor(tree, target, method, origin)
+            new = []
+            for edit in group:
+                argument = _normalize(edit.argument, origin)
+                if argument not in existing_args:
+                    existing_args.add(argument)
+                    new.append(f"{target}.{method}({edit.argument})\n")
+            if new and anchor.blank_line:
+                new.insert(0, "\n")
+            for text in new:
+                insert(anchor.line, text)
+
+        functions: Dict[str, Tuple[int, str, set]] = {}
+        for edit in edits:
+            if isinstance(edit, _Shutdown):
+                if edit.function not in functions:
+                    functions[edit.function] = _yield_anchor(
+                        tree, edit.function, origin
+                    )
+                line, indent, statements = functions[edit.function]
+                statement = _normalize_statement(edit.statement, origin)
+                if statement not in statements:
+                    statements.add(statement)
+                    insert(line, f"{indent}{edit.statement}\n")
+
+        classes: Dict[str, Tuple[int, str, set]] = {}
+        for edit in edits:
+            if isinstance(edit, _Field):
+                if edit.class_name not in classes:
+                    classes[edit.class_name] = _field_anchor(
+                        tree, edit.class_name, origin
+                    )
+                line, indent, names = classes[edit.class_name]
+                if edit.name not in names:
+                    names.add(edit.name)
+                    default = f" = {edit.default}" if edit.default is not None else ""
+                    if edit.comment is not None:
+                        insert(line, f"\n{indent}# {edit.comment}\n")
+                    insert(line, f"{indent}{edit.name}: {edit.annotation}{default}\n")
+
+        if not inserts:
+            return source
+        lines = source.splitlines(keepends=True)
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        out = inserts.get(0, [])[:]
+        for number, line in enumerate(lines, start=1):
+            out.append(line)
+            out.extend(inserts.get(number, ()))
+        return "".join(out)
+
+
+@dataclass
+class _Anchor:
+    line: int
+    blank_line: bool
+
+
+def _normalize(expression: str, origin: str) -> str:
+    """Canonical source of an expression, for comparing call arguments."""
+    try:
+        return ast.unparse(ast.parse(expression, mode="eval").body)
+    except SyntaxError as e:
+        raise LazyAPIError(f"Invalid expression for {origin}: {expression}") from e
+
+
+def _normalize_statement(statement: str, origin: str) -> str:
+    """Canonical source of a statement, for comparing lifespan steps."""
+    try:
+        return ast.unparse(ast.parse(statement))
+    except SyntaxError as e:
+        raise LazyAPIError(f"Invalid statement for {origin}: {statement}") from e
+
+
+def _imported(tree: ast.Module) -> set:
+    """Collect (module, name, alias) of all top-level from-imports."""
+    found = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            found.update((module, a.name, a.asname) for a in node.names)
+    return found
+
+
+def _node_module(node: ast.stmt) -> str:
+    """Module named by an import statement, with leading dots if relative."""
+    if isinstance(node, ast.ImportFrom):
+        return "." * node.level + (node.module or "")
+    return node.names[0].name
+
+
+def _sort_key(module: str) -> Tuple[int, int, str]:
+    """isort order: packages by name, then relative imports furthest first."""
+    stripped = module.lstrip(".")
+    level = len(module) - len(stripped)
+    return (1, -level, stripped.lower()) if level else (0, 0, module.lower())
+
+
+def _import_groups(tree: ast.Module) -> List[List[ast.stmt]]:
+    """Top-level imports split into groups of consecutive lines."""
+    groups: List[List[ast.stmt]] = []
+    previous = None
+    for node in tree.body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            previous = None
+            continue
+        if previous is not None and node.lineno == previous.end_lineno + 1:
+            groups[-1].append(node)
+        else:
+            groups.append([node])
+        previous = node
+    return groups
+
+
+def _package(module: str) -> str:
+    """Top-level package of an import, or ``.`` for relative imports."""
+    return "." if module.startswith(".") else module.split(".")[0]
+
+
+def _import_slots(
+    groups: List[List[ast.stmt]],
+) -> Dict[str, Tuple[List[Tuple[int, int, str]], List[int]]]:
+    """
+    Map each package to the sorted insertion points of its import group.
+
+    ``lines[i]`` is the line after which an import sorting between
+    ``orders[i - 1]`` and ``orders[i]`` goes; the last entry ends the group.
+    """
+    slots: Dict[str, Tuple[List[Tuple[int, int, str]], List[int]]] = {}
+    for group in groups:
+        modules = [_node_module(node) for node in group]
+        orders = [_sort_key(module) for module in modules]
+        lines = [node.lineno - 1 for node in group] + [group[-1].end_lineno]
+        for module in modules:
+            slots.setdefault(_package(module), (orders, lines))
+    return slots
+
+
+def _last_import(tree: ast.Module) -> int:
+    """Line after which new imports go: last import, docstring or top."""
+    line = 0
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            line = node.end_lineno
+    if line == 0 and ast.get_docstring(tree) is not None:
+        line = tree.body[0].end_lineno
+    return line
+
+
+def _call_anchor(
+    tree: ast.Module, target: str, method: str, origin: str
+) -> Tuple[_Anchor, set]:
+    """Find where ``target.method(...)`` calls go and the arguments present."""
+    assignment = None
+    last_call = None
+    arguments = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Name) and t.id == target for t in targets):
+                assignment = node.end_lineno
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and node.value.func.attr == method
+            and isinstance(node.value.func.value, ast.Name)
+            and node.value.func.value.id == target
+        ):
+            last_call = node.end_lineno
+            arguments.update(ast.unparse(arg) for arg in node.value.args)
+    if last_call is not None:
+        return _Anchor(last_call, False), arguments
+    if assignment is None:
+        raise LazyAPIError(f"Cannot find '{target} = ...' in {origin}")
+    return _Anchor(assignment, True), arguments
+
+
+def _yield_anchor(tree: ast.Module, function: str, origin: str) -> Tuple[int, str, set]:
+    """Find the ``yield`` of a function, its indentation and the statements."""
+    for node in tree.body:
+        if (
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == function
+        ):
+            statements = {ast.unparse(n) for n in node.body}
+            for child in node.body:
+                if isinstance(child, ast.Expr) and isinstance(child.value, ast.Yield):
+                    return child.end_lineno, " " * child.col_offset, statements
+            raise LazyAPIError(f"Cannot find 'yield' in '{function}' in {origin}")
+    raise LazyAPIError(f"Cannot find function '{function}' in {origin}")
+
+
+def _field_anchor(
+    tree: ast.Module, class_name: str, origin: str
+) -> Tuple[int, str, set]:
+    """Find where fields of a class go, their indentation and existing names."""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            fields = [n for n in node.body if isinstance(n, ast.AnnAssign)]
+            names = {n.target.id for n in fields if isinstance(n.target, ast.Name)}
+            first = node.body[0]
+            indent = " " * first.col_offset
+            if fields:
+                return fields[-1].end_lineno, indent, names
+            if ast.get_docstring(node) is not None:
+                return first.end_lineno, indent, names
+            return node.body[0].lineno - 1, indent, names
+    raise LazyAPIError(f"Cannot find class '{class_name}' in {origin}")
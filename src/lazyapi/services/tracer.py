@@ -0,0 +1,127 @@
+"""Generic tracing services."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Collection, ContextManager, Dict, List
+from ..shared.interfaces import ITracer
+
+
+class _NullSpan:
+    """Reusable no-op span."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> Dict[str, Any]:
+        return {}
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer(ITracer):
+    """Tracer that records nothing; the default when profiling is off."""
+
+    def span(self, name: str, category: str, **args: Any) -> ContextManager:
+        """Return a shared no-op context manager."""
+        return _NULL_SPAN
+
+
+class _Span:
+    """Context manager recording one complete trace event."""
+
+    __slots__ = ("_tracer", "_event", "_start")
+
+    def __init__(self, tracer: "Tracer", event: Dict[str, Any]):
+        self._tracer = tracer
+        self._event = event
+
+    def __enter__(self) -> Dict[str, Any]:
+        self._start = time.perf_counter()
+        return self._event["args"]
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        self._event["ts"] = (self._start - self._tracer.origin) * 1e6
+        self._event["dur"] = (end - self._start) * 1e6
+        if exc_type is not None:
+            self._event["args"]["error"] = str(exc)
+        self._tracer.record(self._event)
+
+
+class Tracer(ITracer):
+    """
+    Record spans as Chrome trace events.
+
+    The output loads in chrome://tracing or Perfetto. Spans from different
+    threads end up on separate tracks, so concurrent commands are visible.
+    """
+
+    def __init__(self):
+        """Initialize an empty trace."""
+        self.origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str, **args: Any) -> ContextManager:
+        """
+        Time a block of work.
+
+        The context manager yields the span's ``args`` dict, so details
+        known only at the end of the step can still be attached.
+        """
+        return _Span(
+            self,
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            },
+        )
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Store a finished event."""
+        with self._lock:
+            self._events.append(event)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Finished events in start order."""
+        with self._lock:
+            return sorted(self._events, key=lambda event: event["ts"])
+
+    def slowest(
+        self, limit: int = 10, exclude: Collection[str] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the slowest recorded steps.
+
+        Args:
+            limit: Maximum number of events to return
+            exclude: Categories to leave out
+
+        Returns:
+            Events ordered by decreasing duration
+        """
+        events = [event for event in self.events if event["cat"] not in exclude]
+        return sorted(events, key=lambda event: event["dur"], reverse=True)[:limit]
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """
+        Write the trace in Chrome trace event format.
+
+        Args:
+            path: JSON file to write
+        """
+        path.write_text(
+            json.dumps({"traceEvents": self.events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
@@ -0,0 +1,174 @@
+"""Generic directory tree copy service with cheap file cloning."""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Collection, Dict, List, Optional
+from ..shared.exceptions import FileSystemError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (Linux copy-on-write clone)
+_FICLONE = 0x40049409
+
+
+class TreeCopier:
+    """
+    Copy directory trees as cheaply as the file system allows.
+
+    Regular files are cloned with copy-on-write reflinks where supported
+    and copied otherwise. Files below ``hardlink`` prefixes are hard-linked,
+    which is how uv itself populates virtual environments from its cache.
+    """
+
+    def __init__(self):
+        """Initialize clone capability detection."""
+        self._reflink_supported = fcntl is not None
+
+    def copy_tree(
+        self,
+        source: Path,
+        destination: Path,
+        hardlink: Collection[str] = (),
+        rewrite: Collection[str] = (),
+        replacements: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Copy a directory tree.
+
+        Args:
+            source: Directory to copy from
+            destination: Directory to create
+            hardlink: Relative path prefixes whose files are hard-linked
+            rewrite: Relative paths of text files to re-render
+            replacements: Substitutions applied to files in ``rewrite``
+
+        Raises:
+            FileSystemError: If copying fails
+        """
+        rewrite = set(rewrite)
+        replacements = replacements or {}
+        try:
+            destination.mkdir(parents=True, exist_ok=False)
+            for dirpath, dirnames, filenames in os.walk(source):
+                rel_dir = os.path.relpath(dirpath, source)
+                target_dir = os.path.join(destination, rel_dir)
+                for name in list(dirnames):
+                    src = os.path.join(dirpath, name)
+                    if os.path.islink(src):
+                        os.symlink(os.readlink(src), os.path.join(target_dir, name))
+                        dirnames.remove(name)
+                    else:
+                        os.mkdir(os.path.join(target_dir, name))
+                for name in filenames:
+                    rel = os.path.normpath(os.path.join(rel_dir, name))
+                    src = os.path.join(dirpath, name)
+                    dst = os.path.join(target_dir, name)
+                    if os.path.islink(src):
+                        os.symlink(os.readlink(src), dst)
+                    elif rel in rewrite:
+                        self._render(src, dst, replacements)
+                    elif any(rel.startswith(prefix + os.sep) for prefix in hardlink):
+                        self._link(src, dst)
+                    else:
+                        self._clone(src, dst)
+        except OSError as e:
+            raise FileSystemError(
+                f"Failed to copy {source} to {destination}: {e}"
+            ) from e
+
+    def find_files_containing(
+        self, root: Path, needles: Collection[str], exclude: Collection[str] = ()
+    ) -> List[str]:
+        """
+        Find text files that contain any of the given strings.
+
+        Args:
+            root: Directory to search
+            needles: Strings to look for
+            exclude: Relative directory paths that are not searched
+
+        Returns:
+            Relative paths of matching files
+        """
+        encoded = [needle.encode("utf-8") for needle in needles]
+        matches = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel_dir = os.path.relpath(dirpath, root)
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if os.path.normpath(os.path.join(rel_dir, name)) not in exclude
+            ]
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if os.path.islink(path):
+                    continue
+                with open(path, "rb") as f:
+                    data = f.read()
+                if b"\0" in data or not any(needle in data for needle in encoded):
+                    continue
+                try:
+                    data.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+                matches.append(os.path.relpath(path, root))
+        return matches
+
+    def rewrite_files(
+        self, root: Path, paths: Collection[str], replacements: Dict[str, str]
+    ) -> None:
+        """
+        Apply substitutions to text files in place.
+
+        Each file is replaced rather than modified, so hard links to it
+        are left untouched.
+
+        Args:
+            root: Directory the paths are relative to
+            paths: Relative paths of text files to rewrite
+            replacements: Substitutions to apply
+
+        Raises:
+            FileSystemError: If rewriting fails
+        """
+        for rel in paths:
+            path = os.path.join(root, rel)
+            tmp = f"{path}.lazyapi-tmp"
+            try:
+                self._render(path, tmp, replacements)
+                os.replace(tmp, path)
+            except OSError as e:
+                raise FileSystemError(f"Failed to rewrite {path}: {e}") from e
+
+    def _render(self, src: str, dst: str, replacements: Dict[str, str]) -> None:
+        """Write a copy of a text file with substitutions applied."""
+        with open(src, encoding="utf-8", newline="") as f:
+            content = f.read()
+        for old, new in replacements.items():
+            content = content.replace(old, new)
+        with open(dst, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        shutil.copymode(src, dst)
+
+    def _link(self, src: str, dst: str) -> None:
+        """Hard-link a file, falling back to a clone across devices."""
+        try:
+            os.link(src, dst)
+        except OSError:
+            self._clone(src, dst)
+
+    def _clone(self, src: str, dst: str) -> None:
+        """Reflink a file where supported, otherwise copy it."""
+        if self._reflink_supported:
+            try:
+                with open(src, "rb") as s, open(dst, "wb") as d:
+                    fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                self._reflink_supported = False
+        shutil.copy2(src, dst)
@@ -5,12 +5,15 @@ from .exceptions import (
     ValidationError,
     FileSystemError,
     CommandExecutionError,
+    TemplateError,
 )
 from .interfaces import (
     IValidator,
     IFileOperations,
     ICommandExecutor,
     IContentGenerator,
+    ITracer,
+    WriteStats,
 )
 from .base_validator import CompositeValidator
 
@@ -19,9 +22,12 @@ __all__ = [
     "ValidationError",
     "FileSystemError",
     "CommandExecutionError",
+    "TemplateError",
     "IValidator",
     "IFileOperations",
     "ICommandExecutor",
     "IContentGenerator",
+    "ITracer",
+    "WriteStats",
     "CompositeValidator",
 ]
@@ -1,7 +1,15 @@
 """Generic content generators - feature-agnostic utilities."""
 
-from typing import Dict, Any
+import functools
+import hashlib
+from typing import Any, Dict, Iterable, List
 from .interfaces import IContentGenerator
+from .template_engine import compile_template
+
+
+def _short_hash(text: str) -> str:
+    """Return a short, stable identifier for template text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
 
 
 class EmptyFileGenerator(IContentGenerator):
@@ -15,6 +23,11 @@ class EmptyFileGenerator(IContentGenerator):
         """Generate empty file content."""
         return ""
 
+    @property
+    def version(self) -> str:
+        """Empty files never change."""
+        return "empty"
+
 
 class StaticContentGenerator(IContentGenerator):
     """
@@ -36,12 +49,19 @@ class StaticContentGenerator(IContentGenerator):
         """Return the static content."""
         return self._content
 
+    @functools.cached_property
+    def version(self) -> str:
+        """Short hash of the static content, computed once."""
+        return _short_hash(self._content)
+
 
 class TemplateContentGenerator(IContentGenerator):
     """
-    Generate content using template string formatting.
+    Generate content from a compiled template.
 
-    Generic utility for simple string interpolation.
+    Generic utility for template rendering; see ``template_engine`` for
+    the syntax. The template is compiled on first use and shared through
+    the process-wide template cache.
     """
 
     def __init__(self, template: str):
@@ -49,18 +69,35 @@ class TemplateContentGenerator(IContentGenerator):
         Initialize with template string.
 
         Args:
-            template: Template string with {key} placeholders
+            template: Template source with {{ key }} slots
         """
         self._template = template
 
     def generate(self, context: Dict[str, Any]) -> str:
         """
-        Generate content by formatting template with context.
+        Generate content by rendering the template with context.
+
+        Args:
+            context: Dictionary with values for slots
+
+        Returns:
+            Rendered string
+        """
+        return compile_template(self._template).render(context)
+
+    def generate_many(self, contexts: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Render the template once per context.
 
         Args:
-            context: Dictionary with values for placeholders
+            contexts: One context per output
 
         Returns:
-            Formatted string
+            Rendered strings in input order
         """
-        return self._template.format(**context)
+        return compile_template(self._template).render_many(contexts)
+
+    @functools.cached_property
+    def version(self) -> str:
+        """Short hash of the template source, computed once."""
+        return _short_hash(self._template)
@@ -23,3 +23,9 @@ class CommandExecutionError(LazyAPIError):
     """Raised when command execution fails."""
 
     pass
+
+
+class TemplateError(LazyAPIError):
+    """Raised when a template cannot be compiled or rendered."""
+
+    pass
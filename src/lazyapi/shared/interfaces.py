@@ -1,8 +1,29 @@
 """Generic interfaces following Interface Segregation Principle."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Any, Dict
+from typing import ContextManager, Iterable, List, Any, Dict
+
+
+@dataclass
+class WriteStats:
+    """Throughput report for a batch of file writes."""
+
+    files: int
+    bytes: int
+    directories: int
+    seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        """Files written per second."""
+        return self.files / self.seconds if self.seconds else float("inf")
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Bytes written per second."""
+        return self.bytes / self.seconds if self.seconds else float("inf")
 
 
 class IValidator(ABC):
@@ -35,11 +56,47 @@ class IFileOperations(ABC):
         """Create a directory."""
         pass
 
+    @abstractmethod
+    def read_file(self, path: Path) -> str:
+        """Read the content of a file."""
+        pass
+
+    @abstractmethod
+    def list_directory(self, path: Path) -> List[str]:
+        """List the names of the entries of a directory."""
+        pass
+
     @abstractmethod
     def write_file(self, path: Path, content: str) -> None:
         """Write content to a file."""
         pass
 
+    @abstractmethod
+    def write_files(
+        self, files: Dict[Path, str], directories: Iterable[Path] = ()
+    ) -> WriteStats:
+        """
+        Write many files and directories in one batch.
+
+        Args:
+            files: Mapping of file path to content
+            directories: Additional (possibly empty) directories to create
+
+        Returns:
+            Throughput report for the batch
+        """
+        pass
+
+    @abstractmethod
+    def move(self, source: Path, destination: Path) -> None:
+        """Atomically rename a file or directory."""
+        pass
+
+    @abstractmethod
+    def remove_directory(self, path: Path) -> None:
+        """Remove a directory and everything below it."""
+        pass
+
     @abstractmethod
     def file_exists(self, path: Path) -> bool:
         """Check if file exists."""
@@ -65,6 +122,29 @@ class ICommandExecutor(ABC):
         """
         pass
 
+    def terminate(self) -> None:
+        """Stop every running command; the default runs none in the background."""
+        pass
+
+
+class ITracer(ABC):
+    """Generic tracing interface."""
+
+    @abstractmethod
+    def span(self, name: str, category: str, **args: Any) -> ContextManager:
+        """
+        Time a block of work.
+
+        Args:
+            name: Human-readable step name
+            category: Step kind, e.g. "phase", "file" or "command"
+            args: Extra details recorded with the span
+
+        Returns:
+            Context manager covering the step
+        """
+        pass
+
 
 class IContentGenerator(ABC):
     """Generic content generation interface."""
@@ -81,3 +161,14 @@ class IContentGenerator(ABC):
             Generated content as string
         """
         pass
+
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """Identifier that changes whenever the generated output may change."""
+        pass
+
+    @property
+    def name(self) -> str:
+        """Name under which project indexes record this generator."""
+        return type(self).__name__
@@ -0,0 +1,204 @@
+"""Persistent project index - feature-agnostic utility.
+
+Every generated project carries ``.lazyapi/index``, a JSON document
+recording its layout, features, routers and resources, a hash of every
+generated file and the version of the template that produced it. Commands
+that operate on an existing project read this single file instead of
+scanning the source tree, and update it after each change.
+"""
+
+import functools
+import hashlib
+import json
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .interfaces import IContentGenerator, IFileOperations
+from .exceptions import ValidationError
+
+INDEX_PATH = Path(".lazyapi") / "index"
+INDEX_FORMAT = 1
+
+
+def content_hash(content: str) -> str:
+    """Return the hash recorded for generated content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@functools.cache
+def _lazyapi_version() -> str:
+    try:
+        return metadata.version("lazyapi")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@dataclass
+class ProjectIndex:
+    """
+    Index of a generated project.
+
+    ``files`` and ``features`` are keyed by POSIX paths relative to the
+    project root and by feature name respectively. ``template_pack`` is the
+    pack the layout was loaded from, if any, and ``options`` holds the
+    generation options chosen at ``init``. ``project_feature_options`` are
+    options every feature of the project uses, such as load-test scenarios.
+    """
+
+    project_name: str
+    layout: str
+    lazyapi_version: str = field(default_factory=_lazyapi_version)
+    features: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    files: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    templates: Dict[str, str] = field(default_factory=dict)
+    template_pack: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)
+    project_feature_options: List[str] = field(default_factory=list)
+    # Hash of every distinct content recorded, so repeats are hashed once
+    _hashes: Dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def record_file(
+        self, path: str, content: str, generator: Optional[IContentGenerator] = None
+    ) -> None:
+        """
+        Record the hash of a generated file and the template behind it.
+
+        Args:
+            path: POSIX path relative to the project root
+            content: Content as written
+            generator: Generator that produced the content; None keeps the
+                recorded generator, e.g. when a generated module is edited
+        """
+        digest = self._hashes.get(content)
+        if digest is None:
+            digest = self._hashes[content] = content_hash(content)
+        entry = self.files.setdefault(path, {})
+        entry["hash"] = digest
+        if generator is not None:
+            entry["generator"] = generator.name
+            self.templates[generator.name] = generator.version
+
+    def add_feature(
+        self, name: str, router: str, options: Optional[List[str]] = None
+    ) -> None:
+        """
+        Record a feature.
+
+        Args:
+            name: Feature name
+            router: Module exporting the feature router
+            options: Generation options the feature uses
+        """
+        entry = self.features.setdefault(name, {"router": router, "resources": {}})
+        if options:
+            entry["options"] = sorted(options)
+
+    def add_resource(self, feature: str, name: str, router: str) -> None:
+        """
+        Record a resource of a known feature.
+
+        Args:
+            feature: Feature name
+            name: Resource name
+            router: Module exporting the resource router
+        """
+        self.features[feature]["resources"][name] = {"router": router}
+
+    def has_feature(self, name: str) -> bool:
+        """Whether the project contains a feature."""
+        return name in self.features
+
+    def feature_options(self, feature: str) -> List[str]:
+        """Generation options a feature was created with."""
+        return list(self.features.get(feature, {}).get("options", []))
+
+    def resources(self, feature: str) -> List[str]:
+        """Names of the resources of a feature, in creation order."""
+        return list(self.features.get(feature, {}).get("resources", {}))
+
+    def to_json(self) -> str:
+        """
+        Serialize the index.
+
+        The document is compact because indented output bypasses the C
+        JSON encoder, which made writing large indexes several times slower.
+        """
+        return (
+            json.dumps(
+                {
+                    "format": INDEX_FORMAT,
+                    "project_name": self.project_name,
+                    "layout": self.layout,
+                    "lazyapi_version": self.lazyapi_version,
+                    "features": self.features,
+                    "files": dict(sorted(self.files.items())),
+                    "templates": dict(sorted(self.templates.items())),
+                    "template_pack": self.template_pack,
+                    "options": self.options,
+                    "project_feature_options": self.project_feature_options,
+                },
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+
+    @classmethod
+    def from_json(cls, source: str, origin: str = str(INDEX_PATH)) -> "ProjectIndex":
+        """
+        Parse a serialized index.
+
+        Args:
+            source: JSON document
+            origin: Name used in error messages
+
+        Returns:
+            Parsed index
+
+        Raises:
+            ValidationError: If the document is not a supported index
+        """
+        try:
+            data = json.loads(source)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Corrupt project index {origin}: {e}") from e
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT:
+            raise ValidationError(f"Unsupported project index format in {origin}")
+        try:
+            return cls(
+                project_name=data["project_name"],
+                layout=data["layout"],
+                lazyapi_version=data["lazyapi_version"],
+                features=data["features"],
+                files=data["files"],
+                templates=data["templates"],
+                template_pack=data.get("template_pack"),
+                options=data.get("options", {}),
+                project_feature_options=data.get("project_feature_options", []),
+            )
+        except KeyError as e:
+            raise ValidationError(f"Project index {origin} lacks {e}") from e
+
+    @classmethod
+    def load(
+        cls, file_ops: IFileOperations, project_path: Path
+    ) -> Optional["ProjectIndex"]:
+        """
+        Read the index of a project.
+
+        Args:
+            file_ops: File operations service
+            project_path: Project root
+
+        Returns:
+            The index, or None if the project has none
+
+        Raises:
+            ValidationError: If the index is corrupt
+        """
+        path = project_path / INDEX_PATH
+        if not file_ops.file_exists(path):
+            return None
+        return cls.from_json(file_ops.read_file(path), str(path))
@@ -0,0 +1,439 @@
+"""Compiled template engine - feature-agnostic utility.
+
+Templates use a small Jinja-like syntax::
+
+    {{ project_name }}                 slot, optionally with filters: {{ name | pascal }}
+    {% if serializer == "orjson" %}    conditionals with elif/else/endif
+    {% for route in routes %}          loops with endfor; `loop.index`, `loop.last`
+
+A block tag that sits alone on its line consumes that whole line, so
+generated Python code keeps its layout. Literal braces need no escaping;
+text that contains ``{{`` or ``{%`` goes between ``{% raw %}`` and
+``{% endraw %}`` and is copied unchanged.
+
+Each template source is parsed once into a Python render function made of
+literal chunks and slot lookups; compiled templates are cached for the
+whole process.
+"""
+
+import ast
+import functools
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+from .exceptions import TemplateError
+
+_TAG = re.compile(r"\{\{(.*?)\}\}|\{%(.*?)%\}", re.DOTALL)
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<str>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+        |(?P<num>\d+)
+        |(?P<op>==|!=|\||\(|\))
+        |(?P<name>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)
+    )""",
+    re.VERBOSE,
+)
+_ENDRAW = re.compile(r"\{%\s*endraw\s*%\}")
+_KEYWORDS = {"and", "or", "not", "in"}
+_CONSTANTS = {"true": "True", "false": "False", "none": "None"}
+
+
+def _to_words(value: str) -> List[str]:
+    return [w for w in re.split(r"[^A-Za-z0-9]+|(?<=[a-z0-9])(?=[A-Z])", value) if w]
+
+
+FILTERS: Dict[str, Callable[[Any], Any]] = {
+    "upper": lambda v: str(v).upper(),
+    "lower": lambda v: str(v).lower(),
+    "title": lambda v: str(v).title(),
+    "pascal": lambda v: "".join(w.capitalize() for w in _to_words(str(v))),
+    "snake": lambda v: "_".join(w.lower() for w in _to_words(str(v))),
+    "kebab": lambda v: "-".join(w.lower() for w in _to_words(str(v))),
+    "repr": repr,
+    "length": len,
+    "sort": sorted,
+}
+
+
+class LoopInfo:
+    """Per-iteration state exposed as ``loop`` inside for blocks."""
+
+    __slots__ = ("index0", "length")
+
+    def __init__(self, index0: int, length: int):
+        self.index0 = index0
+        self.length = length
+
+    @property
+    def index(self) -> int:
+        return self.index0 + 1
+
+    @property
+    def first(self) -> bool:
+        return self.index0 == 0
+
+    @property
+    def last(self) -> bool:
+        return self.index0 == self.length - 1
+
+
+def _loop(iterable: Iterable[Any]) -> Iterator[Tuple[LoopInfo, Any]]:
+    items = list(iterable)
+    for index, item in enumerate(items):
+        yield LoopInfo(index, len(items)), item
+
+
+def _lookup(context: Dict[str, Any], name: str, line: int) -> Any:
+    try:
+        return context[name]
+    except KeyError:
+        raise TemplateError(
+            f"Line {line}: undefined template variable '{name}'"
+        ) from None
+
+
+def _attr(value: Any, name: str, line: int) -> Any:
+    try:
+        if isinstance(value, dict):
+            return value[name]
+        return getattr(value, name)
+    except (KeyError, AttributeError):
+        raise TemplateError(
+            f"Line {line}: {type(value).__name__} value has no attribute '{name}'"
+        ) from None
+
+
+_RUNTIME = {
+    "_lookup": _lookup,
+    "_attr": _attr,
+    "_loop": _loop,
+    "_filters": FILTERS,
+}
+
+
+class Template:
+    """A compiled template."""
+
+    __slots__ = ("source", "_render")
+
+    def __init__(self, source: str, render: Callable[[Dict[str, Any]], str]):
+        self.source = source
+        self._render = render
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """
+        Render the template.
+
+        Args:
+            context: Values for the template variables
+
+        Returns:
+            Rendered text
+
+        Raises:
+            TemplateError: If a variable or attribute is undefined
+        """
+        return self._render(context)
+
+    def render_many(self, contexts: Iterable[Dict[str, Any]]) -> List[str]:
+        """
+        Render the template for many contexts.
+
+        Args:
+            contexts: One context per output
+
+        Returns:
+            Rendered texts in input order
+        """
+        render = self._render
+        return [render(context) for context in contexts]
+
+
+@functools.cache
+def compile_template(source: str) -> Template:
+    """
+    Compile a template, reusing the process-wide cache.
+
+    Args:
+        source: Template source
+
+    Returns:
+        Compiled template
+
+    Raises:
+        TemplateError: If the template is malformed
+    """
+    code = _Compiler(source).compile()
+    namespace = dict(_RUNTIME)
+    # The code is generated only from the compiler's own validated tokens
+    exec(compile(code, "<template>", "exec"), namespace)  # noqa: S102
+    return Template(source, namespace["render"])
+
+
+def validate_template(source: str) -> None:
+    """
+    Check that a template is well-formed without building it.
+
+    Cheaper than ``compile_template`` for templates that may never be
+    rendered in this process, and leaves the template cache untouched.
+
+    Raises:
+        TemplateError: If the template is malformed
+    """
+    _Compiler(source).compile()
+
+
+def render_template(source: str, context: Dict[str, Any]) -> str:
+    """Compile (or fetch from cache) and render a template."""
+    return compile_template(source).render(context)
+
+
+class _Compiler:
+    """Translate template source into the source of a render function."""
+
+    def __init__(self, source: str):
+        self._source = source
+        self._lines = ["def render(ctx):", " _out = []", " _w = _out.append"]
+        self._depth = 1
+        # Open blocks as [kind, index of the first line of the current body]
+        self._blocks: List[List[Any]] = []
+        self._scopes: List[Dict[str, str]] = []
+        self._loops = 0
+
+    def compile(self) -> str:
+        for kind, value, line in self._tokens():
+            if kind == "text":
+                if value:
+                    self._emit(f"_w({value!r})")
+            elif kind == "slot":
+                self._emit(f"_w(str({self._expression(value, line)}))")
+            else:
+                self._block(value, line)
+        if self._blocks:
+            raise TemplateError(f"Unclosed '{self._blocks[-1][0]}' block")
+        self._emit("return ''.join(_out)")
+        return "\n".join(self._lines)
+
+    def _tokens(self) -> Iterator[Tuple[str, str, int]]:
+        """Split the source into text, slot and block tokens."""
+        source = self._source
+        position = 0
+        match = _TAG.search(source)
+        while match:
+            start, end = match.start(), match.end()
+            line = source.count("\n", 0, start) + 1
+            text = source[position:start]
+            if match.group(1) is not None:
+                yield "text", text, line
+                yield "slot", match.group(1), line
+                position = end
+            else:
+                text, position = self._trim(position, start, end)
+                yield "text", text, line
+                if match.group(2).strip() == "raw":
+                    closing = _ENDRAW.search(source, position)
+                    if closing is None:
+                        raise TemplateError(f"Line {line}: unclosed 'raw' block")
+                    text, position = self._trim(position, *closing.span())
+                    yield "text", text, line
+                else:
+                    yield "block", match.group(2), line
+            match = _TAG.search(source, position)
+        yield "text", source[position:], 0
+
+    def _trim(self, position: int, start: int, end: int) -> Tuple[str, int]:
+        """
+        Text before the block tag at ``start:end``, and where text resumes.
+
+        A block tag alone on its line swallows the whole line.
+        """
+        source = self._source
+        line_start = source.rfind("\n", 0, start) + 1
+        if (
+            line_start >= position
+            and not source[line_start:start].strip()
+            and (end == len(source) or source[end] == "\n")
+        ):
+            return source[position:line_start], min(end + 1, len(source))
+        return source[position:start], end
+
+    def _block(self, statement: str, line: int) -> None:
+        keyword, _, rest = statement.strip().partition(" ")
+        rest = rest.strip()
+        if keyword == "if":
+            self._emit(f"if {self._expression(rest, line)}:")
+            self._open("if")
+        elif keyword in ("elif", "else"):
+            if not self._blocks or self._blocks[-1][0] != "if":
+                raise TemplateError(f"Line {line}: '{keyword}' outside of if block")
+            self._end_body()
+            if keyword == "elif":
+                self._emit(f"elif {self._expression(rest, line)}:")
+            else:
+                self._emit("else:")
+            self._start_body()
+        elif keyword == "for":
+            target, sep, iterable = rest.partition(" in ")
+            target = target.strip()
+            if not sep or not re.fullmatch(r"[A-Za-z_]\w*", target):
+                raise TemplateError(f"Line {line}: expected 'for <name> in <expr>'")
+            self._loops += 1
+            local, loop = f"l_{target}_{self._loops}", f"_loop{self._loops}"
+            iterable = self._expression(iterable, line)
+            self._emit(f"for {loop}, {local} in _loop({iterable}):")
+            self._open("for")
+            self._scopes.append({target: local, "loop": loop})
+        elif keyword in ("endif", "endfor"):
+            kind = keyword[3:]
+            if not self._blocks or self._blocks[-1][0] != kind:
+                raise TemplateError(f"Line {line}: unexpected '{keyword}'")
+            self._end_body()
+            self._blocks.pop()
+            if kind == "for":
+                self._scopes.pop()
+        else:
+            raise TemplateError(f"Line {line}: unknown block '{keyword}'")
+
+    def _open(self, kind: str) -> None:
+        self._blocks.append([kind, 0])
+        self._start_body()
+
+    def _start_body(self) -> None:
+        self._depth += 1
+        self._blocks[-1][1] = len(self._lines)
+
+    def _end_body(self) -> None:
+        if len(self._lines) == self._blocks[-1][1]:
+            self._emit("pass")
+        self._depth -= 1
+
+    def _emit(self, code: str) -> None:
+        self._lines.append(" " * self._depth + code)
+
+    def _expression(self, source: str, line: int) -> str:
+        tokens = self._tokenize(source, line)
+        parser = _ExpressionParser(tokens, self._resolve, line)
+        return parser.parse()
+
+    def _tokenize(self, source: str, line: int) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        source = source.rstrip()
+        while position < len(source):
+            match = _TOKEN.match(source, position)
+            if not match or match.end() == position:
+                raise TemplateError(
+                    f"Line {line}: invalid expression '{source.strip()}'"
+                )
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))
+            position = match.end()
+        if not tokens:
+            raise TemplateError(f"Line {line}: empty expression")
+        return tokens
+
+    def _resolve(self, path: str, line: int) -> str:
+        head, *attributes = path.split(".")
+        if any(attribute.startswith("_") for attribute in attributes):
+            raise TemplateError(f"Private attribute access in '{path}'")
+        for scope in reversed(self._scopes):
+            if head in scope:
+                code = scope[head]
+                break
+        else:
+            code = f"_lookup(ctx, {head!r}, {line})"
+        for attribute in attributes:
+            code = f"_attr({code}, {attribute!r}, {line})"
+        return code
+
+
+class _ExpressionParser:
+    """Recursive-descent parser emitting restricted Python expressions."""
+
+    def __init__(
+        self,
+        tokens: List[Tuple[str, str]],
+        resolve: Callable[[str, int], str],
+        line: int,
+    ):
+        self._tokens = tokens
+        self._position = 0
+        self._resolve = resolve
+        self._line = line
+
+    def parse(self) -> str:
+        code = self._or()
+        if self._position != len(self._tokens):
+            self._fail()
+        return code
+
+    def _peek(self) -> Tuple[str, str]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return ("end", "")
+
+    def _take(self) -> Tuple[str, str]:
+        token = self._peek()
+        self._position += 1
+        return token
+
+    def _fail(self) -> None:
+        text = " ".join(value for _, value in self._tokens)
+        raise TemplateError(f"Line {self._line}: invalid expression '{text}'")
+
+    def _or(self) -> str:
+        code = self._and()
+        while self._peek() == ("name", "or"):
+            self._take()
+            code = f"({code} or {self._and()})"
+        return code
+
+    def _and(self) -> str:
+        code = self._not()
+        while self._peek() == ("name", "and"):
+            self._take()
+            code = f"({code} and {self._not()})"
+        return code
+
+    def _not(self) -> str:
+        if self._peek() == ("name", "not"):
+            self._take()
+            return f"(not {self._not()})"
+        return self._comparison()
+
+    def _comparison(self) -> str:
+        left = self._filtered()
+        kind, value = self._peek()
+        if kind == "op" and value in ("==", "!="):
+            self._take()
+            return f"({left} {value} {self._filtered()})"
+        if (kind, value) == ("name", "in"):
+            self._take()
+            return f"({left} in {self._filtered()})"
+        return left
+
+    def _filtered(self) -> str:
+        code = self._primary()
+        while self._peek() == ("op", "|"):
+            self._take()
+            kind, name = self._take()
+            if kind != "name" or name not in FILTERS:
+                raise TemplateError(f"Line {self._line}: unknown filter '{name}'")
+            code = f"_filters[{name!r}]({code})"
+        return code
+
+    def _primary(self) -> str:
+        kind, value = self._take()
+        if kind == "str":
+            return repr(ast.literal_eval(value))
+        if kind == "num":
+            return value
+        if kind == "op" and value == "(":
+            code = self._or()
+            if self._take() != ("op", ")"):
+                self._fail()
+            return code
+        if kind == "name" and value not in _KEYWORDS:
+            if value in _CONSTANTS:
+                return _CONSTANTS[value]
+            return self._resolve(value, self._line)
+        self._fail()
@@ -0,0 +1,396 @@
+"""Template packs - feature-agnostic utility.
+
+A template pack is a single file holding any number of templates plus a
+manifest describing the project layouts built from them::
+
+    header   magic "LZPK", format, flags, entry count
+    index    one fixed-size record per entry, sorted by name
+    names    UTF-8 entry names
+    data     entry contents, zlib-compressed where that saves space
+
+Packs are memory-mapped. Finding a template is a binary search over the
+index records, and an entry is only decompressed the first time it is
+read, so opening a pack of thousands of templates costs the same as
+opening one with a handful.
+
+Packs are built from a directory containing ``manifest.toml`` and the
+template files::
+
+    name = "acme"
+
+    [layouts.service]
+    directories = ["src/app", "tests"]
+    commands = [
+        { command = ["git", "init"], name = "git-init", depends_on = [] },
+    ]
+
+    [[layouts.service.files]]
+    path = "src/app/main.py"
+    template = "service/main.py"    # omit for an empty file
+"""
+
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tomllib
+import zlib
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .interfaces import IContentGenerator
+from .exceptions import TemplateError, ValidationError
+from .template_engine import compile_template, validate_template
+
+MAGIC = b"LZPK"
+PACK_FORMAT = 1
+MANIFEST_FILE = "manifest.toml"
+MANIFEST_ENTRY = "@manifest"
+
+# magic, format, flags, entry count
+_HEADER = struct.Struct("<4sHHI")
+# name offset, name length, flags, data offset, stored size, size, digest
+_RECORD = struct.Struct("<IHHQII8s")
+_COMPRESSED = 1
+
+_FILE_KEYS = {"path", "template"}
+_COMMAND_KEYS = {"command", "name", "depends_on", "packages"}
+
+
+def _digest(data: bytes) -> bytes:
+    """Return the digest stored for an entry."""
+    return hashlib.sha256(data).digest()[:8]
+
+
+class TemplatePack:
+    """
+    Read-only view of a template pack file.
+
+    Entries are decoded lazily and cached; ``decoded`` counts how many
+    were actually read. Use as a context manager, or call ``close``.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open and memory-map a pack.
+
+        Args:
+            path: Pack file
+
+        Raises:
+            ValidationError: If the file is missing or not a supported pack
+        """
+        self.path = path
+        try:
+            with open(path, "rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ValidationError(f"Cannot open template pack {path}: {e}") from e
+
+        if len(self._map) < _HEADER.size:
+            self._reject("truncated header")
+        magic, version, _, self._count = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._reject("not a template pack")
+        if version != PACK_FORMAT:
+            self._reject(f"unsupported format {version}")
+        self._names_offset = _HEADER.size + self._count * _RECORD.size
+        if len(self._map) < self._names_offset:
+            self._reject("truncated index")
+        self._decoded: Dict[str, str] = {}
+
+    def __enter__(self) -> "TemplatePack":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of templates, excluding the manifest."""
+        return self._count - (MANIFEST_ENTRY in self)
+
+    def __contains__(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+
+    @property
+    def decoded(self) -> int:
+        """Number of entries decoded so far."""
+        return len(self._decoded)
+
+    def names(self) -> Iterator[str]:
+        """Names of all templates in sorted order."""
+        for position in range(self._count):
+            name = self._name(position).decode("utf-8")
+            if name != MANIFEST_ENTRY:
+                yield name
+
+    def version(self, name: str) -> str:
+        """
+        Short hash of a template, read from the index without decoding it.
+
+        Matches the version of a ``TemplateContentGenerator`` with the same
+        source, so moving a template into a pack does not change it.
+
+        Raises:
+            ValidationError: If the pack has no such template
+        """
+        return _RECORD.unpack_from(self._map, self._offset(name))[6].hex()[:12]
+
+    def read(self, name: str) -> str:
+        """
+        Return the source of a template, decoding it on first use.
+
+        Raises:
+            ValidationError: If the pack has no such template or it is corrupt
+        """
+        if name in self._decoded:
+            return self._decoded[name]
+        _, _, flags, start, stored, size, digest = _RECORD.unpack_from(
+            self._map, self._offset(name)
+        )
+        data = self._map[start : start + stored]
+        try:
+            if flags & _COMPRESSED:
+                data = zlib.decompress(data, bufsize=size)
+        except zlib.error as e:
+            self._reject(f"corrupt entry '{name}': {e}")
+        if len(data) != size or _digest(data) != digest:
+            self._reject(f"corrupt entry '{name}'")
+        text = self._decoded[name] = data.decode("utf-8")
+        return text
+
+    @functools.cached_property
+    def manifest(self) -> Dict[str, Any]:
+        """The manifest the pack was built from."""
+        manifest = json.loads(self.read(MANIFEST_ENTRY))
+        # Packs may come from elsewhere; never trust their output paths
+        _check_paths(manifest, self.path)
+        return manifest
+
+    def layouts(self) -> List[str]:
+        """Names of the layouts declared by the manifest."""
+        return list(self.manifest["layouts"])
+
+    def _name(self, position: int) -> bytes:
+        offset, length = _RECORD.unpack_from(
+            self._map, _HEADER.size + position * _RECORD.size
+        )[:2]
+        start = self._names_offset + offset
+        return self._map[start : start + length]
+
+    def _find(self, name: str) -> Optional[int]:
+        """Binary search the index; return the record offset or None."""
+        key = name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._name(low) == key:
+            return _HEADER.size + low * _RECORD.size
+        return None
+
+    def _offset(self, name: str) -> int:
+        offset = self._find(name)
+        if offset is None:
+            raise ValidationError(f"Template pack {self.path} has no '{name}'")
+        return offset
+
+    def _reject(self, reason: str) -> None:
+        raise ValidationError(f"Invalid template pack {self.path}: {reason}")
+
+
+class PackTemplateGenerator(IContentGenerator):
+    """Generate content from a template stored in a pack."""
+
+    def __init__(self, pack: TemplatePack, template: str):
+        """
+        Initialize with a pack entry.
+
+        Args:
+            pack: Open template pack
+            template: Name of the template in the pack
+        """
+        self._pack = pack
+        self._template = template
+
+    def generate(self, context: Dict[str, Any]) -> str:
+        """Render the template, decoding it from the pack on first use."""
+        return compile_template(self._pack.read(self._template)).render(context)
+
+    def generate_many(self, contexts: Iterable[Dict[str, Any]]) -> List[str]:
+        """Render the template once per context."""
+        return compile_template(self._pack.read(self._template)).render_many(contexts)
+
+    @property
+    def version(self) -> str:
+        """Short hash of the template source."""
+        return self._pack.version(self._template)
+
+    @property
+    def name(self) -> str:
+        """Pack entry of the template."""
+        return f"pack:{self._template}"
+
+
+def build_template_pack(source: Path, output: Path) -> int:
+    """
+    Build a pack from a directory of templates and a ``manifest.toml``.
+
+    Every file except the manifest becomes a template named by its POSIX
+    path relative to ``source``. All templates are compiled and every
+    layout is checked against them before anything is written.
+
+    Args:
+        source: Directory containing the manifest and templates
+        output: Pack file to write (replaced atomically)
+
+    Returns:
+        Number of templates in the pack
+
+    Raises:
+        ValidationError: If the manifest is invalid or references
+            missing templates
+        TemplateError: If a template does not compile
+    """
+    manifest_path = source / MANIFEST_FILE
+    try:
+        manifest = tomllib.loads(manifest_path.read_text(encoding="utf-8"))
+    except OSError as e:
+        raise ValidationError(f"Cannot read {manifest_path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ValidationError(f"Invalid manifest {manifest_path}: {e}") from e
+
+    templates: Dict[str, bytes] = {}
+    for directory, _, files in os.walk(source):
+        prefix = os.path.relpath(directory, source).replace(os.sep, "/")
+        for filename in files:
+            name = filename if prefix == "." else f"{prefix}/{filename}"
+            if name != MANIFEST_FILE:
+                with open(os.path.join(directory, filename), "rb") as handle:
+                    templates[name] = handle.read()
+    _check_manifest(manifest, templates, manifest_path)
+    for name, data in templates.items():
+        try:
+            validate_template(data.decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise ValidationError(f"Template '{name}' is not UTF-8 text") from e
+        except TemplateError as e:
+            raise TemplateError(f"Template '{name}': {e}") from e
+
+    entries = dict(templates)
+    entries[MANIFEST_ENTRY] = json.dumps(manifest, sort_keys=True).encode("utf-8")
+    _write_pack(entries, output)
+    return len(templates)
+
+
+def _check_manifest(
+    manifest: Dict[str, Any], templates: Dict[str, bytes], origin: Path
+) -> None:
+    """Validate the manifest schema and its template references."""
+
+    def fail(reason: str) -> None:
+        raise ValidationError(f"Invalid manifest {origin}: {reason}")
+
+    if MANIFEST_ENTRY in templates:
+        fail(f"'{MANIFEST_ENTRY}' is a reserved template name")
+    layouts = manifest.get("layouts")
+    if not isinstance(layouts, dict) or not layouts:
+        fail("no [layouts.<name>] tables")
+    for layout, spec in layouts.items():
+        if not isinstance(spec, dict):
+            fail(f"layout '{layout}' must be a table")
+        unknown = spec.keys() - {"directories", "files", "commands"}
+        if unknown:
+            fail(f"layout '{layout}' has unknown keys {sorted(unknown)}")
+        if not all(isinstance(d, str) for d in spec.get("directories", [])):
+            fail(f"layout '{layout}' directories must be strings")
+        for entry in spec.get("files", []):
+            if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+                fail(f"layout '{layout}' has a file without a path")
+            if entry.keys() - _FILE_KEYS:
+                fail(f"file '{entry['path']}' has unknown keys")
+            template = entry.get("template")
+            if template is not None and template not in templates:
+                fail(f"file '{entry['path']}' uses missing template '{template}'")
+        for entry in spec.get("commands", []):
+            if not isinstance(entry, dict) or not isinstance(
+                entry.get("command"), list
+            ):
+                fail(f"layout '{layout}' has a command without an argv list")
+            if entry.keys() - _COMMAND_KEYS:
+                fail(f"command {entry['command']} has unknown keys")
+    _check_paths(manifest, origin)
+
+
+def _check_paths(manifest: Dict[str, Any], origin: Path) -> None:
+    """
+    Reject output paths that would leave the project directory.
+
+    Raises:
+        TemplateError: If a directory or file path is absolute or has a
+            ``..`` segment
+    """
+    for layout, spec in manifest.get("layouts", {}).items():
+        paths = list(spec.get("directories", []))
+        paths.extend(entry.get("path") for entry in spec.get("files", []))
+        for path in paths:
+            posix = PurePosixPath(str(path).replace("\\", "/"))
+            if (
+                posix.is_absolute()
+                or PureWindowsPath(str(path)).drive
+                or ".." in posix.parts
+            ):
+                raise TemplateError(
+                    f"Invalid manifest {origin}: layout '{layout}' path "
+                    f"'{path}' must be relative to the project directory"
+                )
+
+
+def _write_pack(entries: Dict[str, bytes], output: Path) -> None:
+    """Serialize entries into a pack file."""
+    ordered = sorted(entries.items(), key=lambda item: item[0].encode("utf-8"))
+    names = bytearray()
+    records = []
+    blobs = []
+    data_offset = (
+        _HEADER.size
+        + len(ordered) * _RECORD.size
+        + sum(len(name.encode("utf-8")) for name, _ in ordered)
+    )
+    for name, data in ordered:
+        encoded = name.encode("utf-8")
+        compressed = zlib.compress(data, 9)
+        flags, stored = (
+            (_COMPRESSED, compressed) if len(compressed) < len(data) else (0, data)
+        )
+        records.append(
+            _RECORD.pack(
+                len(names),
+                len(encoded),
+                flags,
+                data_offset,
+                len(stored),
+                len(data),
+                _digest(data),
+            )
+        )
+        names += encoded
+        blobs.append(stored)
+        data_offset += len(stored)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = output.with_name(f".{output.name}.tmp")
+    with open(temporary, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, PACK_FORMAT, 0, len(ordered)))
+        handle.writelines(records)
+        handle.write(names)
+        handle.writelines(blobs)
+    os.replace(temporary, output)
@@ -0,0 +1,10 @@
+"""Project-sync feature for LazyAPI."""
+
+from .sync_config import SyncAction, SyncPlan
+from .sync_synchronizer import ProjectSynchronizer
+
+__all__ = [
+    "SyncAction",
+    "SyncPlan",
+    "ProjectSynchronizer",
+]
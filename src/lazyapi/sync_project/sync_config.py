@@ -0,0 +1,33 @@
+"""Configuration for incremental project regeneration."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class SyncAction:
+    """
+    Decision taken for one generated file.
+
+    ``action`` is one of ``create``, ``update``, ``unchanged``, ``adopt``
+    (already matches the new output), ``skip`` (edited or deleted by the
+    user) or ``orphan`` (no longer generated, left alone).
+    """
+
+    path: str
+    action: str
+    reason: Optional[str] = None
+
+
+@dataclass
+class SyncPlan:
+    """All decisions of a sync run and the files to write."""
+
+    actions: List[SyncAction] = field(default_factory=list)
+    writes: Dict[Path, str] = field(default_factory=dict)
+    index: Optional[str] = None
+
+    def count(self, action: str) -> int:
+        """Number of files with the given action."""
+        return sum(1 for item in self.actions if item.action == action)
@@ -0,0 +1,184 @@
+"""Feature implementation: Regenerate an existing project incrementally."""
+
+from pathlib import Path
+from typing import Callable, Dict
+from ..shared.interfaces import IFileOperations, ICommandExecutor
+from ..shared.exceptions import LazyAPIError, ValidationError
+from ..shared.project_index import INDEX_PATH, ProjectIndex, content_hash
+from ..shared.template_pack import TemplatePack
+from ..services.memory_file_operations import InMemoryFileOperations
+from ..init_repo_setup.init_config import ProjectOptions, ProjectStructure
+from ..init_repo_setup.init_initializer import ProjectInitializer
+from ..init_repo_setup.init_pack import get_pack_structure
+from ..init_repo_setup.init_structure import get_fastapi_structure
+from ..init_repo_setup.init_scaled_structure import get_scaled_fastapi_structure
+from ..add_feature.feature_config import FeatureSpec
+from ..add_feature.feature_generator import FeatureGenerator
+from ..add_feature.feature_structure import get_feature_structure
+from .sync_config import SyncAction, SyncPlan
+
+LAYOUTS: Dict[str, Callable[[ProjectOptions], ProjectStructure]] = {
+    "basic": get_fastapi_structure,
+    "scaled": get_scaled_fastapi_structure,
+}
+
+
+class ProjectSynchronizer:
+    """
+    Bring a generated project up to date with the current templates.
+
+    The project is re-rendered in memory exactly as the index describes it
+    (layout, features, resources and router registrations). Each output is
+    compared with the hash recorded at generation time: files whose output
+    did not change are skipped after checking that they still exist, files
+    the user edited or deleted are left alone unless forced, and only the
+    rest are written, so the modification times of untouched files stay
+    stable.
+    """
+
+    def __init__(
+        self,
+        file_ops: IFileOperations,
+        shell_exec: ICommandExecutor,
+        project_path: Path,
+    ):
+        """
+        Initialize with dependencies.
+
+        Args:
+            file_ops: File operations service
+            shell_exec: Shell executor service (unused by rendering)
+            project_path: Root of the project to synchronize
+        """
+        self._file_ops = file_ops
+        self._shell_exec = shell_exec
+        self._project_path = project_path
+
+    def plan(self, force: bool = False) -> SyncPlan:
+        """
+        Decide what to do with every generated file.
+
+        Args:
+            force: Overwrite files the user edited or deleted
+
+        Returns:
+            Decisions and the files to write
+
+        Raises:
+            ValidationError: If the project has no usable index
+            LazyAPIError: If rendering fails
+        """
+        index = ProjectIndex.load(self._file_ops, self._project_path)
+        if index is None:
+            raise ValidationError(
+                f"No {INDEX_PATH.as_posix()} found in '{self._project_path}'; "
+                "sync only works on projects created by 'lazyapi init'"
+            )
+        staged = self._render(index)
+        expected = ProjectIndex.load(staged, self._project_path)
+        plan = SyncPlan()
+
+        for relative, entry in expected.files.items():
+            path = self._project_path / relative
+            previous = index.files.get(relative)
+            recorded = previous["hash"] if previous else None
+            # Same output as last time: only a deletion can need work
+            if (
+                recorded == entry["hash"]
+                and not force
+                and self._file_ops.file_exists(path)
+            ):
+                plan.actions.append(SyncAction(relative, "unchanged"))
+                continue
+
+            content = staged.read_file(path)
+            if not self._file_ops.file_exists(path):
+                if recorded is None or force:
+                    plan.actions.append(SyncAction(relative, "create"))
+                    plan.writes[path] = content
+                else:
+                    plan.actions.append(SyncAction(relative, "skip", "deleted locally"))
+                    expected.files[relative] = previous
+                continue
+
+            actual = content_hash(self._file_ops.read_file(path))
+            if actual == entry["hash"]:
+                action = "unchanged" if recorded == actual else "adopt"
+                plan.actions.append(SyncAction(relative, action))
+            elif actual == recorded or force:
+                plan.actions.append(SyncAction(relative, "update"))
+                plan.writes[path] = content
+            elif previous is None:
+                plan.actions.append(
+                    SyncAction(relative, "skip", "exists but was not generated")
+                )
+                del expected.files[relative]
+            else:
+                plan.actions.append(SyncAction(relative, "skip", "modified locally"))
+                # Keep the old hash so the edit is still detected next time
+                expected.files[relative] = previous
+
+        for relative in index.files.keys() - expected.files.keys():
+            plan.actions.append(SyncAction(relative, "orphan", "no longer generated"))
+
+        serialized = expected.to_json()
+        if serialized != self._file_ops.read_file(self._project_path / INDEX_PATH):
+            plan.index = serialized
+        return plan
+
+    def apply(self, plan: SyncPlan) -> None:
+        """
+        Write the files selected by a plan, then the updated index.
+
+        Args:
+            plan: Plan returned by ``plan``
+
+        Raises:
+            LazyAPIError: If writing fails
+        """
+        try:
+            if plan.writes:
+                self._file_ops.write_files(plan.writes)
+            if plan.index is not None:
+                self._file_ops.write_file(self._project_path / INDEX_PATH, plan.index)
+        except Exception as e:
+            raise LazyAPIError(f"Failed to sync project: {e}") from e
+
+    def _render(self, index: ProjectIndex) -> InMemoryFileOperations:
+        """Render the project described by an index into memory."""
+        options = ProjectOptions.from_dict(index.options)
+        if index.template_pack is not None:
+            with TemplatePack(Path(index.template_pack)) as pack:
+                staged = self._render_structure(
+                    index, get_pack_structure(pack, index.layout, options)
+                )
+        elif index.layout in LAYOUTS:
+            staged = self._render_structure(index, LAYOUTS[index.layout](options))
+        else:
+            raise ValidationError(f"Cannot sync projects with layout '{index.layout}'")
+
+        if index.features or index.project_feature_options:
+            generator = FeatureGenerator(
+                staged, get_feature_structure(), self._project_path
+            )
+            features = generator.plan(
+                [
+                    FeatureSpec(
+                        name=name,
+                        resources=index.resources(name),
+                        options=index.feature_options(name),
+                    )
+                    for name in index.features
+                ],
+                enable=index.project_feature_options,
+            )
+            staged.write_files({**features.files, **features.edits})
+        return staged
+
+    def _render_structure(
+        self, index: ProjectIndex, structure: ProjectStructure
+    ) -> InMemoryFileOperations:
+        """Render the generated files of a layout into memory."""
+        return ProjectInitializer(self._file_ops, self._shell_exec, structure).render(
+            self._project_path, index.project_name
+        )
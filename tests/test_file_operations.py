@@ -0,0 +1,44 @@
+"""move never replaces an existing destination."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from lazyapi.services import FileOperations
+from lazyapi.shared.exceptions import FileSystemError
+
+
+class MoveTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.file_ops = FileOperations()
+
+    def test_moves_file_and_directory(self):
+        (self.root / "a.py").write_text("a")
+        (self.root / "pkg").mkdir()
+        (self.root / "pkg" / "b.py").write_text("b")
+        self.file_ops.move(self.root / "a.py", self.root / "c.py")
+        self.file_ops.move(self.root / "pkg", self.root / "moved")
+        self.assertEqual((self.root / "c.py").read_text(), "a")
+        self.assertEqual((self.root / "moved" / "b.py").read_text(), "b")
+        self.assertFalse((self.root / "a.py").exists())
+        self.assertFalse((self.root / "pkg").exists())
+
+    def test_existing_file_is_kept(self):
+        (self.root / "a.py").write_text("a")
+        (self.root / "c.py").write_text("c")
+        with self.assertRaises(FileSystemError):
+            self.file_ops.move(self.root / "a.py", self.root / "c.py")
+        self.assertEqual((self.root / "c.py").read_text(), "c")
+        self.assertTrue((self.root / "a.py").exists())
+
+    def test_empty_directory_is_not_replaced(self):
+        (self.root / "pkg").mkdir()
+        (self.root / "pkg" / "b.py").write_text("b")
+        (self.root / "empty").mkdir()
+        with self.assertRaises(FileSystemError):
+            self.file_ops.move(self.root / "pkg", self.root / "empty")
+        self.assertEqual(list((self.root / "empty").iterdir()), [])
+        self.assertTrue((self.root / "pkg" / "b.py").exists())
@@ -0,0 +1,52 @@
+"""The initializer relocates the virtual environment through its copier."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional
+
+from lazyapi.init_repo_setup.init_config import ProjectOptions
+from lazyapi.init_repo_setup.init_initializer import ProjectInitializer
+from lazyapi.init_repo_setup.init_scaled_structure import (
+    get_scaled_fastapi_structure,
+)
+from lazyapi.services import FileOperations, TreeCopier
+from lazyapi.shared.interfaces import ICommandExecutor
+
+
+class FakeUvSync(ICommandExecutor):
+    """Creates a virtual environment whose activate script names its path."""
+
+    def execute(self, command: List[str], cwd: Optional[Path] = None) -> None:
+        if command[:2] == ["uv", "sync"]:
+            (cwd / ".venv" / "bin").mkdir(parents=True)
+            (cwd / ".venv" / "bin" / "activate").write_text(
+                f'VIRTUAL_ENV="{cwd}/.venv"\n'
+            )
+
+
+class RecordingCopier(TreeCopier):
+    def __init__(self):
+        self.rewritten: List[str] = []
+
+    def rewrite_files(self, root, paths, replacements):
+        self.rewritten.extend(paths)
+        super().rewrite_files(root, paths, replacements)
+
+
+class RelocateEnvironmentTest(unittest.TestCase):
+    def test_uses_injected_copier(self):
+        structure = get_scaled_fastapi_structure(ProjectOptions())
+        copier = RecordingCopier()
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp) / "shop"
+            ProjectInitializer(
+                FileOperations(), FakeUvSync(), structure, copier=copier
+            ).initialize(project, "shop")
+            activate = (project / ".venv" / "bin" / "activate").read_text()
+        self.assertEqual(copier.rewritten, ["bin/activate"])
+        self.assertEqual(activate, f'VIRTUAL_ENV="{project}/.venv"\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Ctrl+C stops the commands run by the init scheduler."""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+SCRIPT = textwrap.dedent(
+    """
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, sys.argv[1])
+    from lazyapi.init_repo_setup.init_config import CommandSpec
+    from lazyapi.init_repo_setup.init_scheduler import CommandScheduler
+    from lazyapi.services import AsyncShellExecutor
+
+    command = ["sh", "-c", "echo $$ > pid; sleep 8"]
+    scheduler = CommandScheduler(AsyncShellExecutor(timeout=600), [CommandSpec(command)])
+    scheduler.run(Path(sys.argv[2]))
+    """
+)
+
+
+@unittest.skipUnless(os.name == "posix", "process groups are POSIX only")
+class InterruptTest(unittest.TestCase):
+    def test_sigint_stops_running_commands(self):
+        with tempfile.TemporaryDirectory() as cwd:
+            pid_file = Path(cwd) / "pid"
+            cli = subprocess.Popen(
+                [sys.executable, "-c", SCRIPT, str(SRC), cwd],
+                stderr=subprocess.DEVNULL,
+            )
+            deadline = time.monotonic() + 5
+            while not pid_file.exists() or not pid_file.read_text().strip():
+                self.assertLess(time.monotonic(), deadline, "command never started")
+                time.sleep(0.05)
+            child = int(pid_file.read_text())
+
+            started = time.monotonic()
+            cli.send_signal(signal.SIGINT)
+            returncode = cli.wait(timeout=5)
+            elapsed = time.monotonic() - started
+
+            self.assertNotEqual(returncode, 0)
+            self.assertLess(elapsed, 2)
+            self.assertTrue(_group_gone(child), "command still running")
+
+
+def _group_gone(pgid: int, wait: float = 2) -> bool:
+    """Whether a process group empties within ``wait`` seconds."""
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Projects created from a snapshot match a regular init."""
+
+import os
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+from lazyapi.init_repo_setup.init_config import ProjectOptions
+from lazyapi.init_repo_setup.init_initializer import ProjectInitializer
+from lazyapi.init_repo_setup.init_scaled_structure import (
+    get_scaled_fastapi_structure,
+)
+from lazyapi.init_repo_setup.init_snapshot import SnapshotCache
+from lazyapi.services import FileOperations
+from lazyapi.shared.interfaces import ICommandExecutor
+
+
+class FakeUv(ICommandExecutor):
+    """Writes the files uv would, with the name normalized like uv does."""
+
+    def execute(self, command: List[str], cwd: Optional[Path] = None) -> None:
+        name = re.sub(r"[-_.]+", "-", cwd.name).lower()
+        if command[:2] == ["uv", "init"]:
+            (cwd / "pyproject.toml").write_text(f'[project]\nname = "{name}"\n')
+        elif command[:2] == ["uv", "add"]:
+            (cwd / "uv.lock").write_text(f'[[package]]\nname = "{name}"\n')
+
+
+def _tree(root: Path) -> dict:
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+class SnapshotNameTest(unittest.TestCase):
+    def test_matches_regular_init(self):
+        structure = get_scaled_fastapi_structure(ProjectOptions())
+        for name in ["My_Shop", "shop.api"]:
+            with self.subTest(name=name), tempfile.TemporaryDirectory() as tmp:
+                root = Path(tmp)
+                regular = root / "regular" / name
+                regular.parent.mkdir()
+                ProjectInitializer(FileOperations(), FakeUv(), structure).initialize(
+                    regular, name
+                )
+                snapshot = root / "snapshot" / name
+                snapshot.parent.mkdir()
+                cache = SnapshotCache(FileOperations(), FakeUv(), root / "cache")
+                for _ in range(2):
+                    cache.materialize(structure, snapshot, name)
+                    self.assertEqual(_tree(snapshot), _tree(regular))
+                    FileOperations().remove_directory(snapshot)
+
+
+UV = """#!/bin/sh
+case "$1" in
+  --version) echo "uv {uv}";;
+  python) echo "{python}";;
+esac
+"""
+
+
+@unittest.skipUnless(os.name == "posix", "fake uv is a shell script")
+class SnapshotKeyTest(unittest.TestCase):
+    def key(self, uv, python):
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp) / "uv"
+            script.write_text(UV.format(uv=uv, python=python))
+            script.chmod(0o755)
+            cache = SnapshotCache(FileOperations(), FakeUv(), Path(tmp) / "cache")
+            with mock.patch.dict(os.environ, {"PATH": tmp}):
+                return cache.key(get_scaled_fastapi_structure(ProjectOptions()))
+
+    def test_key_covers_uv_and_its_python(self):
+        key = self.key("0.5.0", sys.executable)
+        self.assertEqual(self.key("0.5.0", sys.executable), key)
+        self.assertNotEqual(self.key("0.6.0", sys.executable), key)
+        self.assertNotEqual(self.key("0.5.0", "/missing/python3"), key)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""SourceEditor keeps edited modules isort-clean and sectioned."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from lazyapi.services import FileOperations
+from lazyapi.services.source_editor import SourceEditor
+
+MAIN = '''"""App."""
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from src.app.config import settings
+from src.app.shared.logger import configure_logging
+
+app = FastAPI()
+'''
+
+
+class SourceEditorImportTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "main.py"
+        self.editor = SourceEditor(FileOperations())
+
+    def render(self, source, *imports):
+        self.path.write_text(source)
+        for module, name in imports:
+            self.editor.add_import(self.path, module, name)
+        return self.editor.render()[self.path]
+
+    def test_import_joins_its_package_group_in_order(self):
+        source = self.render(
+            MAIN,
+            ("src.app.shared.jobs", "close_jobs"),
+            ("src.app.services.orders", "router"),
+        )
+        self.assertIn(
+            "from src.app.config import settings\n"
+            "from src.app.services.orders import router\n"
+            "from src.app.shared.jobs import close_jobs\n"
+            "from src.app.shared.logger import configure_logging\n\n"
+            "app = FastAPI()",
+            source,
+        )
+
+    def test_relative_imports_start_their_own_group(self):
+        source = self.render(
+            '"""Feature."""\n\nfrom fastapi import APIRouter\n\nrouter = APIRouter()\n',
+            (".routers.items", "router"),
+            (".routers.carts", "router"),
+        )
+        self.assertIn(
+            "from fastapi import APIRouter\n\n"
+            "from .routers.carts import router\n"
+            "from .routers.items import router\n\n"
+            "router = APIRouter()",
+            source,
+        )
+
+    def test_package_group_goes_before_relative_imports(self):
+        source = self.render(
+            "from fastapi import APIRouter\n\nfrom .models import Item\n",
+            ("src.app.shared.cache", "cached"),
+        )
+        self.assertEqual(
+            source,
+            "from fastapi import APIRouter\n\n"
+            "from src.app.shared.cache import cached\n\n"
+            "from .models import Item\n",
+        )
+
+    def test_imports_from_one_module_keep_queue_order(self):
+        source = self.render(
+            "import os\n",
+            ("src.app.shared.cache", "cached"),
+            ("src.app.shared.cache", "invalidate"),
+        )
+        self.assertEqual(
+            source,
+            "import os\n\n"
+            "from src.app.shared.cache import cached\n"
+            "from src.app.shared.cache import invalidate\n",
+        )
+
+
+class SourceEditorFieldTest(unittest.TestCase):
+    def test_comment_starts_a_new_section(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.py"
+            path.write_text(
+                "class Settings:\n    debug: bool = False\n\n\nsettings = Settings()\n"
+            )
+            editor = SourceEditor(FileOperations())
+            editor.add_field(
+                path, "Settings", "cache_url", "str", '""', comment="Cache"
+            )
+            editor.add_field(path, "Settings", "cache_ttl", "float", "60.0")
+            source = editor.render()[path]
+        self.assertEqual(
+            source,
+            "class Settings:\n"
+            "    debug: bool = False\n\n"
+            "    # Cache\n"
+            '    cache_url: str = ""\n'
+            "    cache_ttl: float = 60.0\n\n\n"
+            "settings = Settings()\n",
+        )
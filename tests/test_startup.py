@@ -0,0 +1,46 @@
+"""The CLI entry point stays light: commands load their modules on demand."""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from lazyapi.cli import STARTUP_FORBIDDEN
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _imported(*args: str) -> list:
+    """Run Python with ``-X importtime`` and return the imported module names."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+    )
+    # "import time: self [us] | cumulative | imported package"
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+
+class StartupTest(unittest.TestCase):
+    def test_commands_do_not_import_command_modules(self):
+        loaded = _imported("-c", "import lazyapi.commands")
+        self.assertIn("lazyapi.commands", loaded)
+        self.assertEqual(
+            [name for name in loaded if name.startswith(STARTUP_FORBIDDEN)], []
+        )
+
+    def test_version_does_not_import_typer(self):
+        loaded = _imported("-m", "lazyapi.cli", "--version")
+        self.assertNotIn("typer", loaded)
+        self.assertFalse([name for name in loaded if name.startswith("typer.")])
+
+
+if __name__ == "__main__":
+    unittest.main()
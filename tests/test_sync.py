@@ -0,0 +1,53 @@
+"""Sync restores generated files the user deleted only when forced."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from lazyapi.init_repo_setup.init_config import ProjectOptions
+from lazyapi.init_repo_setup.init_initializer import ProjectInitializer
+from lazyapi.init_repo_setup.init_scaled_structure import (
+    get_scaled_fastapi_structure,
+)
+from lazyapi.services import FileOperations, ShellExecutor
+from lazyapi.sync_project import ProjectSynchronizer
+
+DELETED = "src/app/main.py"
+
+
+class SyncDeletedFileTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project = Path(tmp.name) / "shop"
+        self.file_ops = FileOperations()
+        structure = get_scaled_fastapi_structure(ProjectOptions())
+        staged = ProjectInitializer(self.file_ops, ShellExecutor(), structure).render(
+            self.project, "shop"
+        )
+        staged.flush(self.file_ops, self.project, self.project)
+        (self.project / DELETED).unlink()
+        self.synchronizer = ProjectSynchronizer(
+            self.file_ops, ShellExecutor(), self.project
+        )
+
+    def action(self, plan, path):
+        return next(item for item in plan.actions if item.path == path)
+
+    def test_deleted_file_is_reported(self):
+        plan = self.synchronizer.plan()
+        self.assertEqual(self.action(plan, DELETED).action, "skip")
+        self.assertNotIn(self.project / DELETED, plan.writes)
+        self.assertEqual(plan.count("unchanged"), len(plan.actions) - 1)
+
+    def test_force_recreates_deleted_file(self):
+        plan = self.synchronizer.plan(force=True)
+        self.assertEqual(self.action(plan, DELETED).action, "create")
+        self.synchronizer.apply(plan)
+        self.assertTrue((self.project / DELETED).exists())
+        self.assertEqual(plan.count("unchanged"), len(plan.actions) - 1)
+        self.assertEqual(self.synchronizer.plan().count("unchanged"), len(plan.actions))
+
+
+if __name__ == "__main__":
+    unittest.main()
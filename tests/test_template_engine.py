@@ -0,0 +1,46 @@
+"""Lookup errors carry their line; raw blocks are copied unchanged."""
+
+import unittest
+
+from lazyapi.shared.exceptions import TemplateError
+from lazyapi.shared.template_engine import render_template
+
+
+class UndefinedLookupTest(unittest.TestCase):
+    def assertFailsOnLine(self, source, context, line):
+        with self.assertRaises(TemplateError) as caught:
+            render_template(source, context)
+        self.assertTrue(str(caught.exception).startswith(f"Line {line}:"))
+
+    def test_undefined_variable(self):
+        self.assertFailsOnLine("a\n{{ y }}", {}, 2)
+
+    def test_missing_key(self):
+        self.assertFailsOnLine("{{ x.y }}", {"x": {}}, 1)
+
+    def test_missing_attribute(self):
+        self.assertFailsOnLine("a\n\n{% if x.y %}b{% endif %}", {"x": 1}, 3)
+
+    def test_missing_attribute_of_loop_variable(self):
+        source = "{% for i in items %}\n{{ i.name }}\n{% endfor %}"
+        self.assertFailsOnLine(source, {"items": [{}]}, 2)
+
+
+class RawBlockTest(unittest.TestCase):
+    def test_raw_block_is_copied(self):
+        source = "a {{ x }}\n{% raw %}\n{{ y }} {% if %}\n{% endraw %}\nb\n"
+        self.assertEqual(
+            render_template(source, {"x": 1}), "a 1\n{{ y }} {% if %}\nb\n"
+        )
+
+    def test_inline_raw_block(self):
+        source = "q{% raw %}{{ z }}{% endraw %}w"
+        self.assertEqual(render_template(source, {}), "q{{ z }}w")
+
+    def test_unclosed_raw_block(self):
+        with self.assertRaises(TemplateError):
+            render_template("a\n{% raw %}{{ z }}", {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Template packs cannot write outside the project directory."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from lazyapi.shared.exceptions import TemplateError
+from lazyapi.shared.template_pack import (
+    MANIFEST_ENTRY,
+    TemplatePack,
+    _write_pack,
+    build_template_pack,
+)
+
+UNSAFE = ["../evil.py", "/etc/evil.py", "src/../../evil.py", "C:/evil.py"]
+
+
+class PackPathTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def test_build_rejects_escaping_paths(self):
+        for path in UNSAFE:
+            with self.subTest(path=path):
+                (self.root / "manifest.toml").write_text(
+                    f"[[layouts.service.files]]\npath = {json.dumps(path)}\n"
+                )
+                with self.assertRaises(TemplateError):
+                    build_template_pack(self.root, self.root / "out.lzpk")
+
+    def test_open_rejects_escaping_paths(self):
+        for path in UNSAFE:
+            with self.subTest(path=path):
+                manifest = {"layouts": {"service": {"directories": [path]}}}
+                output = self.root / "pack.lzpk"
+                _write_pack({MANIFEST_ENTRY: json.dumps(manifest).encode()}, output)
+                with TemplatePack(output) as pack:
+                    with self.assertRaises(TemplateError):
+                        pack.layouts()
+
+    def test_relative_paths_are_accepted(self):
+        (self.root / "manifest.toml").write_text(
+            '[layouts.service]\ndirectories = ["src/app"]\n'
+            '[[layouts.service.files]]\npath = "src/app/main.py"\n'
+        )
+        build_template_pack(self.root, self.root / "out.lzpk")
+        with TemplatePack(self.root / "out.lzpk") as pack:
+            self.assertEqual(pack.layouts(), ["service"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Timeout errors name the limit that stopped the command."""
+
+import os
+import sys
+import unittest
+
+from lazyapi.services import AsyncShellExecutor
+from lazyapi.shared.exceptions import CommandExecutionError
+
+SLEEP = [sys.executable, "-c", "import time; time.sleep(5)"]
+
+
+@unittest.skipUnless(os.name == "posix", "process groups are POSIX only")
+class TimeoutMessageTest(unittest.TestCase):
+    def message(self, executor):
+        with self.assertRaises(CommandExecutionError) as caught:
+            executor.execute(SLEEP)
+        return str(caught.exception)
+
+    def test_command_timeout(self):
+        message = self.message(AsyncShellExecutor(timeout=0.25, total_timeout=30))
+        self.assertIn("timed out after 0.25s", message)
+
+    def test_total_timeout(self):
+        executor = AsyncShellExecutor(timeout=30, total_timeout=0.5)
+        self.assertIn("total timeout of 0.5s exceeded", self.message(executor))
+        self.assertIn("not started: total timeout of 0.5s", self.message(executor))